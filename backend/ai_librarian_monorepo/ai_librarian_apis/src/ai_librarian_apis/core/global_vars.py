@@ -1,9 +1,36 @@
+from ai_librarian_apis.core.settings import settings
 from ai_librarian_core.agents.react.asynchronous import AsyncReactAgent
 from ai_librarian_core.agents.react.asynchronous_emotion import AsyncReactEmotionAgent
+from ai_librarian_core.tools.registry import ToolRegistry
 from ai_librarian_core.tools.tools import get_built_in_tools
+from ai_librarian_core.tools.truncation import ToolOutputLimits
+from ai_librarian_core.utils.chat_models import ChatModelCache
 
 # TODO(youkwan): remove global variables, temporarily set these as global variables for docs generation purposes.
 # Should move these variables to lifespan and replace with state later.
-tools = get_built_in_tools()
-react_agent = AsyncReactAgent(tools=tools)
-react_emotion_agent = AsyncReactEmotionAgent(tools=tools)
+tool_registry = ToolRegistry(
+    get_built_in_tools(
+        ncl_search_engine=settings.ncl_search_engine,
+        ncl_enrich_top_k=settings.ncl_enrich_top_k,
+        google_books_max_description_chars=settings.google_books_max_description_chars,
+        cache_policies=None if settings.tool_cache_enabled else {},
+    )
+)
+tools = tool_registry.tools
+tool_output_limits = ToolOutputLimits(
+    default_max_chars=settings.tool_output_max_chars, max_chars=settings.tool_output_limits
+)
+# Shared by the agents, which have the same tools, so they share the chat models and their connection pools.
+llm_cache = ChatModelCache(max_entries=settings.llm_cache_max_entries)
+react_agent = AsyncReactAgent(
+    tools=tools,
+    tool_output_limits=tool_output_limits,
+    hide_unavailable_tools=settings.tool_breaker_hide_tools,
+    llm_cache=llm_cache,
+)
+react_emotion_agent = AsyncReactEmotionAgent(
+    tools=tools,
+    tool_output_limits=tool_output_limits,
+    hide_unavailable_tools=settings.tool_breaker_hide_tools,
+    llm_cache=llm_cache,
+)
@@ -1,15 +1,138 @@
+import asyncio
 from contextlib import asynccontextmanager
 
-from ai_librarian_apis.core.logger import setup_logging
+from ai_librarian_apis.core.global_vars import llm_cache, react_agent, react_emotion_agent, tool_registry
+from ai_librarian_apis.core.logger import logger, setup_logging
 from ai_librarian_apis.core.openapi import custom_openapi
+from ai_librarian_apis.core.settings import settings
+from ai_librarian_apis.utils.tool_catalog import get_tool_catalog
 
 # from ai_librarian_core.tools.tools import get_built_in_tools
+from ai_librarian_core.agents.react.base import ReactAgentError
+from ai_librarian_core.models.llm_config import LLMConfig, Model
+from ai_librarian_core.tools.health import ToolHealth, set_tool_health
+from ai_librarian_core.tools.lazy import load_tools
+from ai_librarian_core.tools.scheduler import ToolScheduler, set_tool_scheduler
+from ai_librarian_core.utils.cache import TTLCache
+from ai_librarian_core.utils.http import aclose_async_clients
+from ai_librarian_core.wrapper.browser_pool import AsyncBrowserPool, set_browser_pool
+from ai_librarian_core.wrapper.google_books import set_google_books_cache
+from ai_librarian_core.wrapper.ncl_search import (
+    AsyncNCLSearch,
+    NCLSearchEngine,
+    set_ncl_record_cache,
+    set_ncl_result_cache,
+    set_ncl_session_pool,
+)
+from ai_librarian_core.wrapper.ncl_session import NCLSessionPool
 from fastapi import FastAPI
 
 
+async def _awarm_up_chat_models(models: list[Model]) -> None:
+    try:
+        # The agents share their chat models, warming up one agent warms up both.
+        await react_agent.awarm_up([LLMConfig(model=model) for model in models])
+    except ReactAgentError as e:
+        logger.warning(f"Failed to warm up the chat models: {e}")
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     setup_logging()
     custom_openapi(app)
     # app.state.tools = get_built_in_tools()
+    get_tool_catalog(tool_registry)
+    # Compile the workflows and render their flowcharts before the first request rather than on it.
+    for agent in (react_agent, react_emotion_agent):
+        agent.plot()
+    tool_scheduler = ToolScheduler(
+        default_max_concurrency=settings.tool_max_concurrency, max_concurrency=settings.tool_concurrency_limits
+    )
+    set_tool_scheduler(tool_scheduler)
+    set_tool_health(
+        ToolHealth(
+            enabled=settings.tool_breaker_enabled,
+            failure_rate_threshold=settings.tool_breaker_failure_rate,
+            min_calls=settings.tool_breaker_min_calls,
+            window_seconds=settings.tool_breaker_window,
+            open_seconds=settings.tool_breaker_open_seconds,
+            slow_call_seconds=settings.tool_breaker_slow_call_seconds,
+            slow_call_limits=settings.tool_breaker_slow_call_limits,
+        )
+    )
+    browser_pool = AsyncBrowserPool(
+        num_browsers=settings.ncl_browser_pool_size,
+        contexts_per_browser=settings.ncl_browser_pool_contexts,
+        max_uses_per_browser=settings.ncl_browser_max_uses,
+    )
+    set_browser_pool(browser_pool)
+    # The HTTP engine only needs a browser as a fallback, so its pool starts on first use.
+    if settings.ncl_search_engine == NCLSearchEngine.PLAYWRIGHT:
+        from playwright.async_api import Error as PlaywrightError
+
+        try:
+            await browser_pool.start()
+        except PlaywrightError as e:
+            # Chromium is optional, the pool retries on the first NCL query.
+            logger.warning(f"Failed to start the NCL browser pool: {e}")
+
+    session_pool = NCLSessionPool(
+        factory=AsyncNCLSearch(engine=settings.ncl_search_engine).anew_session_id,
+        size=settings.ncl_session_pool_size,
+        ttl=settings.ncl_session_ttl,
+    )
+    set_ncl_session_pool(session_pool)
+    session_pool.start()
+
+    result_cache = None
+    record_cache = None
+    if settings.ncl_cache_enabled:
+        result_cache = TTLCache(
+            ttl=settings.ncl_cache_ttl,
+            stale_ttl=settings.ncl_cache_stale_ttl,
+            negative_ttl=settings.ncl_cache_negative_ttl,
+            max_entries=settings.ncl_cache_max_entries,
+            path=settings.ncl_cache_path,
+            namespace="ncl_search",
+        )
+        record_cache = TTLCache(
+            ttl=settings.ncl_record_cache_ttl,
+            stale_ttl=settings.ncl_cache_stale_ttl,
+            max_entries=settings.ncl_cache_max_entries,
+            path=settings.ncl_cache_path,
+            namespace="ncl_records",
+        )
+    set_ncl_result_cache(result_cache)
+    set_ncl_record_cache(record_cache)
+
+    google_books_cache = None
+    if settings.google_books_cache_enabled:
+        # Expired entries stay on disk for `stale_ttl` so they can be revalidated with their ETag.
+        google_books_cache = TTLCache(
+            ttl=settings.google_books_cache_ttl,
+            stale_ttl=settings.google_books_cache_stale_ttl,
+            max_entries=settings.google_books_cache_max_entries,
+            path=settings.google_books_cache_path,
+            namespace="google_books",
+        )
+    set_google_books_cache(google_books_cache)
+
+    preload_task = None
+    if settings.tool_preload:
+        # The server takes requests meanwhile, a tool called before it is loaded loads on the call.
+        preload_task = asyncio.create_task(asyncio.to_thread(load_tools, tool_registry.tools))
+    warm_up_task = None
+    if settings.llm_warm_up_models:
+        warm_up_task = asyncio.create_task(_awarm_up_chat_models(settings.llm_warm_up_models))
     yield
+    for task in (preload_task, warm_up_task):
+        if task is not None:
+            task.cancel()
+    await llm_cache.aclose()
+    await session_pool.close()
+    await browser_pool.close()
+    await aclose_async_clients()
+    tool_scheduler.shutdown()
+    for cache in (result_cache, record_cache, google_books_cache):
+        if cache is not None:
+            cache.close()
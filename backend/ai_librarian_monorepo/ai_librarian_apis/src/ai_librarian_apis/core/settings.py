@@ -1,6 +1,11 @@
 from pathlib import Path
 from typing import Literal, Self
 
+from ai_librarian_core.models.llm_config import Model
+from ai_librarian_core.tools.health import DEFAULT_TOOL_SLOW_CALL_SECONDS
+from ai_librarian_core.tools.scheduler import DEFAULT_TOOL_CONCURRENCY_LIMITS
+from ai_librarian_core.tools.truncation import DEFAULT_TOOL_OUTPUT_LIMITS
+from ai_librarian_core.wrapper.ncl_engine import NCLSearchEngine
 from pydantic import Field, model_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
@@ -20,6 +25,8 @@ class Settings(BaseSettings):
     host: str = "0.0.0.0"
     port: int = 8000
     allowed_origins: list[str] | None = Field(default_factory=list)
+    # The /v1/admin routes can flush every tool cache, only expose them to trusted clients.
+    enable_admin_routes: bool = False
 
     # LLM API keys
     openai_api_key: str | None = None
@@ -40,6 +47,55 @@ class Settings(BaseSettings):
     google_cse_id: str | None = None
     openweathermap_api_key: str | None = None
 
+    # Agent settings
+    agent_time_budget: float | None = Field(default=120, gt=0)
+    llm_cache_max_entries: int = Field(default=32, ge=1)
+    llm_warm_up_models: list[Model] = Field(default_factory=list)
+
+    # Tools settings
+    tool_cache_enabled: bool = True
+    tool_preload: bool = True
+    tool_max_concurrency: int = Field(default=8, ge=1)
+    tool_concurrency_limits: dict[str, int] = Field(default_factory=lambda: dict(DEFAULT_TOOL_CONCURRENCY_LIMITS))
+    tool_output_max_chars: int | None = Field(default=4000, ge=1)
+    tool_output_limits: dict[str, int] = Field(default_factory=lambda: dict(DEFAULT_TOOL_OUTPUT_LIMITS))
+    tool_breaker_enabled: bool = True
+    tool_breaker_failure_rate: float = Field(default=0.5, gt=0, le=1)
+    tool_breaker_min_calls: int = Field(default=5, ge=1)
+    tool_breaker_window: float = Field(default=60, gt=0)
+    tool_breaker_open_seconds: float = Field(default=30, gt=0)
+    tool_breaker_slow_call_seconds: float | None = Field(default=None, gt=0)
+    tool_breaker_slow_call_limits: dict[str, float | None] = Field(
+        default_factory=lambda: dict(DEFAULT_TOOL_SLOW_CALL_SECONDS)
+    )
+    tool_breaker_hide_tools: bool = True
+    tool_batch_max_runs: int = Field(default=1000, ge=1)
+    tool_batch_max_concurrency: int = Field(default=32, ge=1)
+
+    # NCL crawler settings
+    ncl_search_engine: NCLSearchEngine = NCLSearchEngine.HTTP
+    ncl_browser_pool_size: int = Field(default=2, ge=1)
+    ncl_browser_pool_contexts: int = Field(default=4, ge=1)
+    ncl_browser_max_uses: int = Field(default=200, ge=1)
+    ncl_session_pool_size: int = Field(default=4, ge=0)
+    ncl_session_ttl: float = Field(default=600, gt=0)
+    ncl_enrich_top_k: int = Field(default=3, ge=0, le=20)
+    ncl_cache_enabled: bool = True
+    ncl_cache_ttl: float = Field(default=3600, ge=0)
+    ncl_cache_stale_ttl: float = Field(default=86400, ge=0)
+    ncl_cache_negative_ttl: float = Field(default=300, ge=0)
+    ncl_cache_max_entries: int = Field(default=1024, ge=1)
+    ncl_record_cache_ttl: float = Field(default=604800, ge=0)
+    ncl_cache_path: Path | None = PROJECT_ROOT_DIR / "cache" / "ncl_search.sqlite3"
+
+    # Google Books settings
+    google_books_max_description_chars: int | None = Field(default=600, ge=1)
+    google_books_cache_enabled: bool = True
+    google_books_cache_ttl: float = Field(default=86400, ge=0)
+    google_books_cache_stale_ttl: float = Field(default=604800, ge=0)
+    google_books_cache_max_entries: int = Field(default=1024, ge=1)
+    google_books_cache_path: Path | None = PROJECT_ROOT_DIR / "cache" / "google_books.sqlite3"
+
     @model_validator(mode="after")
     def validate_at_least_one_llm__key(self) -> Self:
         if all(
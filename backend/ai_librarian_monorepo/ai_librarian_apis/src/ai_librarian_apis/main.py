@@ -7,6 +7,7 @@ from fastapi import FastAPI
 from ai_librarian_apis.core.cors import setup_cors
 from ai_librarian_apis.core.lifespan import lifespan
 from ai_librarian_apis.core.settings import settings
+from ai_librarian_apis.routes.admin import admin_router
 from ai_librarian_apis.routes.react import react_emotion_router, react_router
 from ai_librarian_apis.routes.system import system_router
 from ai_librarian_apis.routes.tools import tools_router
@@ -22,6 +23,8 @@ def create_app() -> FastAPI:
     app.include_router(tools_router, prefix="/v1")
     app.include_router(react_router, prefix="/v1")
     app.include_router(react_emotion_router, prefix="/v2")
+    if settings.enable_admin_routes:
+        app.include_router(admin_router, prefix="/v1")
     return app
 
 
@@ -0,0 +1,44 @@
+from ai_librarian_apis.schemas.admin import ToolCacheFlushResponse, ToolCacheStatsResponse
+from ai_librarian_apis.schemas.error import ErrorResponse
+from ai_librarian_apis.utils.deps import get_tools
+from ai_librarian_core.tools.cached import CachedTool
+from fastapi import APIRouter, Depends, HTTPException
+from langchain_core.tools import BaseTool
+
+admin_router = APIRouter(prefix="/admin", tags=["Admin"])
+
+
+def _cached_tools(tools: list[BaseTool]) -> dict[str, CachedTool]:
+    return {tool.name: tool for tool in tools if isinstance(tool, CachedTool)}
+
+
+@admin_router.get(
+    "/tool-cache",
+    description="Reports the hit rates and sizes of the result caches of the tools, shared by all the agents.",
+    summary="Tool Cache Statistics",
+    responses={500: {"model": ErrorResponse}},
+)
+def get_tool_cache_stats(tools: list[BaseTool] = Depends(get_tools)) -> ToolCacheStatsResponse:
+    return ToolCacheStatsResponse(tools={name: tool.cache.stats() for name, tool in _cached_tools(tools).items()})
+
+
+@admin_router.delete(
+    "/tool-cache",
+    description="Flushes the result cache of the given tool, or of every tool if no tool name is given.",
+    summary="Flush Tool Cache",
+    responses={
+        404: {"model": ErrorResponse, "description": "Cached tool not found."},
+        500: {"model": ErrorResponse},
+    },
+)
+def flush_tool_cache(
+    tool_name: str | None = None, tools: list[BaseTool] = Depends(get_tools)
+) -> ToolCacheFlushResponse:
+    cached_tools = _cached_tools(tools)
+    if tool_name is not None:
+        if tool_name not in cached_tools:
+            raise HTTPException(404, f"Cached tool {tool_name} not found")
+        cached_tools = {tool_name: cached_tools[tool_name]}
+    for tool in cached_tools.values():
+        tool.cache.clear()
+    return ToolCacheFlushResponse(flushed=list(cached_tools))
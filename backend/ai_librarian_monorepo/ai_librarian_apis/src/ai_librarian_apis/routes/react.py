@@ -2,6 +2,7 @@ from typing import Any
 
 from ai_librarian_apis.core.global_vars import react_agent, react_emotion_agent
 from ai_librarian_apis.core.logger import logger
+from ai_librarian_apis.core.settings import settings
 from ai_librarian_apis.schemas.error import ErrorResponse
 from ai_librarian_apis.schemas.react import (
     AgentEmotionResponse,
@@ -16,6 +17,7 @@ from ai_librarian_apis.utils.sse_example import get_sse_response_example
 from ai_librarian_core.agents.react.state import Emotion
 from ai_librarian_core.models.llm_config import Model
 from ai_librarian_core.models.used_tool import UsedTool
+from ai_librarian_core.tools.truncation import get_full_content
 from fastapi import APIRouter, Request
 from fastapi.responses import StreamingResponse
 from langchain_core.messages import AIMessage, ToolMessage
@@ -24,6 +26,16 @@ react_router = APIRouter(prefix="/react", tags=["ReAct Agent"])
 react_emotion_router = APIRouter(prefix="/react", tags=["ReAct Agent With Emotion"])
 
 
+def _get_time_budget(agent_request: AgentRequest) -> float | None:
+    """Returns the time budget of the request, capped by the server default."""
+    time_budgets = [
+        time_budget
+        for time_budget in (agent_request.time_budget, settings.agent_time_budget)
+        if time_budget is not None
+    ]
+    return min(time_budgets, default=None)
+
+
 @react_router.get(
     "/models",
     description=(
@@ -63,6 +75,7 @@ async def run_react_agent(request: AgentRequest) -> AgentResponse:
         request.get_langchain_messages(),
         thread_id=request.thread_id,
         llm_config=request.llm_config,
+        time_budget=_get_time_budget(request),
     )
     return AgentResponse(
         thread_id=request.thread_id,
@@ -88,6 +101,7 @@ async def run_react_emotion_agent(request: AgentRequest) -> AgentEmotionResponse
         request.get_langchain_messages(),
         thread_id=request.thread_id,
         llm_config=request.llm_config,
+        time_budget=_get_time_budget(request),
     )
     return AgentEmotionResponse(
         thread_id=request.thread_id,
@@ -102,7 +116,9 @@ def _process_tool_message(message: ToolMessage, thread_id: str, llm_config: dict
     return SSEEvent(
         event=EventPayload.TOOL_OUTPUT,
         data=ToolPayload(
-            thread_id=thread_id, llm_config=llm_config, used_tools=UsedTool(name=message.name, output=message.content)
+            thread_id=thread_id,
+            llm_config=llm_config,
+            used_tools=UsedTool(name=message.name, output=get_full_content(message)),
         ),
     ).to_sse_format()
 
@@ -189,6 +205,7 @@ async def stream_react_agent(agent_request: AgentRequest, request: Request):
             agent_request.get_langchain_messages(),
             thread_id=agent_request.thread_id,
             llm_config=agent_request.llm_config,
+            time_budget=_get_time_budget(agent_request),
         )
         async for chunk in stream:
             if await request.is_disconnected():
@@ -250,6 +267,7 @@ async def stream_react_emotion_agent(agent_request: AgentRequest, request: Reque
             agent_request.get_langchain_messages(),
             thread_id=agent_request.thread_id,
             llm_config=agent_request.llm_config,
+            time_budget=_get_time_budget(agent_request),
         )
         async for chunk in stream:
             if await request.is_disconnected():
@@ -1,4 +1,12 @@
-from ai_librarian_apis.schemas.system import HealthResponse
+from ai_librarian_apis.core.global_vars import llm_cache, tool_registry
+from ai_librarian_apis.schemas.system import HealthResponse, StatusResponse
+from ai_librarian_core.tools.coalesced import get_tool_call_flights
+from ai_librarian_core.tools.health import get_tool_health
+from ai_librarian_core.tools.lazy import get_load_seconds
+from ai_librarian_core.tools.scheduler import get_tool_scheduler
+from ai_librarian_core.wrapper.browser_pool import get_browser_pool
+from ai_librarian_core.wrapper.google_books import get_google_books_cache
+from ai_librarian_core.wrapper.ncl_search import get_ncl_record_cache, get_ncl_result_cache, get_ncl_session_pool
 from fastapi import APIRouter
 
 system_router = APIRouter(tags=["System"])
@@ -12,3 +20,27 @@ system_router = APIRouter(tags=["System"])
 )
 def check_health() -> HealthResponse:
     return HealthResponse()
+
+
+@system_router.get(
+    "/status",
+    description="Reports the runtime statistics of the shared resources behind the tools, such as pools and caches.",
+    summary="Runtime Status",
+    responses={500: {}},
+)
+def get_status() -> StatusResponse:
+    result_cache = get_ncl_result_cache()
+    record_cache = get_ncl_record_cache()
+    google_books_cache = get_google_books_cache()
+    return StatusResponse(
+        tool_load_seconds=get_load_seconds(tool_registry.tools),
+        tool_calls=get_tool_call_flights().stats(),
+        tool_scheduler=get_tool_scheduler().stats(),
+        tool_health=get_tool_health().stats(),
+        llm_cache=llm_cache.stats(),
+        ncl_browser_pool=get_browser_pool().stats(),
+        ncl_session_pool=get_ncl_session_pool().stats(),
+        ncl_result_cache=result_cache.stats() if result_cache is not None else None,
+        ncl_record_cache=record_cache.stats() if record_cache is not None else None,
+        google_books_cache=google_books_cache.stats() if google_books_cache is not None else None,
+    )
@@ -1,9 +1,24 @@
+import asyncio
+import time
+from collections.abc import AsyncIterator
+
 from ai_librarian_apis.core.logger import logger
+from ai_librarian_apis.core.settings import settings
 from ai_librarian_apis.schemas.error import ErrorResponse
-from ai_librarian_apis.schemas.tools import ToolArg, ToolInfo, ToolListResponse, ToolRunRequest, ToolRunResponse
-from ai_librarian_apis.utils.deps import get_tools
-from fastapi import APIRouter, Depends, HTTPException
-from langchain_core.tools import BaseTool
+from ai_librarian_apis.schemas.tools import (
+    ToolBatchRequest,
+    ToolBatchResult,
+    ToolListResponse,
+    ToolRunRequest,
+    ToolRunResponse,
+)
+from ai_librarian_apis.utils.deps import get_catalog, get_registry
+from ai_librarian_apis.utils.tool_catalog import ToolCatalog
+from ai_librarian_core.tools.health import ToolUnavailableError
+from ai_librarian_core.tools.registry import ToolNotFoundError, ToolRegistry
+from fastapi import APIRouter, Depends, Header, HTTPException, Response
+from fastapi.responses import StreamingResponse
+from pydantic import ValidationError
 
 tools_router = APIRouter(prefix="/tools", tags=["Tools"])
 
@@ -12,65 +27,150 @@ tools_router = APIRouter(prefix="/tools", tags=["Tools"])
     "",
     description=(
         "Provides a list of tools that the agent can potentially use during "
-        "its execution to perform actions or retrieve information."
+        "its execution to perform actions or retrieve information. "
+        "The list comes with an ETag, send it back in `If-None-Match` to get a 304 while the list has not changed."
     ),
     summary="List Tools",
-    responses={500: {"model": ErrorResponse}},
+    response_model=ToolListResponse,
+    responses={304: {"description": "The list of tools has not changed."}, 500: {"model": ErrorResponse}},
 )
-def list_tools(tools: list[BaseTool] = Depends(get_tools)) -> ToolListResponse:
-    try:
-        tools_info = []
-        for tool in tools:
-            args_list = []
-            if tool.args_schema:
-                json_schema = tool.args_schema.model_json_schema()
-                properties = json_schema.get("properties", {})
-                required_args = json_schema.get("required", [])
-
-                for arg_name, arg_details in properties.items():
-                    args_list.append(
-                        ToolArg(
-                            arg=arg_name,
-                            type=arg_details.get("type", "string"),  # Default to 'string' if type is not specified
-                            description=arg_details.get("description"),
-                            required=arg_name in required_args,
-                        )
-                    )
-
-            tools_info.append(
-                ToolInfo(
-                    name=tool.name,
-                    description=tool.description,
-                    args_schema=args_list,
-                )
-            )
-        return ToolListResponse(tools=tools_info)
-    except Exception as e:
-        logger.error(f"Error listing tools: {e}")
-        raise HTTPException(500, f"Error listing tools: {e}")
+def list_tools(
+    if_none_match: str | None = Header(default=None), catalog: ToolCatalog = Depends(get_catalog)
+) -> Response:
+    headers = {"ETag": catalog.etag, "Cache-Control": "no-cache"}
+    if catalog.matches(if_none_match):
+        return Response(status_code=304, headers=headers)
+    return Response(content=catalog.body, media_type="application/json", headers=headers)
 
 
 @tools_router.post(
     "/run",
-    description="Runs a tool with the given name and input(s).",
+    description=(
+        "Runs a tool with the given name and input(s). "
+        "Identical concurrent runs, including the tool calls of the agents, share a single call of the tool."
+    ),
     summary="Run Tool",
     responses={
         404: {"model": ErrorResponse, "description": "Tool not found."},
+        422: {"model": ErrorResponse, "description": "Invalid arguments for the tool."},
         500: {"model": ErrorResponse},
+        503: {"model": ErrorResponse, "description": "The tool keeps failing, its circuit breaker is open."},
     },
 )
-async def run_tool(request: ToolRunRequest, tools: list[BaseTool] = Depends(get_tools)) -> ToolRunResponse:
+async def run_tool(request: ToolRunRequest, registry: ToolRegistry = Depends(get_registry)) -> ToolRunResponse:
+    return ToolRunResponse(tool_name=request.tool_name, args=request.args, output=await _arun_tool(request, registry))
+
+
+async def _arun_tool(request: ToolRunRequest, registry: ToolRegistry) -> str:
+    """Runs the tool of `request`, failures are raised as `HTTPException`s."""
+    tool_input_dict = {arg.name: arg.value for arg in request.args}
+    try:
+        selected_tool = registry.get_coalesced(request.tool_name)
+        registry.validate_args(request.tool_name, tool_input_dict)
+    except ToolNotFoundError:
+        raise HTTPException(404, f"Tool {request.tool_name} not found")
+    except ValidationError as e:
+        raise HTTPException(422, f"Invalid arguments for the tool {request.tool_name}: {e}")
     try:
-        selected_tool = next((tool for tool in tools if tool.name == request.tool_name), None)
-        if not selected_tool:
-            raise HTTPException(404, f"Tool {request.tool_name} not found")
-        tool_input = request.args
-        tool_input_dict = {arg.name: arg.value for arg in tool_input}
-        return ToolRunResponse(
+        return await selected_tool.ainvoke(tool_input_dict)
+    except ToolUnavailableError as e:
+        raise HTTPException(503, str(e))
+    except Exception as e:
+        logger.error(f"Error running tool: {e}")
+        raise HTTPException(500, f"Error running tool: {e}")
+
+
+async def _arun_batch_item(index: int, request: ToolRunRequest, registry: ToolRegistry) -> ToolBatchResult:
+    """Runs the tool of `request`, failures are reported in the result so the other runs of the batch go on."""
+    started_at = time.perf_counter()
+    try:
+        return ToolBatchResult(
+            index=index,
             tool_name=request.tool_name,
-            args=request.args,
-            output=await selected_tool.ainvoke(tool_input_dict),
+            status_code=200,
+            output=await _arun_tool(request, registry),
+            elapsed_seconds=time.perf_counter() - started_at,
         )
+    except HTTPException as e:
+        status_code, error = e.status_code, e.detail
     except Exception as e:
         logger.error(f"Error running tool: {e}")
-        raise HTTPException(500, f"Error running tool: {e}")
+        status_code, error = 500, f"Error running tool: {e}"
+    return ToolBatchResult(
+        index=index,
+        tool_name=request.tool_name,
+        status_code=status_code,
+        error=error,
+        elapsed_seconds=time.perf_counter() - started_at,
+    )
+
+
+async def _arun_batch(
+    runs: list[ToolRunRequest], registry: ToolRegistry, max_concurrency: int
+) -> AsyncIterator[ToolBatchResult]:
+    """Runs `runs` with at most `max_concurrency` at a time, and yields their results in order of completion.
+
+    The calls of each tool are further bounded by the tool scheduler, as for the agents. The pending runs are cancelled
+    when the iteration stops, e.g. when the client disconnects.
+    """
+    results: asyncio.Queue[ToolBatchResult] = asyncio.Queue()
+    pending = iter(enumerate(runs))
+
+    async def work():
+        # The workers share `pending`, each takes the next run once it is done with the previous one.
+        for index, request in pending:
+            await results.put(await _arun_batch_item(index, request, registry))
+
+    workers = [asyncio.create_task(work()) for _ in range(min(max_concurrency, len(runs)))]
+    try:
+        for _ in runs:
+            yield await results.get()
+    finally:
+        for worker in workers:
+            worker.cancel()
+
+
+@tools_router.post(
+    "/batch",
+    description=(
+        "Runs many tools concurrently and streams their results as they complete, in order of completion. "
+        "Each line of the response is a `ToolBatchResult` in JSON (NDJSON), with the status code, output or error, "
+        "and duration of the run. Send `Accept: text/event-stream` to get server-sent events instead. "
+        "Failed runs are reported in their result and do not stop the batch."
+    ),
+    summary="Run Tools in Batch",
+    responses={
+        200: {
+            "content": {
+                "application/x-ndjson": {"schema": ToolBatchResult.model_json_schema()},
+                "text/event-stream": {
+                    "schema": {"type": "string", "description": "A `tool_result` event per run, in JSON."}
+                },
+            },
+            "description": "Stream the result of each run as soon as it completes.",
+        },
+        413: {"model": ErrorResponse, "description": "Too many runs in the batch."},
+        500: {"model": ErrorResponse},
+    },
+)
+async def run_tool_batch(
+    batch: ToolBatchRequest,
+    accept: str | None = Header(default=None),
+    registry: ToolRegistry = Depends(get_registry),
+) -> StreamingResponse:
+    if len(batch.runs) > settings.tool_batch_max_runs:
+        raise HTTPException(413, f"A batch has at most {settings.tool_batch_max_runs} runs, got {len(batch.runs)}")
+    is_sse = accept is not None and "text/event-stream" in accept
+
+    async def stream_results():
+        async for result in _arun_batch(batch.runs, registry, settings.tool_batch_max_concurrency):
+            if is_sse:
+                yield f"event: tool_result\ndata: {result.model_dump_json()}\n\n"
+            else:
+                yield f"{result.model_dump_json()}\n"
+
+    return StreamingResponse(
+        stream_results(),
+        media_type="text/event-stream" if is_sse else "application/x-ndjson",
+        headers={"Cache-Control": "no-cache"},
+    )
@@ -0,0 +1,33 @@
+from pydantic import BaseModel, Field
+
+
+class ToolCacheStatsResponse(BaseModel):
+    """Tool cache statistics response schema. Returns the statistics of the result cache of each cached tool.
+    Used for tuning the cache policies of the tools.
+    """
+
+    tools: dict[str, dict[str, int | float]] = Field(
+        description=(
+            "The statistics of the result cache of each cached tool, by tool name. "
+            "Tools without a cache policy are not listed."
+        ),
+        examples=[
+            {
+                "wikipedia": {
+                    "entries": 42,
+                    "hits": 30,
+                    "stale_hits": 0,
+                    "revalidations": 0,
+                    "misses": 42,
+                    "evictions": 0,
+                    "hit_rate": 0.42,
+                }
+            }
+        ],
+    )
+
+
+class ToolCacheFlushResponse(BaseModel):
+    """Tool cache flush response schema. Returns the names of the tools whose result cache was flushed."""
+
+    flushed: list[str] = Field(description="The names of the flushed tools.", examples=[["wikipedia"]])
@@ -134,6 +134,17 @@ class AgentRequest(BaseModel):
         ),
     )
 
+    time_budget: float | None = Field(
+        default=None,
+        gt=0,
+        examples=[30],
+        description=(
+            "Seconds the Agent may take to answer, capped by the server default. "
+            "Tool calls and LLM calls still running when it runs out are cut off, "
+            "and the Agent answers with what it has gathered so far."
+        ),
+    )
+
     def get_langchain_messages(self) -> list[BaseMessage]:
         langchain_messages = []
         for openai_message in self.messages:
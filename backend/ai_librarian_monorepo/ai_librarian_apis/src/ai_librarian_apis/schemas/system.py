@@ -1,3 +1,5 @@
+from typing import Any
+
 from pydantic import BaseModel, Field
 
 
@@ -11,3 +13,144 @@ class HealthResponse(BaseModel):
         description="API operational status indicator. Returns 'ok' when the system is functioning properly.",
         examples=["ok"],
     )
+
+
+class StatusResponse(BaseModel):
+    """Runtime status response schema. Returns the statistics of the shared resources behind the tools.
+    Used for monitoring pool usage and cache efficiency.
+    """
+
+    tool_load_seconds: dict[str, float | None] = Field(
+        description=(
+            "Seconds taken to import and create each tool that is loaded on first use, by tool name, "
+            "or null if the tool is not loaded yet. Dependencies shared with a tool loaded earlier are not counted."
+        ),
+        examples=[{"arxiv": 0.12, "wikipedia": 0.15, "google_search": 1.74, "youtube_search": None}],
+    )
+    tool_calls: dict[str, int] = Field(
+        description=(
+            "Statistics of the coalescing of tool calls. "
+            "`coalesced` calls were answered by an identical call already in flight instead of calling the tool."
+        ),
+        examples=[{"in_flight": 2, "calls": 420, "coalesced": 37}],
+    )
+    tool_scheduler: dict[str, dict[str, int | float]] = Field(
+        description=(
+            "Statistics of the calls of each tool that was called, by tool name. "
+            "`waiting` calls are queued for a free slot, a high `avg_wait_seconds` means the tool limit is too low."
+        ),
+        examples=[
+            {
+                "ncl_search": {
+                    "waiting": 3,
+                    "running": 4,
+                    "calls": 120,
+                    "avg_wait_seconds": 0.8,
+                    "max_wait_seconds": 6.2,
+                }
+            }
+        ],
+    )
+    tool_health: dict[str, dict[str, Any]] = Field(
+        description=(
+            "The circuit breaker of each tool that was called, by tool name. "
+            "Calls of a tool whose breaker is `open` fail fast until `retry_in_seconds` elapse, the agents do not "
+            "offer it to the chat model meanwhile. The window statistics cover the calls of the last minute."
+        ),
+        examples=[
+            {
+                "google_search": {
+                    "state": "open",
+                    "retry_in_seconds": 12.5,
+                    "window_calls": 6,
+                    "window_error_rate": 1.0,
+                    "window_avg_seconds": 0.4,
+                    "window_max_seconds": 0.9,
+                    "total_calls": 58,
+                    "total_failures": 6,
+                    "short_circuited": 14,
+                    "last_error": "HttpError: Quota exceeded for quota metric 'Queries'",
+                }
+            }
+        ],
+    )
+    llm_cache: dict[str, int] = Field(
+        description=(
+            "Statistics of the chat models cached for the `llm_config` values used last. "
+            "Every distinct config is an entry, the least recently used ones are `evictions` once the cache is full. "
+            "`http_clients` is the number of providers whose models share a connection pool."
+        ),
+        examples=[
+            {
+                "entries": 3,
+                "max_entries": 32,
+                "models_with_tools": 4,
+                "hits": 418,
+                "misses": 3,
+                "evictions": 0,
+                "http_clients": 1,
+            }
+        ],
+    )
+    ncl_browser_pool: dict[str, int] = Field(
+        description="Statistics of the headless browser pool used by the NCL crawler.",
+        examples=[{"browsers": 2, "healthy_browsers": 2, "active_leases": 1, "total_uses": 42}],
+    )
+    ncl_session_pool: dict[str, int | float] = Field(
+        description=(
+            "Statistics of the warm ALEPH session pool used by the NCL crawler. "
+            "Every hit saves opening a new session, which takes about `avg_create_seconds`."
+        ),
+        examples=[{"idle": 4, "hits": 40, "misses": 2, "refreshes": 12, "discards": 8, "avg_create_seconds": 1.8}],
+    )
+    ncl_result_cache: dict[str, int | float] | None = Field(
+        default=None,
+        description=(
+            "Statistics of the NCL search result cache, or null if the cache is disabled. "
+            "`stale_hits` are answered from an expired entry while it is refreshed in the background."
+        ),
+        examples=[
+            {
+                "entries": 120,
+                "hits": 300,
+                "stale_hits": 12,
+                "revalidations": 0,
+                "misses": 130,
+                "evictions": 0,
+                "hit_rate": 0.7,
+            }
+        ],
+    )
+    ncl_record_cache: dict[str, int | float] | None = Field(
+        default=None,
+        description="Statistics of the cache of NCL full records used to enrich the top results, or null if disabled.",
+        examples=[
+            {
+                "entries": 80,
+                "hits": 150,
+                "stale_hits": 3,
+                "revalidations": 0,
+                "misses": 90,
+                "evictions": 0,
+                "hit_rate": 0.63,
+            }
+        ],
+    )
+    google_books_cache: dict[str, int | float] | None = Field(
+        default=None,
+        description=(
+            "Statistics of the Google Books response cache, or null if the cache is disabled. "
+            "`revalidations` are expired entries confirmed unchanged by a 304 response, which costs no result payload."
+        ),
+        examples=[
+            {
+                "entries": 60,
+                "hits": 200,
+                "stale_hits": 0,
+                "revalidations": 25,
+                "misses": 60,
+                "evictions": 0,
+                "hit_rate": 0.79,
+            }
+        ],
+    )
@@ -87,3 +87,24 @@ class ToolRunResponse(BaseModel):
             "it supports the day-to-day ..."
         ],
     )
+
+
+class ToolBatchRequest(BaseModel):
+    """The tool runs of a batch."""
+
+    runs: list[ToolRunRequest] = Field(
+        description="The tool runs, executed concurrently.",
+        min_length=1,
+        examples=[[ToolRunRequest(tool_name="ncl_search", args=[ToolRunArg(name="query", value="Python")])]],
+    )
+
+
+class ToolBatchResult(BaseModel):
+    """The result of one tool run of a batch, streamed as soon as the run completes."""
+
+    index: int = Field(description="The position of the run in the batch.", examples=[0])
+    tool_name: str = Field(description="The name of the tool.", examples=["ncl_search"])
+    status_code: int = Field(description="The status code of the run, as returned by `/tools/run`.", examples=[200])
+    output: str | None = Field(default=None, description="The output of the tool, None if the run failed.")
+    error: str | None = Field(default=None, description="Why the run failed, None if it succeeded.")
+    elapsed_seconds: float = Field(description="The time taken by the run, including the wait for a free slot.")
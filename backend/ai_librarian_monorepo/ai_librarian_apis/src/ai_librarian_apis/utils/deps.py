@@ -1,8 +1,18 @@
-from ai_librarian_apis.core.global_vars import tools
+from ai_librarian_apis.core.global_vars import tool_registry
+from ai_librarian_apis.utils.tool_catalog import ToolCatalog, get_tool_catalog
+from ai_librarian_core.tools.registry import ToolRegistry
 from fastapi import Request
 from langchain_core.tools import BaseTool
 
 
 def get_tools(request: Request) -> list[BaseTool]:
-    return tools
+    return tool_registry.tools
     # return request.app.state.tools
+
+
+def get_registry(request: Request) -> ToolRegistry:
+    return tool_registry
+
+
+def get_catalog(request: Request) -> ToolCatalog:
+    return get_tool_catalog(tool_registry)
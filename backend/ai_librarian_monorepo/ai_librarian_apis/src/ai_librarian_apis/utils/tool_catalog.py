@@ -0,0 +1,59 @@
+import hashlib
+from dataclasses import dataclass
+from functools import cache
+from typing import Self
+
+from ai_librarian_apis.schemas.tools import ToolArg, ToolInfo, ToolListResponse
+from ai_librarian_core.tools.registry import ToolRegistry
+
+
+@dataclass(frozen=True)
+class ToolCatalog:
+    """The serialized list of the tools of a registry, with its ETag.
+
+    The tools of a registry do not change, so the catalog is serialized once and served as is.
+
+    Attributes:
+        body (bytes): The JSON of the `ToolListResponse`.
+        etag (str): The strong ETag of `body`, quoted.
+    """
+
+    body: bytes
+    etag: str
+
+    @classmethod
+    def from_registry(cls, registry: ToolRegistry) -> Self:
+        tools_info = []
+        for tool in registry:
+            json_schema = registry.args_json_schema(tool.name)
+            required_args = json_schema.get("required", [])
+            tools_info.append(
+                ToolInfo(
+                    name=tool.name,
+                    description=tool.description,
+                    args_schema=[
+                        ToolArg(
+                            arg=arg_name,
+                            type=arg_details.get("type", "string"),  # Default to 'string' if type is not specified
+                            description=arg_details.get("description"),
+                            required=arg_name in required_args,
+                        )
+                        for arg_name, arg_details in json_schema.get("properties", {}).items()
+                    ],
+                )
+            )
+        body = ToolListResponse(tools=tools_info).model_dump_json().encode()
+        return cls(body=body, etag=f'"{hashlib.sha256(body).hexdigest()[:32]}"')
+
+    def matches(self, if_none_match: str | None) -> bool:
+        """Returns whether an `If-None-Match` header matches the catalog, i.e. the client's copy is up to date."""
+        if if_none_match is None:
+            return False
+        etags = [etag.strip().removeprefix("W/") for etag in if_none_match.split(",")]
+        return "*" in etags or self.etag in etags
+
+
+@cache
+def get_tool_catalog(registry: ToolRegistry) -> ToolCatalog:
+    """Returns the catalog of `registry`, serialized on the first call."""
+    return ToolCatalog.from_registry(registry)
@@ -0,0 +1,96 @@
+"""Micro-benchmark of the NCL brief results parser.
+
+Compares the per-row Playwright locator extraction that `AsyncNCLSearch` used to do (4-5 IPC round trips per row)
+with the bulk extraction (one `page.content()` round trip parsed locally with lxml), on a saved results page.
+
+Usage:
+    uv run python benchmarks/bench_ncl_parser.py --rounds 50
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+from collections.abc import Awaitable, Callable
+from pathlib import Path
+
+from ai_librarian_core.wrapper.ncl_search import AsyncNCLSearch
+from playwright.async_api import Page, async_playwright
+
+FIXTURE_PATH = Path(__file__).resolve().parent / "fixtures" / "ncl_brief_results.html"
+
+
+async def extract_per_row(search: AsyncNCLSearch, page: Page) -> list[dict[str, str]]:
+    """The row extraction `_asearch_ncl_results` used before the bulk extraction."""
+    result_rows_locator = page.locator('tr[valign="baseline"]')
+    num_rows = await result_rows_locator.count()
+    results = []
+    for i in range(num_rows):
+        row_locator = result_rows_locator.nth(i)
+        title_link_locator = row_locator.locator("td:nth-child(3) a.brieftit")
+
+        book_title = None
+        book_link = None
+        if await title_link_locator.count() > 0:
+            book_title = await title_link_locator.text_content()
+            book_link = await title_link_locator.get_attribute("href")
+        author = await row_locator.locator("td:nth-child(4)").text_content()
+
+        if book_title and book_link:
+            results.append({"title": book_title.strip(), "author": (author or "").strip(), "link": book_link.strip()})
+            if len(results) >= search.top_k_results:
+                break
+    return results
+
+
+async def extract_bulk(search: AsyncNCLSearch, page: Page) -> list[dict[str, str]]:
+    results = search._parse_ncl_results(await page.content(), page.url)
+    # The per-row extraction predates the holdings links.
+    return [{key: result[key] for key in ("title", "author", "link")} for result in results]
+
+
+async def measure(
+    name: str, extract: Callable[[], Awaitable[list[dict[str, str]]]], rounds: int
+) -> list[dict[str, str]]:
+    results: list[dict[str, str]] = []
+    durations = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        results = await extract()
+        durations.append((time.perf_counter() - start) * 1000)
+    print(
+        f"{name:<10} rows={len(results):<3} mean={statistics.mean(durations):8.2f}ms "
+        f"median={statistics.median(durations):8.2f}ms min={min(durations):8.2f}ms"
+    )
+    return results
+
+
+async def main(rounds: int, top_k_results: int) -> None:
+    html = FIXTURE_PATH.read_text(encoding="utf-8")
+    search = AsyncNCLSearch(top_k_results=top_k_results)
+
+    start = time.perf_counter()
+    for _ in range(rounds):
+        search._parse_ncl_results(html, "https://aleweb.ncl.edu.tw/F")
+    print(f"{'lxml only':<10} mean={(time.perf_counter() - start) * 1000 / rounds:8.2f}ms")
+
+    async with async_playwright() as p:
+        browser = await p.chromium.launch(headless=True)
+        try:
+            page = await browser.new_page()
+            await page.set_content(html)
+            per_row = await measure("per-row", lambda: extract_per_row(search, page), rounds)
+            bulk = await measure("bulk", lambda: extract_bulk(search, page), rounds)
+        finally:
+            await browser.close()
+
+    if per_row != bulk:
+        raise SystemExit("The per-row and bulk extractions returned different results.")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rounds", type=int, default=50, help="Number of extractions per mode.")
+    parser.add_argument("--top-k-results", type=int, default=20, help="The top_k_results of the search.")
+    args = parser.parse_args()
+    asyncio.run(main(args.rounds, args.top_k_results))
@@ -0,0 +1,325 @@
+"""Offline benchmark of the NCL search engines against a local stand-in for the NCL catalog.
+
+The recorded entry, brief results and full record pages in `fixtures/` are served by a local HTTP server that opens
+ALEPH sessions (with the `ALEPH_SESSION_ID` cookie) like the real catalog. `NCL_ENTRY_URL` is pointed at it, and
+every engine is measured at several concurrency levels: p50/p95 latency, throughput and the peak RSS of its process
+tree (browsers included, on Linux). Each engine runs in its own process so their peak RSS do not mix.
+
+The results are also checked against the fixture, so the script doubles as an offline regression test of the
+crawler. `--max-p95-ms` makes it exit with an error when an engine gets slower than the given budget.
+
+Usage:
+    uv run python benchmarks/bench_ncl_search.py --engines async-http sync-http --concurrency 1 4 16
+    uv run python benchmarks/bench_ncl_search.py --engines async-playwright --requests 20 --enrich-top-k 3
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import re
+import resource
+import secrets
+import statistics
+import subprocess
+import sys
+import threading
+import time
+import urllib.parse
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+from ai_librarian_core.wrapper.ncl_engine import NCLSearchEngine
+
+FIXTURES_DIR = Path(__file__).resolve().parent / "fixtures"
+RECORDED_HOST = "https://aleweb.ncl.edu.tw"
+RECORDED_SESSION_ID = "KJ8V6X5N1R5U8QXGE3PNE1RS7TNNXBAR9DSTV3G6HRM8D4AI3A-00981"
+EXPECTED_FIRST_TITLE = "人工智慧：現代方法"
+
+# The engine name maps to whether the sync facade is used, and the NCLSearchEngine value.
+ENGINES = {
+    "async-http": (False, NCLSearchEngine.HTTP),
+    "async-playwright": (False, NCLSearchEngine.PLAYWRIGHT),
+    "sync-http": (True, NCLSearchEngine.HTTP),
+    "sync-playwright": (True, NCLSearchEngine.PLAYWRIGHT),
+}
+
+
+class StandInNCLHandler(BaseHTTPRequestHandler):
+    """Serves the recorded NCL pages, rewritten to the session and host of the request."""
+
+    @property
+    def stand_in(self) -> "StandInNCLServer":
+        if not isinstance(self.server, StandInNCLServer):
+            raise TypeError("StandInNCLHandler only serves a StandInNCLServer.")
+        return self.server
+
+    def do_GET(self) -> None:
+        time.sleep(self.stand_in.latency)
+        url = urllib.parse.urlsplit(self.path)
+        func = urllib.parse.parse_qs(url.query).get("func", [""])[0]
+        headers = {"Content-Type": "text/html; charset=UTF-8"}
+
+        if match := re.fullmatch(r"/F/([A-Z0-9]+-\d+)/?", url.path):
+            session_id = match.group(1)
+            if func in ("find-b", "short-jump"):
+                page = "ncl_brief_results.html"
+            elif func == "full-set-set":
+                page = "ncl_full_record.html"
+            else:
+                page = "ncl_entry.html"
+        elif url.path.rstrip("/") == "/F":
+            session_id = self.stand_in.new_session_id()
+            headers["Set-Cookie"] = f"ALEPH_SESSION_ID={session_id}; path=/"
+            page = "ncl_entry.html"
+        else:
+            self.send_error(404)
+            return
+
+        body = (
+            self.stand_in.pages[page]
+            .replace(RECORDED_SESSION_ID, session_id)
+            .replace(RECORDED_HOST, self.stand_in.base_url)
+            .encode()
+        )
+        self.send_response(200)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args) -> None:
+        pass
+
+
+class StandInNCLServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, latency: float):
+        """Binds the server to a free local port, every response is delayed by `latency` seconds."""
+        super().__init__(("127.0.0.1", 0), StandInNCLHandler)
+        self.latency = latency
+        self.base_url = f"http://127.0.0.1:{self.server_address[1]}"
+        self.pages = {path.name: path.read_text(encoding="utf-8") for path in FIXTURES_DIR.glob("*.html")}
+        self._sessions = 0
+        self._lock = threading.Lock()
+
+    def new_session_id(self) -> str:
+        with self._lock:
+            self._sessions += 1
+            return f"{secrets.token_hex(25).upper()}-{self._sessions:05d}"
+
+
+def _process_tree_rss() -> int:
+    """Returns the RSS in bytes of this process and its descendants, read from /proc."""
+    children: dict[int, list[int]] = {}
+    rss: dict[int, int] = {}
+    for stat_path in Path("/proc").glob("[0-9]*/stat"):
+        try:
+            fields = stat_path.read_text().rsplit(")", 1)[1].split()
+        except OSError:
+            continue
+        pid = int(stat_path.parent.name)
+        children.setdefault(int(fields[1]), []).append(pid)
+        rss[pid] = int(fields[21]) * os.sysconf("SC_PAGE_SIZE")
+
+    total, stack = 0, [os.getpid()]
+    while stack:
+        pid = stack.pop()
+        total += rss.get(pid, 0)
+        stack.extend(children.get(pid, []))
+    return total
+
+
+class PeakRSSSampler:
+    """Samples the RSS of the process tree in a thread, falling back to the peak RSS of this process off Linux."""
+
+    def __init__(self, interval: float = 0.05):
+        """Samples every `interval` seconds."""
+        self.interval = interval
+        self.peak = 0
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._sample, daemon=True)
+
+    def _sample(self) -> None:
+        while not self._stop.is_set():
+            self.peak = max(self.peak, _process_tree_rss())
+            self._stop.wait(self.interval)
+
+    def __enter__(self) -> "PeakRSSSampler":
+        if Path("/proc/self/stat").exists():
+            self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self._stop.set()
+        if self._thread.is_alive():
+            self._thread.join()
+        else:
+            self.peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+
+def _check_output(output: str, top_k_results: int) -> None:
+    lines = [line for line in output.splitlines() if re.match(r"\d+\. ", line)]
+    if len(lines) != top_k_results or EXPECTED_FIRST_TITLE not in lines[0]:
+        raise AssertionError(f"Unexpected search output:\n{output}")
+
+
+def _describe_error(error: Exception) -> str:
+    message = str(error).strip().splitlines()
+    return f"{type(error).__name__}: {message[0] if message else ''}"
+
+
+def _summarize(engine: str, concurrency: int, latencies: list[float], errors: list[str], wall: float) -> dict:
+    quantiles = statistics.quantiles(latencies, n=20, method="inclusive") if len(latencies) > 1 else latencies * 19
+    return {
+        "engine": engine,
+        "concurrency": concurrency,
+        "requests": len(latencies) + len(errors),
+        "errors": len(errors),
+        "first_error": errors[0] if errors else None,
+        "p50_ms": statistics.median(latencies) * 1000 if latencies else None,
+        "p95_ms": quantiles[18] * 1000 if latencies else None,
+        "throughput": len(latencies) / wall,
+    }
+
+
+def run_worker(args: argparse.Namespace) -> None:
+    """Measures one engine in this process and prints one JSON line per concurrency level."""
+    from ai_librarian_core.wrapper import ncl_search
+    from ai_librarian_core.wrapper.browser_pool import AsyncBrowserPool, set_browser_pool
+    from ai_librarian_core.wrapper.ncl_session import NCLSessionPool
+
+    ncl_search.NCL_ENTRY_URL = f"{args.base_url}/F"
+    use_sync, engine = ENGINES[args.worker]
+    # The sync facade only adds `run` and `batch`, the async engines call the `arun` it inherits.
+    search = ncl_search.NCLSearch(engine=engine, top_k_results=args.top_k_results, enrich_top_k=args.enrich_top_k)
+    browser_pool = AsyncBrowserPool(num_browsers=args.browsers)
+    set_browser_pool(browser_pool)
+    ncl_search.set_ncl_session_pool(NCLSessionPool(factory=search.anew_session_id, size=args.session_pool_size))
+
+    async def measure_async(concurrency: int, offset: int) -> tuple[list[float], list[str]]:
+        semaphore = asyncio.Semaphore(concurrency)
+        latencies, errors = [], []
+
+        async def query(i: int) -> None:
+            async with semaphore:
+                start = time.perf_counter()
+                try:
+                    _check_output(await search.arun(f"人工智慧 {offset + i}"), args.top_k_results)
+                    latencies.append(time.perf_counter() - start)
+                except Exception as e:
+                    errors.append(_describe_error(e))
+
+        await asyncio.gather(*(query(i) for i in range(args.requests)))
+        return latencies, errors
+
+    def measure_sync(concurrency: int, offset: int) -> tuple[list[float], list[str]]:
+        latencies, errors = [], []
+
+        def query(i: int) -> None:
+            start = time.perf_counter()
+            try:
+                _check_output(search.run(f"人工智慧 {offset + i}"), args.top_k_results)
+                latencies.append(time.perf_counter() - start)
+            except Exception as e:
+                errors.append(_describe_error(e))
+
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            list(executor.map(query, range(args.requests)))
+        return latencies, errors
+
+    def report(concurrency: int, latencies: list[float], errors: list[str], wall: float, peak_rss: int) -> None:
+        summary = _summarize(args.worker, concurrency, latencies, errors, wall)
+        summary["peak_rss_mb"] = peak_rss / 2**20
+        print(json.dumps(summary), flush=True)
+
+    async def run_async_levels() -> None:
+        try:
+            for level, concurrency in enumerate(args.concurrency):
+                with PeakRSSSampler() as sampler:
+                    start = time.perf_counter()
+                    latencies, errors = await measure_async(concurrency, level * args.requests)
+                    wall = time.perf_counter() - start
+                report(concurrency, latencies, errors, wall, sampler.peak)
+        finally:
+            await browser_pool.close()
+
+    if use_sync:
+        for level, concurrency in enumerate(args.concurrency):
+            with PeakRSSSampler() as sampler:
+                start = time.perf_counter()
+                latencies, errors = measure_sync(concurrency, level * args.requests)
+                wall = time.perf_counter() - start
+            report(concurrency, latencies, errors, wall, sampler.peak)
+    else:
+        asyncio.run(run_async_levels())
+
+
+def run_benchmark(args: argparse.Namespace) -> int:
+    server = StandInNCLServer(latency=args.latency_ms / 1000)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    print(f"Stand-in NCL catalog at {server.base_url}, {args.latency_ms}ms simulated latency per request.\n")
+
+    header = (
+        f"{'engine':<18}{'conc':>5}{'reqs':>6}{'errors':>8}{'p50 ms':>10}{'p95 ms':>10}{'req/s':>9}{'peak RSS MB':>13}"
+    )
+    print(header)
+    print("-" * len(header))
+    exit_code = 0
+    for engine in args.engines:
+        worker_args = [
+            *("--worker", engine, "--base-url", server.base_url),
+            *("--requests", str(args.requests), "--concurrency", *map(str, args.concurrency)),
+            *("--top-k-results", str(args.top_k_results), "--enrich-top-k", str(args.enrich_top_k)),
+            *("--browsers", str(args.browsers), "--session-pool-size", str(args.session_pool_size)),
+        ]
+        process = subprocess.run([sys.executable, __file__, *worker_args], capture_output=True, text=True)
+        summaries = [json.loads(line) for line in process.stdout.splitlines() if line.startswith("{")]
+        if process.returncode != 0 or not summaries:
+            print(f"{engine:<18}failed: {process.stderr.strip().splitlines()[-1:] or process.returncode}")
+            exit_code = 1
+            continue
+
+        for summary in summaries:
+            if summary["p50_ms"] is None:
+                print(f"{engine:<18}{summary['concurrency']:>5}  all requests failed: {summary['first_error']}")
+                exit_code = 1
+                continue
+            print(
+                f"{engine:<18}{summary['concurrency']:>5}{summary['requests']:>6}{summary['errors']:>8}"
+                f"{summary['p50_ms']:>10.1f}{summary['p95_ms']:>10.1f}{summary['throughput']:>9.1f}"
+                f"{summary['peak_rss_mb']:>13.1f}"
+            )
+            if summary["errors"]:
+                print(f"{'':<18}first error: {summary['first_error']}")
+                exit_code = 1
+            if args.max_p95_ms is not None and summary["p95_ms"] > args.max_p95_ms:
+                print(f"{'':<18}p95 exceeds the {args.max_p95_ms}ms budget.")
+                exit_code = 1
+
+    server.shutdown()
+    return exit_code
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--engines", nargs="+", choices=ENGINES, default=["async-http", "sync-http"])
+    parser.add_argument("--concurrency", nargs="+", type=int, default=[1, 4, 16], help="Concurrency levels.")
+    parser.add_argument("--requests", type=int, default=50, help="Number of queries per concurrency level.")
+    parser.add_argument("--latency-ms", type=float, default=20, help="Simulated latency of the stand-in catalog.")
+    parser.add_argument("--top-k-results", type=int, default=10, help="The top_k_results of the search.")
+    parser.add_argument("--enrich-top-k", type=int, default=0, help="The number of hits enriched with full records.")
+    parser.add_argument("--browsers", type=int, default=2, help="Browsers in the pool of the Playwright engines.")
+    parser.add_argument("--session-pool-size", type=int, default=4, help="Warm ALEPH sessions kept by the pool.")
+    parser.add_argument("--max-p95-ms", type=float, default=None, help="Fail if an engine's p95 exceeds this.")
+    parser.add_argument("--worker", choices=ENGINES, help=argparse.SUPPRESS)
+    parser.add_argument("--base-url", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        run_worker(args)
+    else:
+        sys.exit(run_benchmark(args))
@@ -0,0 +1,88 @@
+"""Micro-benchmark of the per-request overhead of the ReAct agent workflow.
+
+Compares compiling the LangGraph workflow (a `StateGraph`, a new `ToolNode` and `compile()`) and rendering its Mermaid
+flowchart on every run, stream and `/flowchart` request, as the agents used to do, with the workflow and flowchart
+cached by the agent. The runs use the built-in tools and a stand-in chat model that answers at once, so they measure
+the overhead of the agent rather than the latency of a provider.
+
+Usage:
+    uv run python benchmarks/bench_react_workflow.py --rounds 200
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+from collections.abc import Awaitable, Callable
+
+from ai_librarian_core.agents.react.asynchronous import AsyncReactAgent
+from ai_librarian_core.models.llm_config import LLMConfig
+from ai_librarian_core.tools.tools import get_built_in_tools
+from langchain_core.language_models import LanguageModelInput
+from langchain_core.messages import AIMessage, BaseMessage, HumanMessage
+from langchain_core.runnables import Runnable, RunnableLambda
+from langgraph.graph.state import CompiledStateGraph
+
+
+async def answer_at_once(messages: LanguageModelInput) -> BaseMessage:
+    """A stand-in chat model."""
+    return AIMessage(content="Python is a programming language.")
+
+
+class BenchmarkAgent(AsyncReactAgent):
+    def _init_llm(self, llm_config: LLMConfig) -> Runnable[LanguageModelInput, BaseMessage]:
+        return RunnableLambda(answer_at_once)
+
+
+class UncachedBenchmarkAgent(BenchmarkAgent):
+    """The agent as it was before the workflow was cached."""
+
+    @property
+    def workflow(self) -> CompiledStateGraph:
+        return self._init_workflow()
+
+    def plot(self) -> str:
+        return self.workflow.get_graph().draw_mermaid()
+
+
+async def measure(name: str, call: Callable[[], Awaitable[object]], rounds: int) -> float:
+    durations = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        await call()
+        durations.append((time.perf_counter() - start) * 1000)
+    mean = statistics.mean(durations)
+    print(f"{name:<22} mean={mean:8.3f}ms median={statistics.median(durations):8.3f}ms min={min(durations):8.3f}ms")
+    return mean
+
+
+async def main(rounds: int) -> None:
+    tools = get_built_in_tools()
+    uncached = UncachedBenchmarkAgent(tools=tools)
+    cached = BenchmarkAgent(tools=tools)
+    messages = [HumanMessage(content="What is Python?")]
+
+    async def workflow(agent: AsyncReactAgent) -> CompiledStateGraph:
+        return agent.workflow
+
+    async def plot(agent: AsyncReactAgent) -> str:
+        return agent.plot()
+
+    for label, call in (
+        ("workflow", workflow),
+        ("flowchart", plot),
+        ("run", lambda agent: agent.run(messages)),
+    ):
+        before = await measure(f"{label} (uncached)", lambda: call(uncached), rounds)
+        after = await measure(f"{label} (cached)", lambda: call(cached), rounds)
+        print(f"{label:<22} saved={before - after:8.3f}ms per request\n")
+
+    if uncached.plot() != cached.plot():
+        raise SystemExit("The cached and uncached workflows have different flowcharts.")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rounds", type=int, default=200, help="Number of requests per mode.")
+    args = parser.parse_args()
+    asyncio.run(main(args.rounds))
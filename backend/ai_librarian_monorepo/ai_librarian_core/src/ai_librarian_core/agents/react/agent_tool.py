@@ -0,0 +1,74 @@
+import asyncio
+from typing import Any
+
+from ai_librarian_core.tools.delegating import DelegatingTool
+from ai_librarian_core.tools.health import ToolUnavailableError
+from ai_librarian_core.tools.truncation import ToolOutputLimits
+from ai_librarian_core.utils.deadline import get_remaining_seconds
+from langchain_core.callbacks import AsyncCallbackManagerForToolRun, CallbackManagerForToolRun
+from langchain_core.messages import ToolMessage
+from langchain_core.runnables import RunnableConfig
+from pydantic import ConfigDict, Field
+
+
+class AgentTool(DelegatingTool):
+    """A tool as called by the `ToolNode` of an agent.
+
+    Async calls are bounded by the time left before the deadline of the run, minus `answer_time_reserve`, and answered
+    with an error message for the chat model if the tool does not answer in time. The output is truncated for the chat
+    model to the limit of the tool in `output_limits`, the message keeps the full output, see `get_full_content`. Calls
+    of a tool whose circuit breaker is open are answered with an error message for the chat model instead of failing
+    the run.
+
+    Attributes:
+        tool (BaseTool): The wrapped tool.
+        answer_time_reserve (float): Seconds of the time budget of a run kept for the chat model to answer with the tool
+            results, at most half of the time left when the tool is called (default: 10).
+        output_limits (ToolOutputLimits): The limits of the outputs sent to the chat model (default:
+            `ToolOutputLimits()`).
+    """
+
+    answer_time_reserve: float = Field(default=10, exclude=True)
+    output_limits: ToolOutputLimits = Field(default_factory=ToolOutputLimits, exclude=True)
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    def _error_output(self, input: Any, content: str) -> ToolMessage | str:
+        # Tool calls are answered with a message, like the outputs of the tool.
+        if isinstance(input, dict) and input.get("type") == "tool_call":
+            return ToolMessage(content=content, name=self.name, tool_call_id=input["id"], status="error")
+        return content
+
+    def _truncate(self, output: Any) -> Any:
+        return self.output_limits.truncate(output) if isinstance(output, ToolMessage) else output
+
+    def invoke(self, input: Any, config: RunnableConfig | None = None, **kwargs: Any) -> Any:
+        try:
+            output = super().invoke(input, config, **kwargs)
+        except ToolUnavailableError as e:
+            output = self._error_output(input, str(e))
+        return self._truncate(output)
+
+    async def ainvoke(self, input: Any, config: RunnableConfig | None = None, **kwargs: Any) -> Any:
+        remaining_seconds = get_remaining_seconds(config)
+        if remaining_seconds is not None:
+            remaining_seconds -= min(self.answer_time_reserve, remaining_seconds / 2)
+        timeout = asyncio.timeout(remaining_seconds)
+        try:
+            async with timeout:
+                output = await super().ainvoke(input, config, **kwargs)
+        except TimeoutError:
+            if not timeout.expired():
+                raise
+            output = self._error_output(
+                input, f"The {self.name} tool did not answer within the time budget of the request."
+            )
+        except ToolUnavailableError as e:
+            output = self._error_output(input, str(e))
+        return self._truncate(output)
+
+    def _run(self, *args: Any, run_manager: CallbackManagerForToolRun | None = None, **kwargs: Any) -> Any:
+        return self._call_tool(args, kwargs, run_manager)
+
+    async def _arun(self, *args: Any, run_manager: AsyncCallbackManagerForToolRun | None = None, **kwargs: Any) -> Any:
+        return await self._acall_tool(args, kwargs, run_manager)
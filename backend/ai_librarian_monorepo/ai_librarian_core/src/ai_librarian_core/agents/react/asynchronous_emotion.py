@@ -1,3 +1,4 @@
+import asyncio
 from collections.abc import AsyncIterator
 from dataclasses import dataclass
 from typing import Any, Literal
@@ -6,8 +7,10 @@ from ai_librarian_core.agents.react.base import BaseReactAgent, MissingAIMessage
 from ai_librarian_core.agents.react.state import Emotion, MessagesEmotionState
 from ai_librarian_core.models.llm_config import LLMConfig
 from ai_librarian_core.models.used_tool import UsedTool
-from ai_librarian_core.utils.uuid import get_thread_id
+from ai_librarian_core.tools.truncation import get_full_content
+from ai_librarian_core.utils.deadline import get_remaining_seconds
 from langchain_core.messages import AIMessage, BaseMessage, ToolMessage
+from langchain_core.runnables import RunnableConfig
 from langgraph.graph import StateGraph
 from langgraph.graph.state import CompiledStateGraph
 from langgraph.prebuilt import ToolNode
@@ -24,28 +27,33 @@ class AsyncReactEmotionAgent(BaseReactAgent):
         super().__post_init__()
         self.state_schema = MessagesEmotionState
 
-    @property
-    def workflow(self) -> CompiledStateGraph:
-        return self._init_workflow()
-
     async def _clear_used_tools(self, state: MessagesEmotionState) -> dict[str, Any]:
         return {"used_tools": [], "tool_cursor": len(state.messages)}
 
-    async def _invoke_llm(self, state: MessagesEmotionState) -> dict[str, list[BaseMessage]]:
+    async def _invoke_llm(self, state: MessagesEmotionState, config: RunnableConfig) -> dict[str, list[BaseMessage]]:
         llm_config = state.llm_config
         llm = self._init_llm(llm_config)
         messages = state.messages
+        remaining_seconds = get_remaining_seconds(config)
+        if remaining_seconds == 0:
+            return {"messages": [self._deadline_exceeded_message(state)]}
 
         try:
-            response = await llm.ainvoke(messages)
+            async with asyncio.timeout(remaining_seconds):
+                response = await llm.ainvoke(messages)
             return {"messages": [response]}
+        except TimeoutError:
+            return {"messages": [self._deadline_exceeded_message(state)]}
         # TODO(youkwan): Handle specific errors (couldn't find docs).
         except Exception as e:
             raise ReactAgentError("An unexpected error occurred while trying to invoke the chat model.") from e
 
-    async def _detect_emotion(self, state: MessagesEmotionState) -> dict[str, Emotion]:
+    async def _detect_emotion(self, state: MessagesEmotionState, config: RunnableConfig) -> dict[str, Emotion]:
+        remaining_seconds = get_remaining_seconds(config)
+        if remaining_seconds == 0:
+            return {"emotion": Emotion.NEUTRAL}
         llm_config = state.llm_config
-        llm = self._init_llm(llm_config).with_structured_output(EmotionOutput)
+        llm = self._init_llm_without_tools(llm_config).with_structured_output(EmotionOutput)
         recent_messages = state.messages[-3:]
         history = "\n".join(
             f"{message.type.upper()}: {getattr(message, 'content', '')}"
@@ -53,15 +61,16 @@ class AsyncReactEmotionAgent(BaseReactAgent):
             if getattr(message, "content", None)
         )
         try:
-            response = await llm.ainvoke(
-                f"""
+            async with asyncio.timeout(remaining_seconds):
+                response = await llm.ainvoke(
+                    f"""
         You are a helpful assistant that detects the emotion from the chat history.
         The chat history is:
         {history}
         Return the emotion of the chat history.
         """,
-            )
-        except ValidationError:
+                )
+        except (ValidationError, TimeoutError):
             return {"emotion": Emotion.NEUTRAL}
 
         emotion_value: Any
@@ -93,7 +102,7 @@ class AsyncReactEmotionAgent(BaseReactAgent):
         new_tools: list[UsedTool] = []
         for message in state.messages[start_index:]:
             if isinstance(message, ToolMessage):
-                new_tools.append(UsedTool(name=message.name, output=message.content))
+                new_tools.append(UsedTool(name=message.name, output=get_full_content(message)))
 
         updates: dict[str, Any] = {"tool_cursor": len(state.messages)}
         if new_tools:
@@ -106,7 +115,8 @@ class AsyncReactEmotionAgent(BaseReactAgent):
         workflow.add_node("clear_used_tools", self._clear_used_tools)
         workflow.add_node("invoke_llm", invoke_llm)
         workflow.add_node("detect_emotion", self._detect_emotion)
-        tool_node = ToolNode(self.tools)
+        # Identical tool calls of concurrent runs share one upstream call, each run waits until its deadline at most.
+        tool_node = ToolNode(self._get_tool_node_tools())
         workflow.add_node("catch_tool_massage", self._catch_tool_massage)
         workflow.add_node("tools", tool_node)
         workflow.set_entry_point("clear_used_tools")
@@ -121,23 +131,26 @@ class AsyncReactEmotionAgent(BaseReactAgent):
         return workflow.compile(name=self.name, checkpointer=self.checkpointer)
 
     async def run(
-        self, messages: list[BaseMessage], thread_id: str | None = None, llm_config: LLMConfig = LLMConfig()
+        self,
+        messages: list[BaseMessage],
+        thread_id: str | None = None,
+        llm_config: LLMConfig = LLMConfig(),
+        time_budget: float | None = None,
     ) -> tuple[AIMessage, list[UsedTool], Emotion]:
         state = MessagesEmotionState(messages=messages, llm_config=llm_config)
-        result = await self.workflow.ainvoke(
-            state, config={"configurable": {"thread_id": thread_id or get_thread_id()}}
-        )
+        result = await self.workflow.ainvoke(state, config=self._get_run_config(thread_id, time_budget))
         return result["messages"][-1], result["used_tools"], result["emotion"]
 
     async def stream(
-        self, messages: list[BaseMessage], thread_id: str | None = None, llm_config: LLMConfig = LLMConfig()
+        self,
+        messages: list[BaseMessage],
+        thread_id: str | None = None,
+        llm_config: LLMConfig = LLMConfig(),
+        time_budget: float | None = None,
     ) -> AsyncIterator[tuple[str, Any]]:
         state = MessagesEmotionState(messages=messages, llm_config=llm_config)
         return self.workflow.astream(
             state,
             stream_mode=["messages", "values"],
-            config={"configurable": {"thread_id": thread_id or get_thread_id()}},
+            config=self._get_run_config(thread_id, time_budget),
         )
-
-    def plot(self) -> str:
-        return self.workflow.get_graph().draw_mermaid()
@@ -1,13 +1,23 @@
+import asyncio
 from abc import ABC, abstractmethod
-from collections.abc import AsyncIterator, Iterator
-from dataclasses import dataclass
+from collections.abc import AsyncIterator, Callable, Iterator
+from dataclasses import dataclass, field
+from typing import Any
 
+from ai_librarian_core.agents.react.agent_tool import AgentTool
 from ai_librarian_core.agents.react.state import MessagesState
 from ai_librarian_core.models.llm_config import LLMConfig
 from ai_librarian_core.models.used_tool import UsedTool
-from langchain.chat_models import init_chat_model
+from ai_librarian_core.tools.coalesced import coalesce_tool_calls
+from ai_librarian_core.tools.health import ToolHealth, get_tool_health
+from ai_librarian_core.tools.truncation import ToolOutputLimits
+from ai_librarian_core.utils.chat_models import ChatModelCache
+from ai_librarian_core.utils.deadline import DEADLINE_CONFIG_KEY, get_deadline
+from ai_librarian_core.utils.uuid import get_thread_id
 from langchain.chat_models.base import BaseChatModel
+from langchain_core.language_models import LanguageModelInput
 from langchain_core.messages import AIMessage, BaseMessage
+from langchain_core.runnables import Runnable, RunnableConfig
 from langchain_core.tools import BaseTool
 from langgraph.checkpoint.base import BaseCheckpointSaver
 from langgraph.checkpoint.memory import InMemorySaver
@@ -35,29 +45,54 @@ class BaseReactAgent(ABC):
     tools: list[BaseTool]
     name: str = "react_agent"
     checkpointer: BaseCheckpointSaver = InMemorySaver()
-
-    @property
-    @abstractmethod
-    def workflow(self) -> CompiledStateGraph:
-        raise NotImplementedError("Subclasses must implement this method.")
+    # Seconds of the time budget of a run kept for the chat model to answer with the tool results it got, at most half
+    # of the time left when the tools are called.
+    answer_time_reserve: float = 10
+    # The limits of the tool outputs sent to the chat model, `used_tools` keep the full outputs.
+    tool_output_limits: ToolOutputLimits = field(default_factory=ToolOutputLimits)
+    # Whether to leave the tools whose circuit breaker is open out of the tools bound to the chat model, so it does not
+    # choose them while they are failing.
+    hide_unavailable_tools: bool = False
+    # Falls back to the process-wide `ToolHealth` of `get_tool_health()` if None.
+    tool_health: ToolHealth | None = None
+    # The chat models of the configs used last, with the tools bound. Agents with the same tools may share a cache, and
+    # with it the HTTP connection pools of the providers.
+    llm_cache: ChatModelCache = field(default_factory=ChatModelCache)
 
     def __post_init__(self):
-        self._llm_cache: dict[LLMConfig, BaseChatModel] = {}
         self.state_schema: MessagesState = MessagesState
+        self._workflow: CompiledStateGraph | None = None
+        # The tools, checkpointer and tool call settings the workflow was compiled with, followed by identity.
+        self._workflow_components: tuple = ()
+        self._mermaid: str | None = None
 
-    def _init_llm(self, llm_config: LLMConfig) -> BaseChatModel:
-        if llm_config in self._llm_cache:
-            return self._llm_cache[llm_config]
-
+    @property
+    def workflow(self) -> CompiledStateGraph:
+        """The compiled workflow, compiled on first use and again only once `tools`, `checkpointer`,
+        `answer_time_reserve` or `tool_output_limits` change.
+        """
+        components = (*self.tools, self.checkpointer, self.answer_time_reserve, self.tool_output_limits)
+        if self._workflow is None or not _are_same(components, self._workflow_components):
+            self._workflow = self._init_workflow()
+            self._workflow_components = components
+            self._mermaid = None
+        return self._workflow
+
+    def _get_tool_health(self) -> ToolHealth:
+        return self.tool_health or get_tool_health()
+
+    def _init_llm(self, llm_config: LLMConfig) -> Runnable[LanguageModelInput, BaseMessage]:
+        unavailable_tools = self._get_tool_health().unavailable_tools() if self.hide_unavailable_tools else frozenset()
+        tools = [tool for tool in self.tools if tool.name not in unavailable_tools]
+        return self._get_chat_model(lambda: self.llm_cache.get(llm_config, tools))
+
+    def _init_llm_without_tools(self, llm_config: LLMConfig) -> BaseChatModel:
+        """The chat model of `llm_config` without tools, e.g. to ask it for a structured output."""
+        return self._get_chat_model(lambda: self.llm_cache.get_model(llm_config))
+
+    def _get_chat_model[T](self, get: Callable[[], T]) -> T:
         try:
-            llm = init_chat_model(
-                model=llm_config.model,
-                temperature=llm_config.temperature,
-                max_tokens=llm_config.max_tokens,
-            )
-            llm_with_tools = llm.bind_tools(self.tools)
-            self._llm_cache[llm_config] = llm_with_tools
-            return llm_with_tools
+            return get()
         except ValueError as e:
             raise InvalidChatModelError("Model_provider cannot be inferred or isn’t supported.") from e
         except ImportError as e:
@@ -65,6 +100,37 @@ class BaseReactAgent(ABC):
         except Exception as e:
             raise ReactAgentError("An unexpected error occurred while trying to initialize the chat model.") from e
 
+    async def awarm_up(self, llm_configs: list[LLMConfig]) -> None:
+        """Creates the chat models of `llm_configs` with the tools bound, and opens connections to their providers."""
+        for llm_config in llm_configs:
+            # Creating the first model of a provider imports its integration package.
+            await asyncio.to_thread(self._init_llm, llm_config)
+        await self.llm_cache.apreconnect(llm_configs)
+
+    def _get_run_config(self, thread_id: str | None, time_budget: float | None) -> RunnableConfig:
+        configurable: dict[str, Any] = {"thread_id": thread_id or get_thread_id()}
+        if time_budget is not None:
+            configurable[DEADLINE_CONFIG_KEY] = get_deadline(time_budget)
+        return {"configurable": configurable}
+
+    def _deadline_exceeded_message(self, state: MessagesState) -> AIMessage:
+        """The answer of a run whose time budget ran out before the chat model could answer."""
+        content = (
+            "Sorry, I ran out of time before I could finish answering. Please try again or ask a narrower question."
+        )
+        if state.used_tools:
+            content += " The results of the tools I called so far are attached."
+        return AIMessage(content=content, response_metadata={"finish_reason": "deadline_exceeded"})
+
+    def _get_tool_node_tools(self) -> list[BaseTool]:
+        """Returns the tools of the `ToolNode` of the workflow, whose identical concurrent calls are coalesced and whose
+        calls are bounded by the deadline of the run and outputs truncated for the chat model.
+        """
+        return [
+            AgentTool.wrap(tool, answer_time_reserve=self.answer_time_reserve, output_limits=self.tool_output_limits)
+            for tool in coalesce_tool_calls(self.tools)
+        ]
+
     @abstractmethod
     def _init_workflow(self) -> CompiledStateGraph:
         raise NotImplementedError("Init workflow method is not implemented")
@@ -77,6 +143,15 @@ class BaseReactAgent(ABC):
     def stream(self) -> Iterator[dict[str, list[BaseMessage]]] | AsyncIterator[dict[str, list[BaseMessage]]]:
         raise NotImplementedError("Stream method is not implemented")
 
-    @abstractmethod
     def plot(self) -> str:
-        raise NotImplementedError("Plot method is not implemented")
+        """Returns the flowchart of the workflow in Mermaid, rendered once per compiled workflow."""
+        workflow = self.workflow
+        if self._mermaid is None:
+            self._mermaid = workflow.get_graph().draw_mermaid()
+        return self._mermaid
+
+
+def _are_same(components: tuple, other_components: tuple) -> bool:
+    return len(components) == len(other_components) and all(
+        component is other for component, other in zip(components, other_components, strict=True)
+    )
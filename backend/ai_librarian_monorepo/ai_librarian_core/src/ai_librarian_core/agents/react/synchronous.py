@@ -6,6 +6,7 @@ from ai_librarian_core.agents.react.base import BaseReactAgent, MissingAIMessage
 from ai_librarian_core.agents.react.state import MessagesState
 from ai_librarian_core.models.llm_config import LLMConfig
 from ai_librarian_core.models.used_tool import UsedTool
+from ai_librarian_core.tools.truncation import get_full_content
 from ai_librarian_core.utils.uuid import get_thread_id
 from langchain_core.messages import AIMessage, BaseMessage, ToolMessage
 from langgraph.graph import StateGraph
@@ -18,10 +19,6 @@ class ReactAgent(BaseReactAgent):
     def __post_init__(self):
         super().__post_init__()
 
-    @property
-    def workflow(self) -> CompiledStateGraph:
-        return self._init_workflow()
-
     def _clear_used_tools(self, state: MessagesState) -> dict[str, list[UsedTool]]:
         return {"used_tools": []}
 
@@ -49,7 +46,9 @@ class ReactAgent(BaseReactAgent):
     def _catch_tool_massage(self, state: MessagesState) -> dict[str, list[UsedTool]]:
         messages = state.messages
         used_tools = [
-            UsedTool(name=msg.name, output=msg.content) for msg in reversed(messages) if isinstance(msg, ToolMessage)
+            UsedTool(name=msg.name, output=get_full_content(msg))
+            for msg in reversed(messages)
+            if isinstance(msg, ToolMessage)
         ]
         if used_tools:
             used_tools.reverse()
@@ -60,7 +59,8 @@ class ReactAgent(BaseReactAgent):
         invoke_llm = self._invoke_llm
         workflow.add_node("clear_used_tools", self._clear_used_tools)
         workflow.add_node("invoke_llm", invoke_llm)
-        tool_node = ToolNode(self.tools)
+        # Identical tool calls of concurrent runs share one upstream call.
+        tool_node = ToolNode(self._get_tool_node_tools())
         workflow.add_node("catch_tool_massage", self._catch_tool_massage)
         workflow.add_node("tools", tool_node)
         workflow.set_entry_point("clear_used_tools")
@@ -90,6 +90,3 @@ class ReactAgent(BaseReactAgent):
             stream_mode="messages",
             config={"configurable": {"thread_id": thread_id or get_thread_id()}},
         )
-
-    def plot(self) -> str:
-        return self.workflow.get_graph().draw_mermaid()
@@ -0,0 +1,98 @@
+from dataclasses import dataclass
+from typing import Any, Self
+
+from ai_librarian_core.tools.delegating import DelegatingTool, arguments_key
+from ai_librarian_core.utils.cache import TTLCache
+from langchain_core.callbacks import AsyncCallbackManagerForToolRun, CallbackManagerForToolRun
+from langchain_core.tools import BaseTool
+from pydantic import ConfigDict, Field
+
+
+@dataclass
+class ToolCachePolicy:
+    """How the results of a tool are cached.
+
+    Attributes:
+        ttl (float): The number of seconds a result is fresh (default: 3600).
+        stale_ttl (float): The number of seconds a result is served stale after `ttl` while an async call refreshes it
+            (default: 0).
+        max_entries (int): The maximum number of results kept (default: 256).
+        cached_errors (tuple[type[Exception], ...]): The errors cached like results and raised again on hits, no errors
+            are cached if empty (default: ()).
+        errors_ttl (float): The number of seconds a cached error is fresh (default: 60).
+        normalize_args (bool): Whether string arguments differing only in case, full-width forms or whitespace share
+            a cached result (default: True).
+    """
+
+    ttl: float = 3600
+    stale_ttl: float = 0
+    max_entries: int = 256
+    cached_errors: tuple[type[Exception], ...] = ()
+    errors_ttl: float = 60
+    normalize_args: bool = True
+
+    def new_cache(self, namespace: str) -> TTLCache:
+        return TTLCache(
+            ttl=self.ttl,
+            stale_ttl=self.stale_ttl,
+            negative_ttl=self.errors_ttl,
+            max_entries=self.max_entries,
+            namespace=namespace,
+        )
+
+
+# Tools missing from the policies are not cached, e.g. `date_time`, whose result changes on every call.
+DEFAULT_TOOL_CACHE_POLICIES: dict[str, ToolCachePolicy] = {
+    "arxiv": ToolCachePolicy(ttl=86400),
+    "duckduckgo_results_json": ToolCachePolicy(ttl=3600),
+    "youtube_search": ToolCachePolicy(ttl=3600),
+    # NCL search and Google Books also cache their responses on disk, this only saves repeats within conversations.
+    "ncl_search": ToolCachePolicy(ttl=600),
+    "google_books": ToolCachePolicy(ttl=600),
+    "wikipedia": ToolCachePolicy(ttl=86400),
+    "google_search": ToolCachePolicy(ttl=3600),
+    "open_weather_map": ToolCachePolicy(ttl=600),
+}
+
+
+class CachedTool(DelegatingTool):
+    """A tool that answers repeated calls of another tool from a cache.
+
+    The cache is keyed on the (normalized) arguments of the call and holds the raw output of the wrapped tool.
+
+    Attributes:
+        tool (BaseTool): The wrapped tool.
+        policy (ToolCachePolicy): How the results of the tool are cached.
+        cache (TTLCache): The cache of the results, created from `policy` if not given.
+
+    Example:
+        >>> tool = CachedTool.wrap(WikipediaQueryRun(api_wrapper=WikipediaAPIWrapper()), ToolCachePolicy(ttl=86400))
+        >>> tool.invoke({"query": "Python"})  # Calls Wikipedia
+        >>> tool.invoke({"query": " python "})  # Answered from the cache
+    """
+
+    policy: ToolCachePolicy = Field(default_factory=ToolCachePolicy)
+    cache: TTLCache = Field(default_factory=lambda data: data["policy"].new_cache(namespace=data["name"]), exclude=True)
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    @classmethod
+    def wrap(cls, tool: BaseTool, policy: ToolCachePolicy | None = None, **kwargs: Any) -> Self:
+        return super().wrap(tool, policy=policy or ToolCachePolicy(), **kwargs)
+
+    def _run(self, *args: Any, run_manager: CallbackManagerForToolRun | None = None, **kwargs: Any) -> Any:
+        key = arguments_key(args, kwargs, normalize=self.policy.normalize_args)
+        return self.cache.get_or_fetch(
+            key, lambda: self._call_tool(args, kwargs, run_manager), self.policy.cached_errors
+        )
+
+    async def _arun(self, *args: Any, run_manager: AsyncCallbackManagerForToolRun | None = None, **kwargs: Any) -> Any:
+        key = arguments_key(args, kwargs, normalize=self.policy.normalize_args)
+        return await self.cache.aget_or_fetch(
+            key, lambda: self._acall_tool(args, kwargs, run_manager), self.policy.cached_errors
+        )
+
+
+def with_cache(tools: list[BaseTool], policies: dict[str, ToolCachePolicy]) -> list[BaseTool]:
+    """Wraps the tools that have a policy in `policies` with `CachedTool`, the others are returned as they are."""
+    return [CachedTool.wrap(tool, policies[tool.name]) if tool.name in policies else tool for tool in tools]
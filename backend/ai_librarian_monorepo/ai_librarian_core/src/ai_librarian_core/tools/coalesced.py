@@ -0,0 +1,60 @@
+from typing import Any, Self
+
+from ai_librarian_core.tools.cached import CachedTool
+from ai_librarian_core.tools.delegating import DelegatingTool, arguments_key
+from ai_librarian_core.utils.single_flight import SingleFlight
+from langchain_core.callbacks import AsyncCallbackManagerForToolRun, CallbackManagerForToolRun
+from langchain_core.tools import BaseTool
+from pydantic import Field
+
+_tool_call_flights = SingleFlight()
+
+
+def get_tool_call_flights() -> SingleFlight:
+    """Returns the process-wide coalescer of tool calls, shared by every agent and the tools API."""
+    return _tool_call_flights
+
+
+class CoalescedTool(DelegatingTool):
+    """A tool whose identical concurrent calls share a single call of the wrapped tool.
+
+    Calls are identical if they have the same tool name and arguments. They are coalesced across every
+    `CoalescedTool` of the process, so the same question asked by several users at once, to any agent or through the
+    tools API, reaches the upstream service once.
+
+    Attributes:
+        tool (BaseTool): The wrapped tool.
+        normalize_args (bool): Whether string arguments differing only in case, full-width forms or whitespace are
+            identical. `wrap` takes it from the `ToolCachePolicy` of a `CachedTool`, so calls answered from the same
+            cached result are coalesced (default: False).
+
+    Example:
+        >>> tool = CoalescedTool.wrap(WikipediaQueryRun(api_wrapper=WikipediaAPIWrapper()))
+        >>> await asyncio.gather(*(tool.ainvoke({"query": "Python"}) for _ in range(10)))  # Calls Wikipedia once
+    """
+
+    normalize_args: bool = Field(default=False, exclude=True)
+
+    @classmethod
+    def wrap(cls, tool: BaseTool, **kwargs: Any) -> Self:
+        if isinstance(tool, CachedTool):
+            kwargs.setdefault("normalize_args", tool.policy.normalize_args)
+        return super().wrap(tool, **kwargs)
+
+    def _flight_key(self, args: tuple, kwargs: dict[str, Any]) -> tuple[str, str]:
+        return self.name, arguments_key(args, kwargs, normalize=self.normalize_args)
+
+    def _run(self, *args: Any, run_manager: CallbackManagerForToolRun | None = None, **kwargs: Any) -> Any:
+        return get_tool_call_flights().do(
+            self._flight_key(args, kwargs), lambda: self._call_tool(args, kwargs, run_manager)
+        )
+
+    async def _arun(self, *args: Any, run_manager: AsyncCallbackManagerForToolRun | None = None, **kwargs: Any) -> Any:
+        return await get_tool_call_flights().ado(
+            self._flight_key(args, kwargs), lambda: self._acall_tool(args, kwargs, run_manager)
+        )
+
+
+def coalesce_tool_calls(tools: list[BaseTool]) -> list[BaseTool]:
+    """Wraps the tools with `CoalescedTool`, except the ones that already are."""
+    return [tool if isinstance(tool, CoalescedTool) else CoalescedTool.wrap(tool) for tool in tools]
@@ -0,0 +1,92 @@
+import inspect
+import json
+import unicodedata
+from typing import Any, Self
+
+from langchain_core.callbacks import AsyncCallbackManagerForToolRun, CallbackManagerForToolRun
+from langchain_core.runnables import ensure_config
+from langchain_core.tools import BaseTool
+
+
+def normalize_arguments(value: Any) -> Any:
+    """Normalizes the case, full-width forms and whitespace of the strings in tool arguments."""
+    if isinstance(value, str):
+        return " ".join(unicodedata.normalize("NFKC", value).casefold().split())
+    if isinstance(value, list | tuple):
+        return [normalize_arguments(item) for item in value]
+    if isinstance(value, dict):
+        return {key: normalize_arguments(item) for key, item in value.items()}
+    return value
+
+
+def arguments_key(args: tuple, kwargs: dict[str, Any], normalize: bool = True) -> str:
+    """Returns a key identifying the arguments of a tool call, e.g. to cache or coalesce the call."""
+    arguments = {"args": list(args), "kwargs": kwargs}
+    if normalize:
+        arguments = normalize_arguments(arguments)
+    return json.dumps(arguments, sort_keys=True, ensure_ascii=False, default=str)
+
+
+def _get_tool_kwargs(tool: BaseTool, is_async: bool, run_manager: Any) -> dict[str, Any]:
+    # Mirrors `BaseTool.run`/`BaseTool.arun`: the default `_arun` passes the run manager on to `_run` itself, and tools
+    # such as `StructuredTool` also take the config of the call, which `BaseTool.run`/`BaseTool.arun` set as current.
+    method = tool._arun if is_async and type(tool)._arun is not BaseTool._arun else tool._run
+    parameters = inspect.signature(method).parameters
+    kwargs: dict[str, Any] = {}
+    if "run_manager" in parameters:
+        kwargs["run_manager"] = run_manager
+    if "config" in parameters:
+        kwargs["config"] = ensure_config()
+    return kwargs
+
+
+def call_tool(
+    tool: BaseTool, args: tuple, kwargs: dict[str, Any], run_manager: CallbackManagerForToolRun | None
+) -> Any:
+    """Calls `tool` from the `_run` of another tool and returns its raw output."""
+    return tool._run(*args, **_get_tool_kwargs(tool, False, run_manager), **kwargs)
+
+
+async def acall_tool(
+    tool: BaseTool, args: tuple, kwargs: dict[str, Any], run_manager: AsyncCallbackManagerForToolRun | None
+) -> Any:
+    """Calls `tool` from the `_arun` of another tool and returns its raw output."""
+    return await tool._arun(*args, **_get_tool_kwargs(tool, True, run_manager), **kwargs)
+
+
+class DelegatingTool(BaseTool):
+    """A base for tools that add behavior around another tool.
+
+    The name, description and arguments schema are the ones of the wrapped tool, so agents and the APIs use it
+    transparently. Subclasses call the wrapped tool with `_call_tool` and `_acall_tool`, which return its raw output,
+    so tools with `response_format="content_and_artifact"` keep their artifact.
+
+    Attributes:
+        tool (BaseTool): The wrapped tool.
+    """
+
+    tool: BaseTool
+
+    @classmethod
+    def wrap(cls, tool: BaseTool, **kwargs: Any) -> Self:
+        return cls(
+            tool=tool,
+            name=tool.name,
+            description=tool.description,
+            args_schema=tool.args_schema,
+            return_direct=tool.return_direct,
+            response_format=tool.response_format,
+            handle_tool_error=tool.handle_tool_error,
+            handle_validation_error=tool.handle_validation_error,
+            tags=tool.tags,
+            metadata=tool.metadata,
+            **kwargs,
+        )
+
+    def _call_tool(self, args: tuple, kwargs: dict[str, Any], run_manager: CallbackManagerForToolRun | None) -> Any:
+        return call_tool(self.tool, args, kwargs, run_manager)
+
+    async def _acall_tool(
+        self, args: tuple, kwargs: dict[str, Any], run_manager: AsyncCallbackManagerForToolRun | None
+    ) -> Any:
+        return await acall_tool(self.tool, args, kwargs, run_manager)
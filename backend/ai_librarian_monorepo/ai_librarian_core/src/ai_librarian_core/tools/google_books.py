@@ -1,11 +1,27 @@
+from typing import Self
+
 from ai_librarian_core.wrapper.google_books import GoogleBooksAPIWrapper
-from langchain_core.callbacks import CallbackManagerForToolRun
+from langchain_core.callbacks import AsyncCallbackManagerForToolRun, CallbackManagerForToolRun
 from langchain_core.tools import BaseTool
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, model_validator
 
 
 class GoogleBooksQueryInput(BaseModel):
-    query: str = Field(description="query to look up on google books")
+    query: str | None = Field(default=None, description="query to look up on google books")
+    isbns: list[str] | None = Field(
+        default=None,
+        max_length=200,
+        description=(
+            "ISBNs to look up on google books at once, e.g. the books of a reading list. "
+            "Use this instead of `query` when the ISBNs of the books are known."
+        ),
+    )
+
+    @model_validator(mode="after")
+    def validate_query_or_isbns(self) -> Self:
+        if (self.query is None) == (self.isbns is None):
+            raise ValueError("Exactly one of query and isbns must be provided.")
+        return self
 
 
 class GoogleBooksQueryRun(BaseTool):
@@ -13,13 +29,14 @@ class GoogleBooksQueryRun(BaseTool):
 
     This tool provides an interface to search books using the Google Books API.
     It can be used to find books on specific topics and generate recommendations
-    based on keywords.
+    based on keywords, or to look up several books by their ISBNs with the `isbns` input.
 
     Attributes:
         name (str): Name of the tool, set to "google_books"
         description (str): Description of the tool's functionality
         api_wrapper (GoogleBooksAPIWrapper): Wrapper instance for Google Books API
         args_schema (type[BaseModel]): Schema for input validation
+        lookup_max_concurrency (int): Maximum number of ISBNs looked up at the same time
 
     Example:
         >>> tool = GoogleBooksQueryRun(api_wrapper=GoogleBooksAPIWrapper(google_api_key="your_google_api_key"))
@@ -35,16 +52,37 @@ class GoogleBooksQueryRun(BaseTool):
         "A tool that searches the Google Books API. "
         "Useful for when you need to answer general inquiries about "
         "books of certain topics and generate recommendation based "
-        "off of key words"
-        "Input should be a query string"
+        "off of key words. "
+        "Input should be a query string, or a list of ISBNs to look up several books at once"
     )
     api_wrapper: GoogleBooksAPIWrapper = Field(default_factory=GoogleBooksAPIWrapper)
     args_schema: type[BaseModel] = GoogleBooksQueryInput
+    lookup_max_concurrency: int = Field(default=8, ge=1)
 
     def _run(
         self,
-        query: str,
+        query: str | None = None,
+        isbns: list[str] | None = None,
         run_manager: CallbackManagerForToolRun | None = None,
     ) -> str:
         """Use the Google Books tool."""
+        if isbns is not None:
+            lookups = self.api_wrapper.lookup_isbns(isbns, max_concurrency=self.lookup_max_concurrency)
+            return self.api_wrapper.format_lookups(lookups)
+        if query is None:
+            raise ValueError("Exactly one of query and isbns must be provided.")
         return self.api_wrapper.run(query)
+
+    async def _arun(
+        self,
+        query: str | None = None,
+        isbns: list[str] | None = None,
+        run_manager: AsyncCallbackManagerForToolRun | None = None,
+    ) -> str:
+        """Use the Google Books tool asynchronously."""
+        if isbns is not None:
+            lookups = await self.api_wrapper.alookup_isbns(isbns, max_concurrency=self.lookup_max_concurrency)
+            return self.api_wrapper.format_lookups(lookups)
+        if query is None:
+            raise ValueError("Exactly one of query and isbns must be provided.")
+        return await self.api_wrapper.arun(query)
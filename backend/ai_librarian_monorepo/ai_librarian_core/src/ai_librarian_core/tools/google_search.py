@@ -1,10 +1,28 @@
-from langchain_google_community import GoogleSearchRun
+from langchain_core.tools import BaseTool
 from pydantic import BaseModel, Field
 
+GOOGLE_SEARCH_NAME = "google_search"
+GOOGLE_SEARCH_DESCRIPTION = (
+    "A wrapper around Google Search. Useful for when you need to answer questions about current events. "
+    "Input should be a search query."
+)
+
 
 class GoogleSearchInput(BaseModel):
     query: str = Field(description="The query to search for on Google.")
 
 
-class SchemaedGoogleSearchRun(GoogleSearchRun):
-    args_schema: type[BaseModel] = GoogleSearchInput
+def create_google_search_run() -> BaseTool:
+    """Returns the Google Search tool.
+
+    `langchain_google_community` imports the clients of every Google API it supports, which takes seconds, so it is
+    imported here rather than with this module.
+    """
+    from langchain_google_community import GoogleSearchAPIWrapper, GoogleSearchRun
+
+    return GoogleSearchRun(
+        name=GOOGLE_SEARCH_NAME,
+        description=GOOGLE_SEARCH_DESCRIPTION,
+        args_schema=GoogleSearchInput,
+        api_wrapper=GoogleSearchAPIWrapper(),
+    )
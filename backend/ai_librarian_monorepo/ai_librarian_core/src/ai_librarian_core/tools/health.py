@@ -0,0 +1,331 @@
+import math
+import threading
+import time
+from collections import deque
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from enum import StrEnum, auto
+from typing import Any
+
+from ai_librarian_core.tools.delegating import DelegatingTool
+from langchain_core.callbacks import AsyncCallbackManagerForToolRun, CallbackManagerForToolRun
+from langchain_core.tools import ToolException
+from pydantic import ConfigDict, Field
+
+# Web search APIs answer in a few seconds, a call taking this long means the provider hangs. Tools with timeouts of
+# their own, such as ncl_search and google_books, report hung calls as errors, and may legitimately take longer.
+DEFAULT_TOOL_SLOW_CALL_SECONDS: dict[str, float] = {
+    "duckduckgo_results_json": 20,
+    "google_search": 20,
+    "youtube_search": 20,
+}
+
+
+class ToolUnavailableError(ToolException):
+    pass
+
+
+class CircuitState(StrEnum):
+    CLOSED = auto()
+    OPEN = auto()
+    HALF_OPEN = auto()
+
+
+@dataclass
+class CircuitBreaker:
+    """Tracks the recent calls of one tool and short-circuits its calls while it keeps failing.
+
+    The circuit opens when at least `failure_rate_threshold` of the calls that ended in the last `window_seconds`
+    failed, out of at least `min_calls` calls. Calls are then refused for `open_seconds`, after which the circuit is
+    half-open: one trial call goes through, and closes the circuit if it succeeds or opens it again if it fails.
+
+    A call fails if it raises, or if it takes `slow_call_seconds` or more, e.g. until the deadline of the run cancels
+    it. Errors that are expected outcomes of a call, e.g. a query without results, are recorded as successful calls,
+    see `ToolHealth.guard`.
+
+    Attributes:
+        failure_rate_threshold (float): The share of failed calls that opens the circuit (default: 0.5).
+        min_calls (int): The number of calls in the window below which the circuit stays closed (default: 5).
+        window_seconds (float): The period over which the failure rate is measured (default: 60).
+        open_seconds (float): How long the circuit stays open before a trial call (default: 30).
+        slow_call_seconds (float | None): The duration from which a call counts as failed, None to only count errors
+            (default: None).
+    """
+
+    failure_rate_threshold: float = 0.5
+    min_calls: int = 5
+    window_seconds: float = 60
+    open_seconds: float = 30
+    slow_call_seconds: float | None = None
+
+    def __post_init__(self):
+        self._lock = threading.Lock()
+        # (ended_at, failed, seconds) of the calls that ended in the window.
+        self._calls: deque[tuple[float, bool, float]] = deque()
+        self._state = CircuitState.CLOSED
+        self._opened_at = 0.0
+        self._is_trial_running = False
+        self._total_calls = 0
+        self._total_failures = 0
+        self._short_circuited = 0
+        self._last_error: str | None = None
+
+    def _get_state(self, now: float) -> CircuitState:
+        if self._state is CircuitState.OPEN and now - self._opened_at >= self.open_seconds:
+            self._state = CircuitState.HALF_OPEN
+        return self._state
+
+    def _prune(self, now: float) -> None:
+        while self._calls and now - self._calls[0][0] > self.window_seconds:
+            self._calls.popleft()
+
+    def _open(self, now: float) -> None:
+        self._state = CircuitState.OPEN
+        self._opened_at = now
+
+    @property
+    def state(self) -> CircuitState:
+        with self._lock:
+            return self._get_state(time.monotonic())
+
+    def retry_in(self) -> float:
+        """Returns the number of seconds until a call goes through again, 0 if calls go through."""
+        with self._lock:
+            if self._get_state(time.monotonic()) is not CircuitState.OPEN:
+                return 0.0
+            return max(self._opened_at + self.open_seconds - time.monotonic(), 0.0)
+
+    def allow(self) -> CircuitState | None:
+        """Returns the state in which a call goes through, None if it is refused.
+
+        A half-open circuit lets a single trial call through, whose outcome is recorded with `is_trial=True`.
+        """
+        with self._lock:
+            state = self._get_state(time.monotonic())
+            if state is CircuitState.CLOSED:
+                return state
+            if state is CircuitState.HALF_OPEN and not self._is_trial_running:
+                self._is_trial_running = True
+                return state
+            self._short_circuited += 1
+            return None
+
+    def record(
+        self, seconds: float, error: BaseException | None = None, is_cancelled: bool = False, is_trial: bool = False
+    ) -> None:
+        """Records a call that took `seconds` and raised `error` if not None.
+
+        A cancelled call only counts if it was slow, as it may have been cancelled for reasons of its own caller.
+        """
+        is_slow = self.slow_call_seconds is not None and seconds >= self.slow_call_seconds
+        with self._lock:
+            now = time.monotonic()
+            state = self._get_state(now)
+            if is_trial:
+                self._is_trial_running = False
+            if is_cancelled and not is_slow:
+                return
+            failed = error is not None or is_slow
+            self._total_calls += 1
+            self._total_failures += failed
+            if error is not None:
+                self._last_error = f"{type(error).__name__}: {error}"
+            self._calls.append((now, failed, seconds))
+            self._prune(now)
+            if state is CircuitState.HALF_OPEN and is_trial:
+                if failed:
+                    self._open(now)
+                else:
+                    self._state = CircuitState.CLOSED
+                    self._calls.clear()
+            elif state is CircuitState.CLOSED and failed and len(self._calls) >= self.min_calls:
+                failures = sum(call_failed for _, call_failed, _ in self._calls)
+                if failures / len(self._calls) >= self.failure_rate_threshold:
+                    self._open(now)
+
+    def reset(self) -> None:
+        """Closes the circuit and forgets the recent calls."""
+        with self._lock:
+            self._state = CircuitState.CLOSED
+            self._calls.clear()
+            self._is_trial_running = False
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            now = time.monotonic()
+            self._prune(now)
+            state = self._get_state(now)
+            calls = len(self._calls)
+            failures = sum(failed for _, failed, _ in self._calls)
+            return {
+                "state": state,
+                "retry_in_seconds": (
+                    max(self._opened_at + self.open_seconds - now, 0.0) if state is CircuitState.OPEN else 0.0
+                ),
+                "window_calls": calls,
+                "window_error_rate": failures / calls if calls else 0.0,
+                "window_avg_seconds": sum(seconds for _, _, seconds in self._calls) / calls if calls else 0.0,
+                "window_max_seconds": max((seconds for _, _, seconds in self._calls), default=0.0),
+                "total_calls": self._total_calls,
+                "total_failures": self._total_failures,
+                "short_circuited": self._short_circuited,
+                "last_error": self._last_error,
+            }
+
+
+@dataclass
+class ToolHealth:
+    """Tracks the health of the tools with a `CircuitBreaker` per tool, shared by all the agents and the APIs.
+
+    Calls of a tool whose circuit is open fail fast with `ToolUnavailableError` instead of waiting for the provider,
+    e.g. while an API quota is exhausted or a website is down. Agents may also leave such tools out of the ones they
+    offer to the chat model, see `unavailable_tools`.
+
+    Attributes:
+        enabled (bool): Whether the calls are tracked and guarded, if False the tools are always called (default:
+            True).
+        failure_rate_threshold (float): See `CircuitBreaker` (default: 0.5).
+        min_calls (int): See `CircuitBreaker` (default: 5).
+        window_seconds (float): See `CircuitBreaker` (default: 60).
+        open_seconds (float): See `CircuitBreaker` (default: 30).
+        slow_call_seconds (float | None): See `CircuitBreaker`, for the tools missing from `slow_call_limits`
+            (default: None).
+        slow_call_limits (dict[str, float | None]): The `slow_call_seconds` of each tool, by tool name (default:
+            `DEFAULT_TOOL_SLOW_CALL_SECONDS`).
+
+    Example:
+        >>> health = ToolHealth(min_calls=3)
+        >>> with health.guard("google_search"):
+        ...     google_search.invoke("Python")
+        >>> health.stats()["google_search"]["state"]
+        'closed'
+    """
+
+    enabled: bool = True
+    failure_rate_threshold: float = 0.5
+    min_calls: int = 5
+    window_seconds: float = 60
+    open_seconds: float = 30
+    slow_call_seconds: float | None = None
+    slow_call_limits: dict[str, float | None] = field(default_factory=lambda: dict(DEFAULT_TOOL_SLOW_CALL_SECONDS))
+
+    def __post_init__(self):
+        self._lock = threading.Lock()
+        self._breakers: dict[str, CircuitBreaker] = {}
+
+    def breaker(self, tool_name: str) -> CircuitBreaker:
+        with self._lock:
+            if tool_name not in self._breakers:
+                self._breakers[tool_name] = CircuitBreaker(
+                    failure_rate_threshold=self.failure_rate_threshold,
+                    min_calls=self.min_calls,
+                    window_seconds=self.window_seconds,
+                    open_seconds=self.open_seconds,
+                    slow_call_seconds=self.slow_call_limits.get(tool_name, self.slow_call_seconds),
+                )
+            return self._breakers[tool_name]
+
+    def unavailable_tools(self) -> frozenset[str]:
+        """Returns the names of the tools whose calls are refused, i.e. whose circuit is open."""
+        if not self.enabled:
+            return frozenset()
+        with self._lock:
+            breakers = dict(self._breakers)
+        return frozenset(name for name, breaker in breakers.items() if breaker.state is CircuitState.OPEN)
+
+    @contextmanager
+    def guard(self, tool_name: str, ignored_errors: tuple[type[Exception], ...] = ()) -> Iterator[None]:
+        """Records the outcome of the call of the tool in the block.
+
+        Args:
+            tool_name (str): The name of the called tool.
+            ignored_errors (tuple[type[Exception], ...]): The errors that are expected outcomes of the call rather
+                than failures of the tool, e.g. a query without results or invalid arguments. They are recorded as
+                successful calls (default: ()).
+
+        Raises:
+            ToolUnavailableError: If the circuit of the tool is open, without running the block.
+        """
+        if not self.enabled:
+            yield
+            return
+        breaker = self.breaker(tool_name)
+        state = breaker.allow()
+        if state is None:
+            raise ToolUnavailableError(
+                f"The {tool_name} tool is temporarily unavailable after repeated failures, "
+                f"retry in {math.ceil(breaker.retry_in())}s or use another tool."
+            )
+        is_trial = state is CircuitState.HALF_OPEN
+        started_at = time.perf_counter()
+        try:
+            yield
+        except ignored_errors:
+            breaker.record(time.perf_counter() - started_at, is_trial=is_trial)
+            raise
+        except Exception as e:
+            breaker.record(time.perf_counter() - started_at, error=e, is_trial=is_trial)
+            raise
+        except BaseException:
+            breaker.record(time.perf_counter() - started_at, is_cancelled=True, is_trial=is_trial)
+            raise
+        breaker.record(time.perf_counter() - started_at, is_trial=is_trial)
+
+    def reset(self, tool_name: str | None = None) -> None:
+        """Closes the circuit of the given tool, or of every tool if no tool name is given."""
+        with self._lock:
+            breakers = list(self._breakers.values()) if tool_name is None else [self._breakers.get(tool_name)]
+        for breaker in breakers:
+            if breaker is not None:
+                breaker.reset()
+
+    def stats(self) -> dict[str, dict[str, Any]]:
+        with self._lock:
+            breakers = dict(self._breakers)
+        return {name: breaker.stats() for name, breaker in breakers.items()}
+
+
+class CircuitBreakerTool(DelegatingTool):
+    """A tool whose calls are guarded by the circuit breaker of its name in a `ToolHealth`.
+
+    Attributes:
+        tool (BaseTool): The wrapped tool.
+        health (ToolHealth | None): Tracks the health of the tool. Falls back to the process-wide `ToolHealth` of
+            `get_tool_health()` if None (default: None).
+        ignored_errors (tuple[type[Exception], ...]): The errors of the tool that do not count as failures, see
+            `ToolHealth.guard` (default: ()).
+    """
+
+    health: ToolHealth | None = Field(default=None, exclude=True)
+    ignored_errors: tuple[type[Exception], ...] = Field(default=(), exclude=True)
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    def _get_health(self) -> ToolHealth:
+        return self.health or get_tool_health()
+
+    def _run(self, *args: Any, run_manager: CallbackManagerForToolRun | None = None, **kwargs: Any) -> Any:
+        with self._get_health().guard(self.name, self.ignored_errors):
+            return self._call_tool(args, kwargs, run_manager)
+
+    async def _arun(self, *args: Any, run_manager: AsyncCallbackManagerForToolRun | None = None, **kwargs: Any) -> Any:
+        with self._get_health().guard(self.name, self.ignored_errors):
+            return await self._acall_tool(args, kwargs, run_manager)
+
+
+_health: ToolHealth | None = None
+
+
+def get_tool_health() -> ToolHealth:
+    """Returns the process-wide tool health, creating one with the default thresholds if none is set."""
+    global _health
+    if _health is None:
+        _health = ToolHealth()
+    return _health
+
+
+def set_tool_health(health: ToolHealth) -> None:
+    """Replaces the process-wide tool health."""
+    global _health
+    _health = health
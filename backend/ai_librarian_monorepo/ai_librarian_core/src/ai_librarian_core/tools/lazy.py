@@ -0,0 +1,122 @@
+import asyncio
+import logging
+import threading
+import time
+from collections.abc import Callable
+from typing import Any, Self
+
+from ai_librarian_core.tools.delegating import DelegatingTool, acall_tool, call_tool
+from langchain_core.callbacks import AsyncCallbackManagerForToolRun, CallbackManagerForToolRun
+from langchain_core.tools import BaseTool
+from pydantic import Field, PrivateAttr
+
+logger = logging.getLogger(__name__)
+
+# The fields copied from the class defaults of a tool by `LazyTool.from_class`.
+TOOL_SPEC_FIELDS = ("name", "description", "args_schema", "return_direct", "response_format")
+
+
+class LazyTool(BaseTool):
+    """A tool that imports and creates the tool it wraps on its first call.
+
+    The name, description and arguments schema are given up front, so agents and the APIs list the tool without paying
+    for the imports of its dependencies, e.g. API clients, which slow down the startup of the workers. The time taken
+    by the first call to import and create the tool is reported by `load_seconds`.
+
+    Attributes:
+        factory (Callable[[], BaseTool]): Imports and returns the wrapped tool.
+        tool (BaseTool | None): The wrapped tool, None until it is loaded.
+
+    Example:
+        >>> def create_arxiv() -> BaseTool:
+        ...     from langchain_community.tools import ArxivQueryRun
+        ...     return ArxivQueryRun()
+        >>> tool = LazyTool(name="arxiv", description="Searches arXiv.", args_schema=ArxivInput, factory=create_arxiv)
+        >>> tool.invoke({"query": "LLM agents"})  # Imports arxiv and creates the tool
+    """
+
+    factory: Callable[[], BaseTool] = Field(exclude=True)
+    tool: BaseTool | None = None
+
+    _lock: threading.Lock = PrivateAttr(default_factory=threading.Lock)
+    _load_seconds: float | None = PrivateAttr(default=None)
+
+    @classmethod
+    def from_class(cls, tool_class: type[BaseTool], factory: Callable[[], BaseTool] | None = None) -> Self:
+        """Returns a lazy tool described by the class defaults of `tool_class`, created by `factory`.
+
+        `factory` defaults to the class itself. Only for tool classes that are cheap to import, i.e. that import their
+        dependencies when they are created.
+        """
+        fields = tool_class.model_fields
+        return cls(factory=factory or tool_class, **{name: fields[name].get_default() for name in TOOL_SPEC_FIELDS})
+
+    @property
+    def is_loaded(self) -> bool:
+        return self.tool is not None
+
+    @property
+    def load_seconds(self) -> float | None:
+        """The number of seconds taken to import and create the wrapped tool, None if it is not loaded yet."""
+        return self._load_seconds
+
+    def load(self) -> BaseTool:
+        """Imports and creates the wrapped tool if it is not loaded yet, and returns it."""
+        if self.tool is not None:
+            return self.tool
+        with self._lock:
+            if self.tool is None:
+                started_at = time.perf_counter()
+                tool = self.factory()
+                self._load_seconds = time.perf_counter() - started_at
+                self.tool = tool
+                logger.info(f"Loaded the {self.name} tool in {self._load_seconds:.3f}s.")
+        return self.tool
+
+    async def aload(self) -> BaseTool:
+        """Like `load`, but imports and creates the tool in a thread so the event loop is not blocked."""
+        if self.tool is not None:
+            return self.tool
+        return await asyncio.to_thread(self.load)
+
+    def _run(self, *args: Any, run_manager: CallbackManagerForToolRun | None = None, **kwargs: Any) -> Any:
+        return call_tool(self.load(), args, kwargs, run_manager)
+
+    async def _arun(self, *args: Any, run_manager: AsyncCallbackManagerForToolRun | None = None, **kwargs: Any) -> Any:
+        return await acall_tool(await self.aload(), args, kwargs, run_manager)
+
+
+def find_lazy_tool(tool: BaseTool) -> LazyTool | None:
+    """Returns the lazy tool wrapped by `tool`, e.g. through `CachedTool`, or `tool` itself if it is lazy."""
+    while isinstance(tool, DelegatingTool):
+        tool = tool.tool
+    return tool if isinstance(tool, LazyTool) else None
+
+
+def load_tools(tools: list[BaseTool]) -> dict[str, float]:
+    """Loads the lazy tools among `tools` that are not loaded yet, and returns their load time in seconds, by name.
+
+    Failures are logged and skipped, the tool is loaded again on its first call.
+    """
+    load_seconds: dict[str, float] = {}
+    for tool in tools:
+        lazy_tool = find_lazy_tool(tool)
+        if lazy_tool is None or lazy_tool.is_loaded:
+            continue
+        try:
+            lazy_tool.load()
+        except Exception as e:
+            logger.warning(f"Failed to load the {lazy_tool.name} tool: {e}")
+            continue
+        if (seconds := lazy_tool.load_seconds) is not None:
+            load_seconds[lazy_tool.name] = seconds
+    return load_seconds
+
+
+def get_load_seconds(tools: list[BaseTool]) -> dict[str, float | None]:
+    """Returns the load time in seconds of the lazy tools among `tools`, None for the ones not loaded yet, by name."""
+    load_seconds: dict[str, float | None] = {}
+    for tool in tools:
+        if (lazy_tool := find_lazy_tool(tool)) is not None:
+            load_seconds[lazy_tool.name] = lazy_tool.load_seconds
+    return load_seconds
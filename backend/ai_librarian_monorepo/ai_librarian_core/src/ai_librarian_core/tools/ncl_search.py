@@ -1,20 +1,37 @@
+from typing import Self
+
 from ai_librarian_core.wrapper.ncl_search import AsyncNCLSearch, NCLSearch
 from langchain_core.callbacks import AsyncCallbackManagerForToolRun, CallbackManagerForToolRun
 from langchain_core.tools import BaseTool
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, model_validator
 
 
 class NCLSearchInput(BaseModel):
     """The input of the NCLSearch tool."""
 
-    query: str = Field(description="The query to search the NCL catalog.")
+    query: str | None = Field(default=None, description="The query to search the NCL catalog.")
+    queries: list[str] | None = Field(
+        default=None,
+        max_length=200,
+        description=(
+            "Several queries to search the NCL catalog at once, e.g. the titles of a reading list. "
+            "Use this instead of `query` when looking up more than one book."
+        ),
+    )
+
+    @model_validator(mode="after")
+    def validate_query_or_queries(self) -> Self:
+        if (self.query is None) == (self.queries is None):
+            raise ValueError("Exactly one of query and queries must be provided.")
+        return self
 
 
 class NCLSearchRun(BaseTool):
     """A tool for searching the Taiwan National Central Library(NCL, 國家圖書館) catalog.
 
     This tool allows searching books in the NCL catalog by keywords. It returns a formatted
-    string containing book information including title, author and link.
+    string containing book information including title, author and link. Several queries can be
+    searched at once with the `queries` input, in which case the results are grouped by query.
 
     Example:
         >>> ncl_search_tool = NCLSearchRun()
@@ -30,21 +47,43 @@ class NCLSearchRun(BaseTool):
         "A tool for searching the Taiwan National Central Library(NCL, 國家圖書館) catalog."
         "The search results are returned in a string, containing the title, author, and link of the book."
         "The title and author are returned in the same language as the query, and the link is the URL of the book."
+        "The top results may also include the ISBN, publisher, year, call number and subjects of the book."
     )
     ncl_search: NCLSearch = Field(default_factory=NCLSearch)
     async_ncl_search: AsyncNCLSearch = Field(default_factory=AsyncNCLSearch)
+    batch_max_concurrency: int = Field(default=8, ge=1)
     args_schema: type[BaseModel] = NCLSearchInput
 
+    def _format_batch(self, queries: list[str], outputs: list[str | Exception]) -> str:
+        sections = []
+        for query, output in zip(queries, outputs, strict=True):
+            if isinstance(output, Exception):
+                output = f"Error: {output}"
+            sections.append(f'Results for "{query}":\n{output}')
+        return "\n\n".join(sections)
+
     def _run(
         self,
-        query: str,
+        query: str | None = None,
+        queries: list[str] | None = None,
         run_manager: CallbackManagerForToolRun | None = None,
     ) -> str:
+        if queries is not None:
+            outputs = self.ncl_search.batch(queries, max_concurrency=self.batch_max_concurrency)
+            return self._format_batch(queries, outputs)
+        if query is None:
+            raise ValueError("Exactly one of query and queries must be provided.")
         return self.ncl_search.run(query)
 
     async def _arun(
         self,
-        query: str,
+        query: str | None = None,
+        queries: list[str] | None = None,
         run_manager: AsyncCallbackManagerForToolRun | None = None,
     ) -> str:
+        if queries is not None:
+            outputs = await self.async_ncl_search.abatch(queries, max_concurrency=self.batch_max_concurrency)
+            return self._format_batch(queries, outputs)
+        if query is None:
+            raise ValueError("Exactly one of query and queries must be provided.")
         return await self.async_ncl_search.arun(query)
@@ -0,0 +1,96 @@
+from collections.abc import Iterator
+from dataclasses import dataclass
+from typing import Any
+
+from ai_librarian_core.tools.coalesced import coalesce_tool_calls
+from langchain_core.tools import BaseTool
+from pydantic import BaseModel
+
+
+class ToolRegistryError(Exception):
+    pass
+
+
+class ToolNotFoundError(ToolRegistryError):
+    pass
+
+
+class DuplicateToolError(ToolRegistryError):
+    pass
+
+
+@dataclass(eq=False)
+class ToolRegistry:
+    """The tools shared by the agents and the APIs, indexed by name.
+
+    The input schema of every tool, which validates the arguments of its calls, and its JSON schema are resolved once
+    when the registry is created rather than on every call or listing, as is the `CoalescedTool` of every tool.
+
+    Attributes:
+        tools (list[BaseTool]): The tools, whose names must be unique.
+
+    Example:
+        >>> registry = ToolRegistry(get_built_in_tools())
+        >>> registry.validate_args("wikipedia", {"query": "Python"})
+        >>> await registry.get_coalesced("wikipedia").ainvoke({"query": "Python"})
+    """
+
+    tools: list[BaseTool]
+
+    def __post_init__(self):
+        self._tools: dict[str, BaseTool] = {}
+        for tool in self.tools:
+            if tool.name in self._tools:
+                raise DuplicateToolError(f"More than one tool is named {tool.name}.")
+            self._tools[tool.name] = tool
+        self._coalesced_tools: dict[str, BaseTool] = {
+            tool.name: coalesced_tool for tool, coalesced_tool in zip(self.tools, coalesce_tool_calls(self.tools))
+        }
+        self._input_schemas: dict[str, type[BaseModel]] = {tool.name: tool.get_input_schema() for tool in self.tools}
+        self._args_json_schemas: dict[str, dict[str, Any]] = {
+            name: input_schema.model_json_schema() for name, input_schema in self._input_schemas.items()
+        }
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._tools
+
+    def __iter__(self) -> Iterator[BaseTool]:
+        return iter(self.tools)
+
+    def __len__(self) -> int:
+        return len(self.tools)
+
+    def get(self, name: str) -> BaseTool:
+        """Returns the tool named `name`.
+
+        Raises:
+            ToolNotFoundError: If no tool is named `name`.
+        """
+        if name not in self._tools:
+            raise ToolNotFoundError(f"Tool {name} not found.")
+        return self._tools[name]
+
+    def get_coalesced(self, name: str) -> BaseTool:
+        """Returns the tool named `name`, whose identical concurrent calls share a single call with the other callers
+        of the process, e.g. the agents.
+
+        Raises:
+            ToolNotFoundError: If no tool is named `name`.
+        """
+        self.get(name)
+        return self._coalesced_tools[name]
+
+    def args_json_schema(self, name: str) -> dict[str, Any]:
+        """Returns the JSON schema of the arguments of the tool named `name`."""
+        self.get(name)
+        return self._args_json_schemas[name]
+
+    def validate_args(self, name: str, args: dict[str, Any]) -> None:
+        """Validates the arguments of a call of the tool named `name`.
+
+        Raises:
+            ToolNotFoundError: If no tool is named `name`.
+            pydantic.ValidationError: If the arguments are invalid.
+        """
+        self.get(name)
+        self._input_schemas[name].model_validate(args)
@@ -0,0 +1,218 @@
+import asyncio
+import threading
+import time
+import weakref
+from collections.abc import Awaitable, Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from contextvars import copy_context
+from dataclasses import dataclass, field
+from functools import partial
+from typing import Any
+
+from ai_librarian_core.tools.delegating import DelegatingTool
+from ai_librarian_core.tools.health import CircuitBreakerTool
+from langchain_core.callbacks import AsyncCallbackManagerForToolRun, CallbackManagerForToolRun
+from langchain_core.tools import BaseTool
+from pydantic import ConfigDict, Field
+
+# Chromium-based NCL searches are the slowest and heaviest calls, keep them from taking every worker.
+DEFAULT_TOOL_CONCURRENCY_LIMITS: dict[str, int] = {"ncl_search": 4}
+
+
+@dataclass
+class ToolCallStats:
+    """The counters of the calls of one tool."""
+
+    waiting: int = 0
+    running: int = 0
+    calls: int = 0
+    total_wait_seconds: float = 0
+    max_wait_seconds: float = 0
+
+    def to_dict(self) -> dict[str, int | float]:
+        return {
+            "waiting": self.waiting,
+            "running": self.running,
+            "calls": self.calls,
+            "avg_wait_seconds": self.total_wait_seconds / self.calls if self.calls else 0.0,
+            "max_wait_seconds": self.max_wait_seconds,
+        }
+
+
+@dataclass
+class ToolScheduler:
+    """Bounds the number of concurrent calls of each tool, so one slow provider cannot starve the others.
+
+    Calls of a tool beyond its limit wait for a free slot. Tools without an async implementation run on a thread pool
+    of their own, sized to their limit, instead of the shared default executor of the event loop. Async calls are
+    bounded per event loop, sync calls across threads.
+
+    Attributes:
+        default_max_concurrency (int): The limit of the tools missing from `max_concurrency` (default: 8).
+        max_concurrency (dict[str, int]): The limit of each tool, by tool name (default:
+            `DEFAULT_TOOL_CONCURRENCY_LIMITS`).
+
+    Example:
+        >>> scheduler = ToolScheduler(max_concurrency={"ncl_search": 2})
+        >>> await scheduler.arun("ncl_search", lambda: ncl_search.arun("Python"))
+    """
+
+    default_max_concurrency: int = 8
+    max_concurrency: dict[str, int] = field(default_factory=lambda: dict(DEFAULT_TOOL_CONCURRENCY_LIMITS))
+
+    def __post_init__(self):
+        self._lock = threading.Lock()
+        self._async_semaphores: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, dict[str, asyncio.Semaphore]] = (
+            weakref.WeakKeyDictionary()
+        )
+        self._sync_semaphores: dict[str, threading.BoundedSemaphore] = {}
+        self._thread_pools: dict[str, ThreadPoolExecutor] = {}
+        self._stats: dict[str, ToolCallStats] = {}
+
+    def limit(self, tool_name: str) -> int:
+        return self.max_concurrency.get(tool_name, self.default_max_concurrency)
+
+    def _get_stats(self, tool_name: str) -> ToolCallStats:
+        with self._lock:
+            return self._stats.setdefault(tool_name, ToolCallStats())
+
+    def _async_semaphore(self, tool_name: str) -> asyncio.Semaphore:
+        with self._lock:
+            semaphores = self._async_semaphores.setdefault(asyncio.get_running_loop(), {})
+            if tool_name not in semaphores:
+                semaphores[tool_name] = asyncio.Semaphore(self.limit(tool_name))
+            return semaphores[tool_name]
+
+    def _sync_semaphore(self, tool_name: str) -> threading.BoundedSemaphore:
+        with self._lock:
+            if tool_name not in self._sync_semaphores:
+                self._sync_semaphores[tool_name] = threading.BoundedSemaphore(self.limit(tool_name))
+            return self._sync_semaphores[tool_name]
+
+    def _thread_pool(self, tool_name: str) -> ThreadPoolExecutor:
+        with self._lock:
+            if tool_name not in self._thread_pools:
+                self._thread_pools[tool_name] = ThreadPoolExecutor(
+                    max_workers=self.limit(tool_name), thread_name_prefix=f"tool-{tool_name}"
+                )
+            return self._thread_pools[tool_name]
+
+    @contextmanager
+    def _track(self, stats: ToolCallStats, queued_at: float) -> Iterator[None]:
+        wait_seconds = time.perf_counter() - queued_at
+        with self._lock:
+            stats.waiting -= 1
+            stats.running += 1
+            stats.calls += 1
+            stats.total_wait_seconds += wait_seconds
+            stats.max_wait_seconds = max(stats.max_wait_seconds, wait_seconds)
+        try:
+            yield
+        finally:
+            with self._lock:
+                stats.running -= 1
+
+    def _queue(self, tool_name: str) -> tuple[ToolCallStats, float]:
+        stats = self._get_stats(tool_name)
+        with self._lock:
+            stats.waiting += 1
+        return stats, time.perf_counter()
+
+    async def arun[T](self, tool_name: str, call: Callable[[], Awaitable[T]]) -> T:
+        """Awaits `call()` once the tool has a free slot."""
+        semaphore = self._async_semaphore(tool_name)
+        stats, queued_at = self._queue(tool_name)
+        try:
+            await semaphore.acquire()
+        except BaseException:
+            with self._lock:
+                stats.waiting -= 1
+            raise
+        try:
+            with self._track(stats, queued_at):
+                return await call()
+        finally:
+            semaphore.release()
+
+    async def arun_blocking[T](self, tool_name: str, call: Callable[[], T]) -> T:
+        """Runs the blocking `call()` on the thread pool of the tool once the tool has a free slot."""
+        loop = asyncio.get_running_loop()
+        return await self.arun(
+            tool_name, lambda: loop.run_in_executor(self._thread_pool(tool_name), partial(copy_context().run, call))
+        )
+
+    def run[T](self, tool_name: str, call: Callable[[], T]) -> T:
+        """Calls `call()` in the current thread once the tool has a free slot."""
+        stats, queued_at = self._queue(tool_name)
+        with self._sync_semaphore(tool_name):
+            with self._track(stats, queued_at):
+                return call()
+
+    def stats(self) -> dict[str, dict[str, int | float]]:
+        with self._lock:
+            return {tool_name: stats.to_dict() for tool_name, stats in self._stats.items()}
+
+    def shutdown(self) -> None:
+        """Shuts the thread pools down, they are recreated on next use."""
+        with self._lock:
+            thread_pools, self._thread_pools = self._thread_pools, {}
+        for thread_pool in thread_pools.values():
+            thread_pool.shutdown(wait=False, cancel_futures=True)
+
+
+class ScheduledTool(DelegatingTool):
+    """A tool whose calls are bounded by a `ToolScheduler`.
+
+    Attributes:
+        tool (BaseTool): The wrapped tool.
+        scheduler (ToolScheduler | None): The scheduler of the calls. Falls back to the process-wide scheduler of
+            `get_tool_scheduler()` if None (default: None).
+    """
+
+    scheduler: ToolScheduler | None = Field(default=None, exclude=True)
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    def _get_scheduler(self) -> ToolScheduler:
+        return self.scheduler or get_tool_scheduler()
+
+    def _run(self, *args: Any, run_manager: CallbackManagerForToolRun | None = None, **kwargs: Any) -> Any:
+        return self._get_scheduler().run(self.name, lambda: self._call_tool(args, kwargs, run_manager))
+
+    async def _arun(self, *args: Any, run_manager: AsyncCallbackManagerForToolRun | None = None, **kwargs: Any) -> Any:
+        if _is_sync_only(self.tool):
+            sync_run_manager = run_manager.get_sync() if run_manager is not None else None
+            return await self._get_scheduler().arun_blocking(
+                self.name, lambda: self._call_tool(args, kwargs, sync_run_manager)
+            )
+        return await self._get_scheduler().arun(self.name, lambda: self._acall_tool(args, kwargs, run_manager))
+
+
+def _is_sync_only(tool: BaseTool) -> bool:
+    # Sees through the circuit breakers, which are scheduled around the tools they guard.
+    while isinstance(tool, CircuitBreakerTool):
+        tool = tool.tool
+    return type(tool)._arun is BaseTool._arun
+
+
+def schedule_tools(tools: list[BaseTool], scheduler: ToolScheduler | None = None) -> list[BaseTool]:
+    """Wraps the tools with `ScheduledTool`."""
+    return [ScheduledTool.wrap(tool, scheduler=scheduler) for tool in tools]
+
+
+_scheduler: ToolScheduler | None = None
+
+
+def get_tool_scheduler() -> ToolScheduler:
+    """Returns the process-wide tool scheduler, creating one with the default limits if none is set."""
+    global _scheduler
+    if _scheduler is None:
+        _scheduler = ToolScheduler()
+    return _scheduler
+
+
+def set_tool_scheduler(scheduler: ToolScheduler) -> None:
+    """Replaces the process-wide tool scheduler. The previous scheduler is not shut down."""
+    global _scheduler
+    _scheduler = scheduler
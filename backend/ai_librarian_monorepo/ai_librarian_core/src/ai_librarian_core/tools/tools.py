@@ -1,9 +1,28 @@
+import os
+from collections.abc import Callable
+
+from ai_librarian_core.tools.cached import DEFAULT_TOOL_CACHE_POLICIES, ToolCachePolicy, with_cache
 from ai_librarian_core.tools.date_time import DateTimeTool
 from ai_librarian_core.tools.google_books import GoogleBooksQueryRun
-from ai_librarian_core.tools.google_search import SchemaedGoogleSearchRun
+from ai_librarian_core.tools.google_search import (
+    GOOGLE_SEARCH_DESCRIPTION,
+    GOOGLE_SEARCH_NAME,
+    GoogleSearchInput,
+    create_google_search_run,
+)
+from ai_librarian_core.tools.health import CircuitBreakerTool, ToolHealth
+from ai_librarian_core.tools.lazy import LazyTool
 from ai_librarian_core.tools.ncl_search import NCLSearchRun
 from ai_librarian_core.tools.open_weather_map import SchemaedOpenWeatherMapQueryRun
+from ai_librarian_core.tools.scheduler import ScheduledTool, ToolScheduler
 from ai_librarian_core.tools.youtube import SchemaedYouTubeSearchTool
+from ai_librarian_core.wrapper.google_books import GoogleBooksAPIWrapper
+from ai_librarian_core.wrapper.ncl_search import (
+    AsyncNCLSearch,
+    NCLCrawlerSearchNoResultsError,
+    NCLSearch,
+    NCLSearchEngine,
+)
 from langchain_community.tools import (
     ArxivQueryRun,
     DuckDuckGoSearchResults,
@@ -11,31 +30,87 @@ from langchain_community.tools import (
 from langchain_community.tools.wikipedia.tool import WikipediaQueryRun
 from langchain_community.utilities import WikipediaAPIWrapper
 from langchain_core.tools import BaseTool
-from langchain_google_community import GoogleSearchAPIWrapper
 from pydantic import ValidationError
 
+# Errors that are expected outcomes of a call rather than failures of the provider, such as a query without results or
+# invalid arguments (pydantic's `ValidationError` is a `ValueError`), so they do not open the circuit of the tool.
+DEFAULT_TOOL_IGNORED_ERRORS: dict[str, tuple[type[Exception], ...]] = {
+    "ncl_search": (NCLCrawlerSearchNoResultsError, ValueError),
+    "google_books": (ValueError,),
+}
+
+
+def _has_env(*names: str) -> bool:
+    return all(os.environ.get(name) for name in names)
+
+
+def get_built_in_tools(
+    ncl_search_engine: NCLSearchEngine = NCLSearchEngine.PLAYWRIGHT,
+    ncl_enrich_top_k: int = 0,
+    google_books_max_description_chars: int | None = None,
+    cache_policies: dict[str, ToolCachePolicy] | None = None,
+    scheduler: ToolScheduler | None = None,
+    health: ToolHealth | None = None,
+) -> list[BaseTool]:
+    """Returns the built-in tools, skipping the ones whose credentials are missing.
+
+    The tools backed by third-party clients are `LazyTool`s, which import and create the clients on their first call
+    rather than here, to keep the startup of the workers fast. See `load_tools` to load them ahead of time.
+
+    The calls of every tool are bounded by `scheduler` (default: `get_tool_scheduler()` at call time). Tools with a
+    policy in `cache_policies` (default: `DEFAULT_TOOL_CACHE_POLICIES`) are wrapped with `CachedTool`, pass an empty
+    dict to disable caching. Cache hits do not wait for the scheduler.
+
+    Calls of a tool that keeps failing are refused by its circuit breaker in `health` (default: `get_tool_health()` at
+    call time), cache hits are still served. The errors of `DEFAULT_TOOL_IGNORED_ERRORS` do not count as failures.
+    """
+
+    def schedule(tool: BaseTool) -> BaseTool:
+        # The circuit breaker is inside the scheduler, so it times the calls but not their wait for a slot.
+        breaker_tool = CircuitBreakerTool.wrap(
+            tool, health=health, ignored_errors=DEFAULT_TOOL_IGNORED_ERRORS.get(tool.name, ())
+        )
+        return ScheduledTool.wrap(breaker_tool, scheduler=scheduler)
+
+    def lazy(tool_class: type[BaseTool], factory: Callable[[], BaseTool]) -> LazyTool:
+        # Scheduled once loaded, so the scheduler sees whether the tool is sync only and runs it on its own threads.
+        return LazyTool.from_class(tool_class, lambda: schedule(factory()))
 
-def get_built_in_tools() -> list[BaseTool]:
     tools = [
-        DateTimeTool(),
-        ArxivQueryRun(),
-        DuckDuckGoSearchResults(),
-        SchemaedYouTubeSearchTool(),
-        NCLSearchRun(),
-        WikipediaQueryRun(api_wrapper=WikipediaAPIWrapper()),
+        schedule(DateTimeTool()),
+        lazy(ArxivQueryRun, ArxivQueryRun),
+        # One result per paragraph, so truncated outputs keep the beginning of every result.
+        lazy(DuckDuckGoSearchResults, lambda: DuckDuckGoSearchResults(results_separator="\n\n")),
+        lazy(SchemaedYouTubeSearchTool, SchemaedYouTubeSearchTool),
+        schedule(
+            NCLSearchRun(
+                ncl_search=NCLSearch(engine=ncl_search_engine, enrich_top_k=ncl_enrich_top_k),
+                async_ncl_search=AsyncNCLSearch(engine=ncl_search_engine, enrich_top_k=ncl_enrich_top_k),
+            )
+        ),
+        lazy(WikipediaQueryRun, lambda: WikipediaQueryRun(api_wrapper=WikipediaAPIWrapper())),
     ]
 
+    if _has_env("GOOGLE_API_KEY", "GOOGLE_CSE_ID"):
+        tools.append(
+            LazyTool(
+                name=GOOGLE_SEARCH_NAME,
+                description=GOOGLE_SEARCH_DESCRIPTION,
+                args_schema=GoogleSearchInput,
+                factory=lambda: schedule(create_google_search_run()),
+            )
+        )
     try:
-        tools.append(SchemaedGoogleSearchRun(api_wrapper=GoogleSearchAPIWrapper()))
-    except ValidationError:
-        pass
-    try:
-        tools.append(GoogleBooksQueryRun())
-    except ValidationError:
-        pass
-    try:
-        tools.append(SchemaedOpenWeatherMapQueryRun())
+        tools.append(
+            schedule(
+                GoogleBooksQueryRun(
+                    api_wrapper=GoogleBooksAPIWrapper(max_description_chars=google_books_max_description_chars)
+                )
+            )
+        )
     except ValidationError:
         pass
+    if _has_env("OPENWEATHERMAP_API_KEY"):
+        tools.append(lazy(SchemaedOpenWeatherMapQueryRun, SchemaedOpenWeatherMapQueryRun))
 
-    return tools
+    return with_cache(tools, DEFAULT_TOOL_CACHE_POLICIES if cache_policies is None else cache_policies)
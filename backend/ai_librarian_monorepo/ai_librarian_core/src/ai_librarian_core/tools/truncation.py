@@ -0,0 +1,102 @@
+from dataclasses import dataclass, field
+
+from langchain_core.messages import ToolMessage
+
+# Search results are short, a few of them are enough to answer, unlike pages and book records.
+DEFAULT_TOOL_OUTPUT_LIMITS: dict[str, int] = {
+    "duckduckgo_results_json": 2000,
+    "google_search": 2000,
+    "youtube_search": 1000,
+}
+
+# The key of the untruncated content in the response metadata of a truncated `ToolMessage`.
+FULL_CONTENT_KEY = "full_content"
+
+BLOCK_SEPARATOR = "\n\n"
+# Blocks are dropped rather than truncated shorter than this.
+MIN_BLOCK_CHARS = 200
+
+
+def _truncate_block(block: str, max_chars: int) -> str:
+    if len(block) <= max_chars:
+        return block
+    truncated = block[: max_chars - 1]
+    # Cut at a word boundary, unless it would drop most of the block, e.g. in CJK text without spaces.
+    if (boundary := truncated.rfind(" ")) > max_chars // 2:
+        truncated = truncated[:boundary]
+    return f"{truncated.rstrip()}…"
+
+
+def truncate_text(text: str, max_chars: int) -> str:
+    """Shortens `text` to at most `max_chars` characters.
+
+    The text is split into blocks separated by blank lines, e.g. the results of a search or the pages of Wikipedia.
+    Every block keeps its beginning, where titles and summaries are, so later results are shortened rather than lost:
+    the shortest blocks are kept whole and the rest of the budget is shared by the longer ones. Blocks that would be
+    shortened below `MIN_BLOCK_CHARS` are dropped from the end instead.
+
+    Example:
+        >>> truncate_text(wikipedia.run("Python"), max_chars=1000)  # Every page keeps its title and summary start
+    """
+    if len(text) <= max_chars:
+        return text
+
+    blocks = text.split(BLOCK_SEPARATOR)
+    kept_count = max(1, min(len(blocks), max_chars // (MIN_BLOCK_CHARS + len(BLOCK_SEPARATOR))))
+    kept_blocks, dropped_count = blocks[:kept_count], len(blocks) - kept_count
+    omitted_notice = f"{BLOCK_SEPARATOR}[{dropped_count} more results omitted]" if dropped_count else ""
+    budget = max(max_chars - len(BLOCK_SEPARATOR) * (kept_count - 1) - len(omitted_notice), kept_count)
+
+    max_block_chars: dict[int, int] = {}
+    for position, index in enumerate(sorted(range(kept_count), key=lambda i: len(kept_blocks[i]))):
+        max_block_chars[index] = min(len(kept_blocks[index]), budget // (kept_count - position))
+        budget -= max_block_chars[index]
+
+    truncated = BLOCK_SEPARATOR.join(
+        _truncate_block(block, max_block_chars[index]) for index, block in enumerate(kept_blocks)
+    )
+    return truncated + omitted_notice
+
+
+def get_full_content(message: ToolMessage) -> str | list[str | dict]:
+    """Returns the content of a tool message before it was truncated by `ToolOutputLimits`."""
+    return message.response_metadata.get(FULL_CONTENT_KEY, message.content)
+
+
+@dataclass
+class ToolOutputLimits:
+    """Limits the length of the tool outputs sent to the chat model.
+
+    Tool outputs are sent to the chat model again on every later step of the conversation, long search results and
+    pages make every call slower and more expensive. Truncated tool messages keep their full content in their response
+    metadata, which is not sent to the chat model, see `get_full_content`.
+
+    Attributes:
+        default_max_chars (int | None): The limit of the tools missing from `max_chars`, in characters, no limit if None
+            (default: 4000).
+        max_chars (dict[str, int]): The limit of each tool, by tool name (default: `DEFAULT_TOOL_OUTPUT_LIMITS`).
+
+    Example:
+        >>> limits = ToolOutputLimits(max_chars={"wikipedia": 2000})
+        >>> limits.truncate(ToolMessage(content=page, name="wikipedia", tool_call_id="call-1"))
+    """
+
+    default_max_chars: int | None = 4000
+    max_chars: dict[str, int] = field(default_factory=lambda: dict(DEFAULT_TOOL_OUTPUT_LIMITS))
+
+    def limit(self, tool_name: str | None) -> int | None:
+        if tool_name is None:
+            return self.default_max_chars
+        return self.max_chars.get(tool_name, self.default_max_chars)
+
+    def truncate(self, message: ToolMessage) -> ToolMessage:
+        """Returns the message with its content truncated to the limit of its tool, or the message if it fits."""
+        max_chars = self.limit(message.name)
+        if max_chars is None or not isinstance(message.content, str) or len(message.content) <= max_chars:
+            return message
+        return message.model_copy(
+            update={
+                "content": truncate_text(message.content, max_chars),
+                "response_metadata": {**message.response_metadata, FULL_CONTENT_KEY: message.content},
+            }
+        )
@@ -0,0 +1,113 @@
+import asyncio
+import atexit
+import logging
+import threading
+from collections.abc import Awaitable, Callable, Coroutine
+from dataclasses import dataclass
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+
+def run_blocking[T](
+    coroutine: Coroutine[Any, Any, T], loop: asyncio.AbstractEventLoop, timeout: float | None = None
+) -> T:
+    """Runs a coroutine on a loop running in another thread and blocks until it returns, or `timeout` seconds pass.
+
+    Raises:
+        RuntimeError: If called from the thread of `loop`, which would deadlock.
+    """
+    try:
+        running_loop = asyncio.get_running_loop()
+    except RuntimeError:
+        running_loop = None
+    if running_loop is loop:
+        coroutine.close()
+        raise RuntimeError("Cannot block on an event loop from its own thread, await the coroutine instead.")
+
+    future = asyncio.run_coroutine_threadsafe(coroutine, loop)
+    try:
+        return future.result(timeout)
+    except TimeoutError:
+        future.cancel()
+        raise
+
+
+@dataclass
+class BackgroundEventLoop:
+    """An event loop running forever in a daemon thread, so sync code can share resources bound to a loop.
+
+    The loop and its thread are started on first use. `stop()` awaits the registered shutdown callbacks on the loop
+    before stopping it, the process-wide loop returned by `get_background_loop()` is stopped at exit.
+
+    Attributes:
+        name (str): The name of the thread running the loop (default: "ai-librarian-background-loop").
+
+    Example:
+        >>> background_loop = BackgroundEventLoop()
+        >>> background_loop.run(asyncio.sleep(1, result="done"))
+        'done'
+        >>> background_loop.stop()
+    """
+
+    name: str = "ai-librarian-background-loop"
+
+    def __post_init__(self):
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._thread: threading.Thread | None = None
+        self._lock = threading.Lock()
+        self._shutdown_callbacks: list[Callable[[], Awaitable[None]]] = []
+
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop:
+        """The running background loop, started if needed."""
+        with self._lock:
+            if self._loop is None or self._loop.is_closed():
+                loop = asyncio.new_event_loop()
+                started = threading.Event()
+                loop.call_soon(started.set)
+                self._thread = threading.Thread(target=loop.run_forever, name=self.name, daemon=True)
+                self._thread.start()
+                started.wait()
+                self._loop = loop
+            return self._loop
+
+    def run[T](self, coroutine: Coroutine[Any, Any, T], timeout: float | None = None) -> T:
+        """Runs a coroutine on the background loop and blocks until it returns, or until `timeout` seconds pass."""
+        return run_blocking(coroutine, self.loop, timeout)
+
+    def on_shutdown(self, callback: Callable[[], Awaitable[None]]) -> None:
+        """Registers a coroutine function awaited on the loop when it is stopped, e.g. to close its pools."""
+        self._shutdown_callbacks.append(callback)
+
+    def stop(self) -> None:
+        """Awaits the shutdown callbacks, then stops and closes the loop. The loop restarts on next use."""
+        with self._lock:
+            loop, thread = self._loop, self._thread
+            self._loop = self._thread = None
+        if loop is None or thread is None or loop.is_closed():
+            return
+
+        async def shutdown() -> None:
+            for callback in self._shutdown_callbacks:
+                try:
+                    await callback()
+                except Exception:
+                    logger.warning("A shutdown callback of the background event loop failed.", exc_info=True)
+
+        asyncio.run_coroutine_threadsafe(shutdown(), loop).result()
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join()
+        loop.close()
+
+
+_background_loop: BackgroundEventLoop | None = None
+
+
+def get_background_loop() -> BackgroundEventLoop:
+    """Returns the process-wide background event loop, which is stopped at exit."""
+    global _background_loop
+    if _background_loop is None:
+        _background_loop = BackgroundEventLoop()
+        atexit.register(_background_loop.stop)
+    return _background_loop
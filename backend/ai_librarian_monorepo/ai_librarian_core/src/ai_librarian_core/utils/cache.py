@@ -0,0 +1,322 @@
+import asyncio
+import json
+import logging
+import sqlite3
+import threading
+import time
+from collections import Counter, OrderedDict
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+
+class CachedError(Exception):
+    """Raised for a cached failure whose original exception type is not known to the caller."""
+
+
+@dataclass
+class CacheEntry:
+    """A cached value, or a cached failure if `error` is set."""
+
+    value: Any = None
+    error: str | None = None
+    error_type: str | None = None
+    stored_at: float = field(default_factory=time.time)
+
+    @property
+    def age(self) -> float:
+        return time.time() - self.stored_at
+
+    def unwrap(self, error_types: tuple[type[Exception], ...] = ()) -> Any:
+        """Returns the cached value, or raises the cached failure."""
+        if self.error is None:
+            return self.value
+        error_type = next((t for t in error_types if t.__name__ == self.error_type), CachedError)
+        raise error_type(self.error)
+
+
+@dataclass
+class TTLCache:
+    """A two-tier TTL cache: an in-memory LRU backed by an optional SQLite file that survives restarts.
+
+    An entry is fresh for `ttl` seconds (`negative_ttl` for cached failures). For another `stale_ttl` seconds it is
+    stale: `aget_or_fetch` still answers with it and refreshes it in the background (stale-while-revalidate).
+    Values must be JSON serializable to be stored on disk.
+
+    Attributes:
+        ttl (float): The number of seconds an entry is fresh (default: 3600).
+        stale_ttl (float): The number of seconds an entry is served stale after `ttl` (default: 86400).
+        negative_ttl (float): The number of seconds a cached failure is fresh (default: 300).
+        max_entries (int): The maximum number of entries kept in memory (default: 1024).
+        path (Path | None): The SQLite file of the disk tier. The disk tier is disabled if None (default: None).
+        namespace (str): Separates the entries of caches sharing the same SQLite file (default: "default").
+
+    Example:
+        >>> cache = TTLCache(ttl=600, path=Path("cache/tools.sqlite3"), namespace="ncl_search")
+        >>> await cache.aget_or_fetch("python", lambda: search("python"))
+    """
+
+    ttl: float = 3600
+    stale_ttl: float = 86400
+    negative_ttl: float = 300
+    max_entries: int = 1024
+    path: Path | None = None
+    namespace: str = "default"
+
+    def __post_init__(self):
+        self._memory: OrderedDict[str, CacheEntry] = OrderedDict()
+        self._connection: sqlite3.Connection | None = None
+        self._memory_lock = threading.Lock()
+        self._disk_lock = threading.Lock()
+        self._revalidations: dict[str, asyncio.Task] = {}
+        self._stats_lock = threading.Lock()
+        # Counts of hits, stale_hits, misses, revalidations and evictions.
+        self._counts: Counter[str] = Counter()
+
+    def _count(self, *counters: str) -> None:
+        with self._stats_lock:
+            self._counts.update(counters)
+
+    def _fresh_for(self, entry: CacheEntry) -> float:
+        return self.negative_ttl if entry.error is not None else self.ttl
+
+    def is_fresh(self, entry: CacheEntry) -> bool:
+        return entry.age < self._fresh_for(entry)
+
+    def _is_servable(self, entry: CacheEntry) -> bool:
+        return entry.age < self._fresh_for(entry) + self.stale_ttl
+
+    def _remember(self, key: str, entry: CacheEntry) -> None:
+        with self._memory_lock:
+            self._memory[key] = entry
+            self._memory.move_to_end(key)
+            while len(self._memory) > self.max_entries:
+                self._memory.popitem(last=False)
+                self._count("evictions")
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._connection is None:
+            if self.path is None:
+                raise ValueError("The cache has no disk tier.")
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            connection = sqlite3.connect(self.path, check_same_thread=False)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS cache_entries ("
+                "namespace TEXT NOT NULL, key TEXT NOT NULL, value TEXT, error TEXT, error_type TEXT, "
+                "stored_at REAL NOT NULL, PRIMARY KEY (namespace, key))"
+            )
+            oldest = time.time() - max(self.ttl, self.negative_ttl) - self.stale_ttl
+            connection.execute(
+                "DELETE FROM cache_entries WHERE namespace = ? AND stored_at < ?", (self.namespace, oldest)
+            )
+            connection.commit()
+            self._connection = connection
+        return self._connection
+
+    def _disk_get(self, key: str) -> CacheEntry | None:
+        with self._disk_lock:
+            row = (
+                self._connect()
+                .execute(
+                    "SELECT value, error, error_type, stored_at FROM cache_entries WHERE namespace = ? AND key = ?",
+                    (self.namespace, key),
+                )
+                .fetchone()
+            )
+        if row is None:
+            return None
+        value, error, error_type, stored_at = row
+        return CacheEntry(value=json.loads(value), error=error, error_type=error_type, stored_at=stored_at)
+
+    def _disk_set(self, key: str, entry: CacheEntry) -> None:
+        with self._disk_lock:
+            connection = self._connect()
+            connection.execute(
+                "INSERT OR REPLACE INTO cache_entries VALUES (?, ?, ?, ?, ?, ?)",
+                (self.namespace, key, json.dumps(entry.value), entry.error, entry.error_type, entry.stored_at),
+            )
+            connection.commit()
+
+    def _disk_clear(self) -> None:
+        with self._disk_lock:
+            connection = self._connect()
+            connection.execute("DELETE FROM cache_entries WHERE namespace = ?", (self.namespace,))
+            connection.commit()
+
+    def get(self, key: str) -> CacheEntry | None:
+        """Returns the servable entry of `key`, looking it up on disk if it is not in memory."""
+        entry = self._memory.get(key)
+        if entry is None and self.path is not None:
+            entry = self._disk_get(key)
+        if entry is None or not self._is_servable(entry):
+            with self._memory_lock:
+                self._memory.pop(key, None)
+            return None
+        self._remember(key, entry)
+        return entry
+
+    def set(self, key: str, entry: CacheEntry) -> None:
+        self._remember(key, entry)
+        if self.path is not None:
+            self._disk_set(key, entry)
+
+    async def aget(self, key: str) -> CacheEntry | None:
+        if key in self._memory or self.path is None:
+            return self.get(key)
+        return await asyncio.to_thread(self.get, key)
+
+    async def aset(self, key: str, entry: CacheEntry) -> None:
+        if self.path is None:
+            self.set(key, entry)
+        else:
+            await asyncio.to_thread(self.set, key, entry)
+
+    def clear(self) -> None:
+        with self._memory_lock:
+            self._memory.clear()
+        if self.path is not None:
+            self._disk_clear()
+
+    def close(self) -> None:
+        with self._disk_lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+    def _fetch_and_store(self, key: str, fetch: Callable[[], Any], error_types: tuple[type[Exception], ...]) -> Any:
+        try:
+            value = fetch()
+        except error_types as e:
+            self.set(key, CacheEntry(error=str(e), error_type=type(e).__name__))
+            raise
+        self.set(key, CacheEntry(value=value))
+        return value
+
+    def get_or_fetch(self, key: str, fetch: Callable[[], Any], error_types: tuple[type[Exception], ...] = ()) -> Any:
+        """Returns the cached value of `key`, or fetches and caches it.
+
+        Failures of one of `error_types` are cached as well and raised again on hits. Without an event loop to
+        refresh in the background, a stale entry is refreshed inline and only served if the refresh fails.
+        """
+        entry = self.get(key)
+        if entry is not None and self.is_fresh(entry):
+            self._count("hits")
+            return entry.unwrap(error_types)
+        self._count("misses")
+        try:
+            return self._fetch_and_store(key, fetch, error_types)
+        except error_types:
+            raise
+        except Exception:
+            if entry is None:
+                raise
+            logger.warning(f"Failed to refresh cache entry {key!r}, serving the stale entry.", exc_info=True)
+            self._count("stale_hits")
+            return entry.unwrap(error_types)
+
+    def _revalidated(self, entry: CacheEntry | None, new_entry: CacheEntry | None) -> CacheEntry:
+        if new_entry is not None:
+            self._count("misses")
+            return new_entry
+        if entry is None:
+            raise ValueError("The revalidation kept an entry that does not exist.")
+        self._count("stale_hits", "revalidations")
+        return CacheEntry(value=entry.value, error=entry.error, error_type=entry.error_type)
+
+    def get_or_revalidate(self, key: str, revalidate: Callable[[CacheEntry | None], CacheEntry | None]) -> CacheEntry:
+        """Returns the fresh entry of `key`, or revalidates it with a conditional request, e.g. on its ETag.
+
+        `revalidate` is called with the stale entry (None if there is none) and returns the new entry, or None if the
+        stale entry is still valid, e.g. the server answered 304 Not Modified, in which case it is stored again as
+        fresh. It must not return None without a stale entry.
+        """
+        entry = self.get(key)
+        if entry is not None and self.is_fresh(entry):
+            self._count("hits")
+            return entry
+        new_entry = self._revalidated(entry, revalidate(entry))
+        self.set(key, new_entry)
+        return new_entry
+
+    async def aget_or_revalidate(
+        self, key: str, revalidate: Callable[[CacheEntry | None], Awaitable[CacheEntry | None]]
+    ) -> CacheEntry:
+        """Like `get_or_revalidate`, with an async `revalidate`."""
+        entry = await self.aget(key)
+        if entry is not None and self.is_fresh(entry):
+            self._count("hits")
+            return entry
+        new_entry = self._revalidated(entry, await revalidate(entry))
+        await self.aset(key, new_entry)
+        return new_entry
+
+    async def _afetch_and_store(
+        self, key: str, fetch: Callable[[], Awaitable[Any]], error_types: tuple[type[Exception], ...]
+    ) -> Any:
+        try:
+            value = await fetch()
+        except error_types as e:
+            await self.aset(key, CacheEntry(error=str(e), error_type=type(e).__name__))
+            raise
+        await self.aset(key, CacheEntry(value=value))
+        return value
+
+    async def _arevalidate(
+        self, key: str, fetch: Callable[[], Awaitable[Any]], error_types: tuple[type[Exception], ...]
+    ) -> None:
+        try:
+            await self._afetch_and_store(key, fetch, error_types)
+        except error_types:
+            pass
+        except Exception:
+            logger.warning(f"Failed to revalidate cache entry {key!r}.", exc_info=True)
+        finally:
+            self._revalidations.pop(key, None)
+
+    async def aget_or_fetch(
+        self,
+        key: str,
+        fetch: Callable[[], Awaitable[Any]],
+        error_types: tuple[type[Exception], ...] = (),
+        background_fetch: Callable[[], Awaitable[Any]] | None = None,
+    ) -> Any:
+        """Returns the cached value of `key`, or fetches and caches it.
+
+        Failures of one of `error_types` are cached as well and raised again on hits. A stale entry is served
+        immediately while a single background task per key refreshes it with `background_fetch`, or `fetch` if it is
+        None. The refresh outlives the call, so `background_fetch` is needed if `fetch` uses resources of the caller.
+        """
+        entry = await self.aget(key)
+        if entry is None:
+            self._count("misses")
+            return await self._afetch_and_store(key, fetch, error_types)
+        if self.is_fresh(entry):
+            self._count("hits")
+        else:
+            self._count("stale_hits")
+            if key not in self._revalidations:
+                self._count("revalidations")
+                self._revalidations[key] = asyncio.create_task(
+                    self._arevalidate(key, background_fetch or fetch, error_types)
+                )
+        return entry.unwrap(error_types)
+
+    def stats(self) -> dict[str, int | float]:
+        with self._stats_lock:
+            counts = self._counts.copy()
+        # Revalidations refresh entries that were looked up as stale hits, they are not lookups of their own.
+        lookups = counts["hits"] + counts["stale_hits"] + counts["misses"]
+        return {
+            "entries": len(self._memory),
+            "hits": counts["hits"],
+            "stale_hits": counts["stale_hits"],
+            "revalidations": counts["revalidations"],
+            "misses": counts["misses"],
+            "evictions": counts["evictions"],
+            "hit_rate": (lookups - counts["misses"]) / lookups if lookups else 0.0,
+        }
@@ -0,0 +1,215 @@
+import logging
+import threading
+from collections import OrderedDict
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from typing import Any
+
+import httpx
+from ai_librarian_core.models.llm_config import LLMConfig
+from langchain.chat_models import init_chat_model
+from langchain.chat_models.base import BaseChatModel
+from langchain_core.language_models import LanguageModelInput
+from langchain_core.messages import BaseMessage
+from langchain_core.runnables import Runnable
+from langchain_core.tools import BaseTool
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class ProviderHTTP:
+    """How the chat models of a provider take the HTTP clients they send their requests with.
+
+    Attributes:
+        client_param (str): The parameter of the chat model taking an `httpx.Client`.
+        async_client_param (str): The parameter of the chat model taking an `httpx.AsyncClient`.
+        base_url (str): The API the connections are pre-opened to.
+    """
+
+    client_param: str
+    async_client_param: str
+    base_url: str
+
+
+# The providers whose chat models take their HTTP clients as parameters. The others create their own clients.
+PROVIDER_HTTP: dict[str, ProviderHTTP] = {
+    "openai": ProviderHTTP("http_client", "http_async_client", "https://api.openai.com/v1"),
+    "groq": ProviderHTTP("http_client", "http_async_client", "https://api.groq.com"),
+}
+
+
+def get_provider(llm_config: LLMConfig) -> str | None:
+    """Returns the provider of the model of `llm_config`, e.g. "openai" for "openai:gpt-4o-mini"."""
+    provider, separator, _ = str(llm_config.model).partition(":")
+    return provider if separator else None
+
+
+@dataclass
+class _CachedChatModel:
+    model: BaseChatModel
+    # The model with tools bound, by tool names, used last at the end.
+    with_tools: OrderedDict[tuple[str, ...], Runnable[LanguageModelInput, BaseMessage]] = field(
+        default_factory=OrderedDict
+    )
+
+
+@dataclass
+class ChatModelCache:
+    """An LRU cache of the chat models by config, whose models share one HTTP connection pool per provider.
+
+    Every temperature or `max_tokens` a client sends is a config of its own, so the cache is bounded to the
+    `max_entries` configs used last. The models of a provider listed in `PROVIDER_HTTP` are created with the shared
+    HTTP clients of the cache, so new configs reuse the open connections instead of opening a pool of their own. Tools
+    are bound once per model and set of tools, and the `max_tool_bindings` sets used last are kept, as the tools offered
+    to the model change while their circuit breakers open and close.
+
+    Chat models hold the async client of their provider, which belongs to the event loop it is first used in, so the
+    cache is meant to be used from a single event loop.
+
+    Attributes:
+        max_entries (int): The maximum number of configs whose models are kept (default: 32).
+        max_tool_bindings (int): The maximum number of sets of tools bound to each model that are kept (default: 4).
+        share_http_clients (bool): Whether to create the models with the shared HTTP clients (default: True).
+        max_connections (int): The maximum number of connections of each provider (default: 100).
+        keepalive_expiry (float): The number of seconds idle connections are kept open (default: 30).
+
+    Example:
+        >>> cache = ChatModelCache(max_entries=8)
+        >>> llm = cache.get(LLMConfig(model=Model.OPENAI_GPT_4O_MINI, temperature=0.2), tools=tools)
+        >>> await cache.apreconnect([LLMConfig()])
+    """
+
+    max_entries: int = 32
+    max_tool_bindings: int = 4
+    share_http_clients: bool = True
+    max_connections: int = 100
+    keepalive_expiry: float = 30
+
+    def __post_init__(self):
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[LLMConfig, _CachedChatModel] = OrderedDict()
+        self._http_clients: dict[str, tuple[httpx.Client, httpx.AsyncClient]] = {}
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def _get_http_clients(self, provider: str) -> tuple[httpx.Client, httpx.AsyncClient]:
+        with self._lock:
+            if provider not in self._http_clients:
+                limits = httpx.Limits(
+                    max_connections=self.max_connections,
+                    max_keepalive_connections=self.max_connections,
+                    keepalive_expiry=self.keepalive_expiry,
+                )
+                self._http_clients[provider] = (
+                    httpx.Client(limits=limits, follow_redirects=True),
+                    httpx.AsyncClient(limits=limits, follow_redirects=True),
+                )
+            return self._http_clients[provider]
+
+    def _get_http_client_kwargs(self, llm_config: LLMConfig) -> dict[str, Any]:
+        provider = get_provider(llm_config)
+        if not self.share_http_clients or provider is None or provider not in PROVIDER_HTTP:
+            return {}
+        provider_http = PROVIDER_HTTP[provider]
+        client, async_client = self._get_http_clients(provider)
+        return {provider_http.client_param: client, provider_http.async_client_param: async_client}
+
+    def _get_entry(self, llm_config: LLMConfig) -> _CachedChatModel:
+        with self._lock:
+            entry = self._entries.get(llm_config)
+            if entry is not None:
+                self._entries.move_to_end(llm_config)
+                self.hits += 1
+                return entry
+        model = init_chat_model(
+            model=llm_config.model,
+            temperature=llm_config.temperature,
+            max_tokens=llm_config.max_tokens,
+            **self._get_http_client_kwargs(llm_config),
+        )
+        with self._lock:
+            self.misses += 1
+            entry = self._entries.setdefault(llm_config, _CachedChatModel(model))
+            self._entries.move_to_end(llm_config)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+        return entry
+
+    def get_model(self, llm_config: LLMConfig) -> BaseChatModel:
+        """Returns the chat model of `llm_config` without tools, creating it if it is not cached.
+
+        Raises:
+            ValueError: If the provider of the model cannot be inferred or is not supported.
+            ImportError: If the integration package of the provider is not installed.
+        """
+        return self._get_entry(llm_config).model
+
+    def get(
+        self, llm_config: LLMConfig, tools: list[BaseTool] | None = None
+    ) -> Runnable[LanguageModelInput, BaseMessage]:
+        """Returns the chat model of `llm_config` with `tools` bound, creating it if it is not cached.
+
+        Raises:
+            ValueError: If the provider of the model cannot be inferred or is not supported.
+            ImportError: If the integration package of the provider is not installed.
+        """
+        entry = self._get_entry(llm_config)
+        if not tools:
+            return entry.model
+        tool_names = tuple(tool.name for tool in tools)
+        with self._lock:
+            model_with_tools = entry.with_tools.get(tool_names)
+            if model_with_tools is not None:
+                entry.with_tools.move_to_end(tool_names)
+                return model_with_tools
+        model_with_tools = entry.model.bind_tools(tools)
+        with self._lock:
+            model_with_tools = entry.with_tools.setdefault(tool_names, model_with_tools)
+            entry.with_tools.move_to_end(tool_names)
+            while len(entry.with_tools) > self.max_tool_bindings:
+                entry.with_tools.popitem(last=False)
+        return model_with_tools
+
+    async def apreconnect(self, llm_configs: Iterable[LLMConfig]) -> None:
+        """Opens a connection to the API of the providers of `llm_configs`, so the first requests skip the handshakes.
+
+        Only for the providers listed in `PROVIDER_HTTP`. Failures are logged and skipped.
+        """
+        if not self.share_http_clients:
+            return
+        providers = {provider for llm_config in llm_configs if (provider := get_provider(llm_config)) is not None}
+        for provider in providers & PROVIDER_HTTP.keys():
+            _, async_client = self._get_http_clients(provider)
+            try:
+                # Any answer will do, the connection stays in the pool of the client.
+                await async_client.head(PROVIDER_HTTP[provider].base_url)
+            except httpx.HTTPError as e:
+                logger.warning(f"Failed to pre-open a connection to {provider}: {e}")
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    async def aclose(self) -> None:
+        """Clears the cache and closes the HTTP clients, new clients are created on next use."""
+        with self._lock:
+            self._entries.clear()
+            http_clients, self._http_clients = self._http_clients, {}
+        for client, async_client in http_clients.values():
+            client.close()
+            await async_client.aclose()
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "models_with_tools": sum(len(entry.with_tools) for entry in self._entries.values()),
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "http_clients": len(self._http_clients),
+            }
@@ -0,0 +1,25 @@
+import time
+
+from langchain_core.runnables import RunnableConfig
+
+# The key of the deadline of a run in the "configurable" section of its config.
+DEADLINE_CONFIG_KEY = "deadline"
+
+
+def get_deadline(seconds: float | None) -> float | None:
+    """Returns the `time.monotonic()` deadline `seconds` from now, or None if `seconds` is None."""
+    return None if seconds is None else time.monotonic() + seconds
+
+
+def get_remaining_seconds(config: RunnableConfig | None) -> float | None:
+    """Returns the number of seconds left before the deadline of a run, or None if the run has no deadline.
+
+    Example:
+        >>> config = {"configurable": {DEADLINE_CONFIG_KEY: get_deadline(30)}}
+        >>> get_remaining_seconds(config)
+        29.99...
+    """
+    deadline = (config or {}).get("configurable", {}).get(DEADLINE_CONFIG_KEY)
+    if deadline is None:
+        return None
+    return max(deadline - time.monotonic(), 0.0)
@@ -0,0 +1,32 @@
+import asyncio
+import weakref
+from typing import Any
+
+import httpx
+
+# The shared clients of each event loop by name, dropped with their loop.
+_async_clients: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, dict[str, httpx.AsyncClient]] = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def get_async_client(name: str, **client_kwargs: Any) -> httpx.AsyncClient:
+    """Returns the shared `httpx.AsyncClient` registered under `name` for the running event loop.
+
+    The client is created with `client_kwargs` on first use, and recreated if it was closed. Each event loop has clients
+    of its own, since a connection pool cannot be shared across loops, so the clients of every loop stay registered
+    until `aclose_async_clients` closes them in that loop.
+    """
+    loop = asyncio.get_running_loop()
+    clients = _async_clients.setdefault(loop, {})
+    client = clients.get(name)
+    if client is None or client.is_closed:
+        client = clients[name] = httpx.AsyncClient(**client_kwargs)
+    return client
+
+
+async def aclose_async_clients() -> None:
+    """Closes every shared client that belongs to the running event loop."""
+    clients = _async_clients.pop(asyncio.get_running_loop(), {})
+    for client in clients.values():
+        await client.aclose()
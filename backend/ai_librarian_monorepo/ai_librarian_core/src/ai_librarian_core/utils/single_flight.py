@@ -0,0 +1,77 @@
+import asyncio
+import concurrent.futures
+import threading
+from collections.abc import Awaitable, Callable, Hashable
+from dataclasses import dataclass
+
+
+@dataclass
+class SingleFlight:
+    """Coalesces concurrent calls with the same key into a single call, whose result or exception they all share.
+
+    Only calls in flight at the same time are coalesced, nothing is kept once the call returns. Async calls are
+    coalesced per event loop, sync calls across threads.
+
+    Example:
+        >>> flights = SingleFlight()
+        >>> await asyncio.gather(*(flights.ado("python", lambda: search("python")) for _ in range(10)))  # 1 search
+    """
+
+    def __post_init__(self):
+        self._tasks: dict[tuple[asyncio.AbstractEventLoop, Hashable], asyncio.Task] = {}
+        self._futures: dict[Hashable, concurrent.futures.Future] = {}
+        self._lock = threading.Lock()
+        self.calls = 0
+        self.coalesced = 0
+
+    def _forget_task(self, flight_key: tuple[asyncio.AbstractEventLoop, Hashable], task: asyncio.Task) -> None:
+        if self._tasks.get(flight_key) is task:
+            del self._tasks[flight_key]
+        # The callers may all have been cancelled, retrieve the exception so it is not logged as never retrieved.
+        if not task.cancelled():
+            task.exception()
+
+    async def ado[T](self, key: Hashable, fetch: Callable[[], Awaitable[T]]) -> T:
+        """Awaits `fetch()`, or the call in flight with the same key. Cancelling a caller does not cancel the call."""
+        flight_key = (asyncio.get_running_loop(), key)
+        task = self._tasks.get(flight_key)
+        if task is None:
+            self.calls += 1
+            task = asyncio.ensure_future(fetch())
+            self._tasks[flight_key] = task
+            task.add_done_callback(lambda done: self._forget_task(flight_key, done))
+        else:
+            self.coalesced += 1
+        return await asyncio.shield(task)
+
+    def do[T](self, key: Hashable, fetch: Callable[[], T]) -> T:
+        """Calls `fetch()`, or blocks until the call in flight with the same key returns."""
+        with self._lock:
+            future = self._futures.get(key)
+            is_leader = future is None
+            if is_leader:
+                self.calls += 1
+                future = self._futures[key] = concurrent.futures.Future()
+            else:
+                self.coalesced += 1
+        if not is_leader:
+            return future.result()
+
+        try:
+            result = fetch()
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                self._futures.pop(key, None)
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "in_flight": len(self._tasks) + len(self._futures),
+            "calls": self.calls,
+            "coalesced": self.coalesced,
+        }
@@ -0,0 +1,260 @@
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import logging
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from playwright.async_api import Browser, Page, Playwright, Route
+
+logger = logging.getLogger(__name__)
+
+BLOCKED_RESOURCE_TYPES = frozenset({"image", "stylesheet", "font", "media"})
+BLOCKED_URL_KEYWORDS = ("google-analytics.com",)
+
+
+class BrowserPoolError(Exception):
+    pass
+
+
+class BrowserPoolClosedError(BrowserPoolError):
+    pass
+
+
+class BrowserPoolEventLoopError(BrowserPoolError):
+    pass
+
+
+async def _block_heavy_resources(route: Route) -> None:
+    request = route.request
+    if request.resource_type in BLOCKED_RESOURCE_TYPES or any(k in request.url for k in BLOCKED_URL_KEYWORDS):
+        await route.abort()
+    else:
+        await route.continue_()
+
+
+@dataclass
+class _PooledBrowser:
+    browser: Browser
+    uses: int = 0
+    leases: int = 0
+    retired: bool = False
+
+    @property
+    def healthy(self) -> bool:
+        return not self.retired and self.browser.is_connected()
+
+
+@dataclass
+class AsyncBrowserPool:
+    """A long-lived pool of headless Chromium browsers that crawlers lease pages from.
+
+    The pool starts one Playwright driver and `num_browsers` browsers, each serving up to
+    `contexts_per_browser` concurrent leases. Every lease gets a fresh browser context, so cookies never leak
+    between queries. A browser is recycled once it has served `max_uses_per_browser` leases or when it crashes.
+
+    The pool is bound to the event loop it was started on.
+
+    Attributes:
+        num_browsers (int): The number of browsers kept alive (default: 2).
+        contexts_per_browser (int): The maximum number of concurrent leases per browser (default: 4).
+        max_uses_per_browser (int): The number of leases after which a browser is recycled (default: 200).
+        headless (bool): Whether to launch the browsers in headless mode (default: True).
+
+    Example:
+        >>> pool = AsyncBrowserPool(num_browsers=1)
+        >>> await pool.start()
+        >>> async with pool.lease_page() as page:
+        ...     await page.goto("https://aleweb.ncl.edu.tw/F")
+        >>> await pool.close()
+    """
+
+    num_browsers: int = 2
+    contexts_per_browser: int = 4
+    max_uses_per_browser: int = 200
+    headless: bool = True
+
+    def __post_init__(self):
+        if self.num_browsers < 1 or self.contexts_per_browser < 1 or self.max_uses_per_browser < 1:
+            raise ValueError("num_browsers, contexts_per_browser and max_uses_per_browser must be positive.")
+        self._reset()
+
+    def _reset(self) -> None:
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._playwright: Playwright | None = None
+        self._driver_task: asyncio.Future[Playwright] | None = None
+        self._browsers: list[_PooledBrowser] = []
+        self._slots: asyncio.Semaphore | None = None
+        self._lock: asyncio.Lock | None = None
+        self._closed = False
+
+    @property
+    def started(self) -> bool:
+        return self._playwright is not None
+
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop | None:
+        """The event loop the pool is bound to, or None if the pool has not been used yet."""
+        return self._loop
+
+    def _bind_loop(self) -> tuple[asyncio.Lock, asyncio.Semaphore]:
+        """Binds the pool to the running event loop and returns its lock and lease slots."""
+        loop = asyncio.get_running_loop()
+        if self._loop is loop and self._lock is not None and self._slots is not None:
+            return self._lock, self._slots
+        if self._loop is not None and self._loop is not loop and not self._loop.is_closed():
+            raise BrowserPoolEventLoopError("The browser pool is already bound to another running event loop.")
+        # The previous loop is gone together with its driver, start over on the current one.
+        self._reset()
+        self._loop = loop
+        self._lock = lock = asyncio.Lock()
+        self._slots = slots = asyncio.Semaphore(self.num_browsers * self.contexts_per_browser)
+        return lock, slots
+
+    async def start(self) -> None:
+        """Starts the Playwright driver and launches the browsers. Calling it again is a no-op."""
+        lock, _ = self._bind_loop()
+        if self._closed:
+            raise BrowserPoolClosedError("The browser pool has been closed.")
+        async with lock:
+            playwright = self._playwright
+            if playwright is None:
+                playwright = self._playwright = await self._start_driver()
+            await self._fill(playwright)
+
+    async def _start_driver(self) -> Playwright:
+        # Playwright is imported on first start, so that importing the pool stays cheap.
+        from playwright.async_api import async_playwright
+
+        # Cancelling the driver while it boots leaves it hanging, so the boot is shielded from the caller.
+        if self._driver_task is None:
+            self._driver_task = asyncio.ensure_future(async_playwright().start())
+        try:
+            return await asyncio.shield(self._driver_task)
+        except Exception:
+            self._driver_task = None
+            raise
+
+    async def close(self) -> None:
+        """Closes every browser and stops the Playwright driver."""
+        if self._lock is None:
+            self._closed = True
+            return
+        async with self._lock:
+            self._closed = True
+            browsers, self._browsers = self._browsers, []
+            for pooled in browsers:
+                await self._close_browser(pooled)
+            if self._playwright is None and self._driver_task is not None:
+                with contextlib.suppress(Exception):
+                    self._playwright = await self._driver_task
+            if self._playwright is not None:
+                await self._playwright.stop()
+                self._playwright = None
+
+    async def _launch(self, playwright: Playwright) -> _PooledBrowser:
+        browser = await playwright.chromium.launch(headless=self.headless)
+        pooled = _PooledBrowser(browser=browser)
+        browser.on("disconnected", lambda _: setattr(pooled, "retired", True))
+        return pooled
+
+    async def _close_browser(self, pooled: _PooledBrowser) -> None:
+        from playwright.async_api import Error as PlaywrightError
+
+        pooled.retired = True
+        if pooled.browser.is_connected():
+            try:
+                await pooled.browser.close()
+            except PlaywrightError:
+                logger.warning("Failed to close a pooled browser.", exc_info=True)
+
+    async def _fill(self, playwright: Playwright) -> None:
+        """Drops idle unhealthy browsers and launches replacements. Must be called with the lock held."""
+        for pooled in [b for b in self._browsers if not b.healthy and b.leases == 0]:
+            self._browsers.remove(pooled)
+            await self._close_browser(pooled)
+        while sum(b.healthy for b in self._browsers) < self.num_browsers:
+            self._browsers.append(await self._launch(playwright))
+
+    async def _acquire(self) -> _PooledBrowser:
+        lock, _ = self._bind_loop()
+        async with lock:
+            playwright = self._playwright
+            if self._closed or playwright is None:
+                raise BrowserPoolClosedError("The browser pool has been closed.")
+            await self._fill(playwright)
+            pooled = min((b for b in self._browsers if b.healthy), key=lambda b: b.leases)
+            pooled.leases += 1
+            pooled.uses += 1
+            if pooled.uses >= self.max_uses_per_browser:
+                # Let the in-flight leases finish, the browser is replaced once it becomes idle.
+                pooled.retired = True
+            return pooled
+
+    async def _release(self, pooled: _PooledBrowser) -> None:
+        lock, _ = self._bind_loop()
+        async with lock:
+            pooled.leases -= 1
+            if pooled.leases == 0 and not pooled.healthy and pooled in self._browsers:
+                self._browsers.remove(pooled)
+                await self._close_browser(pooled)
+
+    @asynccontextmanager
+    async def lease_page(self) -> AsyncIterator[Page]:
+        """Leases a page in a fresh browser context, starting the pool if needed.
+
+        Heavy resources (images, stylesheets, fonts, media) and analytics requests are blocked on the page.
+        The context is closed when the lease ends.
+        """
+        from playwright.async_api import Error as PlaywrightError
+
+        await self.start()
+        _, slots = self._bind_loop()
+        async with slots:
+            pooled = await self._acquire()
+            try:
+                context = await pooled.browser.new_context()
+                try:
+                    page = await context.new_page()
+                    await page.route("**/*", _block_heavy_resources)
+                    yield page
+                finally:
+                    try:
+                        await context.close()
+                    except PlaywrightError:
+                        pass
+            except PlaywrightError:
+                if not pooled.browser.is_connected():
+                    pooled.retired = True
+                raise
+            finally:
+                await self._release(pooled)
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "browsers": len(self._browsers),
+            "healthy_browsers": sum(b.healthy for b in self._browsers),
+            "active_leases": sum(b.leases for b in self._browsers),
+            "total_uses": sum(b.uses for b in self._browsers),
+        }
+
+
+_browser_pool: AsyncBrowserPool | None = None
+
+
+def get_browser_pool() -> AsyncBrowserPool:
+    """Returns the process-wide browser pool, creating one with the default settings if none is set."""
+    global _browser_pool
+    if _browser_pool is None:
+        _browser_pool = AsyncBrowserPool()
+    return _browser_pool
+
+
+def set_browser_pool(pool: AsyncBrowserPool) -> None:
+    """Replaces the process-wide browser pool. The previous pool is not closed."""
+    global _browser_pool
+    _browser_pool = pool
@@ -1,8 +1,25 @@
+import asyncio
+import importlib.util
+import re
+import unicodedata
+from dataclasses import dataclass, field
+
+import httpx
 import requests
+from ai_librarian_core.utils.background_loop import BackgroundEventLoop, get_background_loop
+from ai_librarian_core.utils.cache import CacheEntry, TTLCache
+from ai_librarian_core.utils.http import aclose_async_clients, get_async_client
 from langchain_core.utils import get_from_dict_or_env
-from pydantic import BaseModel, Field, model_validator
+from pydantic import BaseModel, ConfigDict, Field, model_validator
 
 GOOGLE_BOOKS_API_URL = "https://www.googleapis.com/books/v1/volumes"
+# Partial response: only the fields `GoogleBook` keeps, instead of the full volume resources.
+GOOGLE_BOOKS_FIELDS = "items(volumeInfo(title,authors,description,infoLink))"
+# Google APIs only compress responses for clients that also mention gzip in their User-Agent.
+GOOGLE_BOOKS_HEADERS = {"Accept-Encoding": "gzip", "User-Agent": "ai-librarian (gzip)"}
+ISBN_PATTERN = re.compile(r"\d{9}[\dX]|\d{13}")
+# HTTP/2 needs the optional `h2` package, fall back to HTTP/1.1 keep-alive without it.
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
 
 
 class GoogleBooksAPIWrapperError(Exception):
@@ -25,6 +42,41 @@ class GoogleBooksAPIWrapperRequestExceptionError(GoogleBooksAPIWrapperError):
     pass
 
 
+@dataclass(slots=True)
+class GoogleBook:
+    """A book of the Google Books API, reduced to the fields the search results show."""
+
+    title: str = "Unknown Title"
+    authors: list[str] = field(default_factory=list)
+    description: str = "No summary available"
+    info_link: str = "No source available"
+
+    @classmethod
+    def from_volume(cls, volume: dict) -> "GoogleBook":
+        volume_info = volume.get("volumeInfo", {})
+        return cls(
+            title=volume_info.get("title", "Unknown Title"),
+            authors=volume_info.get("authors", []),
+            description=volume_info.get("description", "No summary available"),
+            info_link=volume_info.get("infoLink", "No source available"),
+        )
+
+
+@dataclass(slots=True)
+class GoogleBookLookup:
+    """The result of looking up one ISBN: the matching book, None if there is none, or the error of the lookup."""
+
+    isbn: str
+    book: GoogleBook | None = None
+    error: str | None = None
+
+
+def normalize_isbn(isbn: str) -> str:
+    """Strips the `isbn:` prefix, hyphens and spaces of an ISBN, e.g. "isbn:978-0-13-235088-4" -> "9780132350884"."""
+    isbn = isbn.strip().removeprefix("isbn:").removeprefix("ISBN:")
+    return re.sub(r"[\s-]", "", isbn).upper()
+
+
 class GoogleBooksAPIWrapper(BaseModel):
     """A modified Google Books API wrapper.
 
@@ -37,6 +89,13 @@ class GoogleBooksAPIWrapper(BaseModel):
     Modifications:
         1. Added null checks for volumeInfo fields (title, authors, description, infoLink)
         2. Fixed index out of range error when authors list is empty
+        3. Added `arun`, which shares a pooled `httpx.AsyncClient` (keep-alive, HTTP/2 if `h2` is installed)
+        4. Added connect and read timeouts to every request
+        5. Added a response cache, keyed on the query and `top_k_results`. Expired entries are revalidated with their
+           ETag (`If-None-Match`), so an unchanged result costs a bodyless 304 instead of the full volumes JSON
+        6. Requests only the formatted fields (`fields=` partial response) gzipped, parsed into slotted `GoogleBook`s,
+           and optionally truncates long descriptions to `max_description_chars`
+        7. Added `lookup_isbns` and `alookup_isbns`, which look up many ISBNs concurrently
 
     Args:
         google_api_key(str): API key for accessing Google Books API
@@ -45,6 +104,12 @@ class GoogleBooksAPIWrapper(BaseModel):
     Attributes:
         google_api_key(str): API key for accessing Google Books API
         top_k_results(int): Maximum number of book results to return (default: 5)
+        connect_timeout(float): Timeout in seconds for connecting to the API (default: 5)
+        read_timeout(float): Timeout in seconds for reading the response of the API (default: 10)
+        max_description_chars(int | None): Descriptions longer than this are truncated, None to keep them whole
+            (default: None)
+        cache(TTLCache | None): The cache of API responses. Falls back to the process-wide cache of
+            `get_google_books_cache()`, responses are not cached if neither is set.
 
     Returns:
         str: A formatted string containing book search results with title, authors, summary and source link
@@ -59,6 +124,12 @@ class GoogleBooksAPIWrapper(BaseModel):
 
     google_api_key: str | None = None
     top_k_results: int = Field(default=5, ge=1, le=20)
+    connect_timeout: float = Field(default=5, gt=0)
+    read_timeout: float = Field(default=10, gt=0)
+    max_description_chars: int | None = Field(default=None, ge=1)
+    cache: TTLCache | None = Field(default=None, exclude=True)
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
 
     @model_validator(mode="before")
     @classmethod
@@ -69,21 +140,73 @@ class GoogleBooksAPIWrapper(BaseModel):
 
         return values
 
-    def run(self, query: str) -> str:
-        params = (
+    def _params(self, query: str, max_results: int) -> tuple[tuple[str, str | int | None], ...]:
+        return (
             ("q", query),
-            ("maxResults", self.top_k_results),
+            ("maxResults", max_results),
+            ("fields", GOOGLE_BOOKS_FIELDS),
             ("key", self.google_api_key),
         )
 
+    def _error_message(self, response: requests.Response | httpx.Response) -> str:
         try:
-            response = requests.get(GOOGLE_BOOKS_API_URL, params=params)
+            return response.json().get("error", {}).get("message", "Internal failure")
+        except ValueError:
+            return "Internal failure"
+
+    def _get_cache(self) -> TTLCache | None:
+        return self.cache or get_google_books_cache()
+
+    def _cache_key(self, query: str, max_results: int) -> str:
+        normalized_query = " ".join(unicodedata.normalize("NFKC", query).casefold().split())
+        return f"{max_results}:{normalized_query}"
+
+    def _headers(self, entry: CacheEntry | None = None) -> dict[str, str]:
+        if entry is None or not entry.value.get("etag"):
+            return GOOGLE_BOOKS_HEADERS
+        return {**GOOGLE_BOOKS_HEADERS, "If-None-Match": entry.value["etag"]}
+
+    def _revalidated_entry(self, entry: CacheEntry | None, json: dict | None, etag: str | None) -> CacheEntry | None:
+        """Returns the entry to store for the response to a (conditional) request, None if `entry` is still valid."""
+        if json is None and entry is not None:
+            return None
+        return CacheEntry(value={"etag": etag, "items": (json or {}).get("items", [])})
+
+    def run(self, query: str) -> str:
+        return self._format(query, self._fetch_volumes(query, self.top_k_results))
+
+    def _fetch_volumes(self, query: str, max_results: int) -> list[dict]:
+        cache = self._get_cache()
+        if cache is None:
+            # Without a cached ETag to send, the API never answers 304 Not Modified.
+            json, _ = self._request(query, max_results)
+            return (json or {}).get("items", [])
+
+        def revalidate(entry: CacheEntry | None) -> CacheEntry | None:
+            json, etag = self._request(query, max_results, self._headers(entry))
+            return self._revalidated_entry(entry, json, etag)
+
+        return cache.get_or_revalidate(self._cache_key(query, max_results), revalidate).value["items"]
+
+    def _request(
+        self, query: str, max_results: int, headers: dict[str, str] = GOOGLE_BOOKS_HEADERS
+    ) -> tuple[dict | None, str | None]:
+        """Returns the JSON (None if the API answered 304 Not Modified) and the ETag of the response."""
+        try:
+            response = requests.get(
+                GOOGLE_BOOKS_API_URL,
+                params=self._params(query, max_results),
+                headers=headers,
+                timeout=(self.connect_timeout, self.read_timeout),
+            )
+            if response.status_code == 304:
+                return None, response.headers.get("ETag")
             response.raise_for_status()
             json = response.json()
 
         except requests.exceptions.HTTPError as e:
-            code = response.status_code
-            error = json.get("error", {}).get("message", "Internal failure")
+            code = e.response.status_code
+            error = self._error_message(e.response)
             raise GoogleBooksAPIWrapperHTTPError(
                 f"Unable to retrieve books got http status code {code}: {error}"
             ) from e
@@ -98,9 +221,131 @@ class GoogleBooksAPIWrapper(BaseModel):
         except Exception as e:
             raise GoogleBooksAPIWrapperError("An unexpected error occurred while trying to retrieve books.") from e
 
-        return self._format(query, json.get("items", []))
+        return json, response.headers.get("ETag")
+
+    def _http_client(self) -> httpx.AsyncClient:
+        return get_async_client(
+            "google_books",
+            http2=HTTP2_AVAILABLE,
+            limits=httpx.Limits(max_connections=20, max_keepalive_connections=10),
+        )
+
+    async def arun(self, query: str) -> str:
+        return self._format(query, await self._afetch_volumes(query, self.top_k_results))
 
-    def _format(self, query: str, books: list) -> str:
+    async def _afetch_volumes(self, query: str, max_results: int) -> list[dict]:
+        cache = self._get_cache()
+        if cache is None:
+            json, _ = await self._arequest(query, max_results)
+            return (json or {}).get("items", [])
+
+        async def arevalidate(entry: CacheEntry | None) -> CacheEntry | None:
+            json, etag = await self._arequest(query, max_results, self._headers(entry))
+            return self._revalidated_entry(entry, json, etag)
+
+        return (await cache.aget_or_revalidate(self._cache_key(query, max_results), arevalidate)).value["items"]
+
+    async def _arequest(
+        self, query: str, max_results: int, headers: dict[str, str] = GOOGLE_BOOKS_HEADERS
+    ) -> tuple[dict | None, str | None]:
+        try:
+            response = await self._http_client().get(
+                GOOGLE_BOOKS_API_URL,
+                params=self._params(query, max_results),
+                headers=headers,
+                timeout=httpx.Timeout(self.read_timeout, connect=self.connect_timeout),
+            )
+            if response.status_code == 304:
+                return None, response.headers.get("ETag")
+            response.raise_for_status()
+            json = response.json()
+
+        except httpx.HTTPStatusError as e:
+            code = e.response.status_code
+            error = self._error_message(e.response)
+            raise GoogleBooksAPIWrapperHTTPError(
+                f"Unable to retrieve books got http status code {code}: {error}"
+            ) from e
+        except httpx.TimeoutException as e:
+            raise GoogleBooksAPIWrapperTimeoutError("The request to retrieve books timed out.") from e
+        except httpx.TooManyRedirects as e:
+            raise GoogleBooksAPIWrapperTooManyRedirectsError(
+                "Too many redirects occurred while trying to retrieve books."
+            ) from e
+        except httpx.HTTPError as e:
+            raise GoogleBooksAPIWrapperRequestExceptionError("An error occurred while trying to retrieve books.") from e
+        except Exception as e:
+            raise GoogleBooksAPIWrapperError("An unexpected error occurred while trying to retrieve books.") from e
+
+        return json, response.headers.get("ETag")
+
+    async def _alookup_isbn(self, isbn: str) -> GoogleBookLookup:
+        if not ISBN_PATTERN.fullmatch(isbn):
+            return GoogleBookLookup(isbn=isbn, error=f"{isbn!r} is not a valid ISBN-10 or ISBN-13.")
+        try:
+            volumes = await self._afetch_volumes(f"isbn:{isbn}", max_results=1)
+        except GoogleBooksAPIWrapperError as e:
+            return GoogleBookLookup(isbn=isbn, error=str(e))
+        return GoogleBookLookup(isbn=isbn, book=self._parse_books(volumes)[0] if volumes else None)
+
+    async def alookup_isbns(self, isbns: list[str], max_concurrency: int = 8) -> list[GoogleBookLookup]:
+        """Looks up several ISBNs concurrently over the pooled client, sharing the response cache of `arun`.
+
+        Identical ISBNs (after `normalize_isbn`) are only looked up once. A failed lookup does not affect the others.
+
+        Args:
+            isbns (list[str]): The ISBNs to look up, with or without hyphens and an `isbn:` prefix.
+            max_concurrency (int): The maximum number of requests sent at the same time (default: 8).
+
+        Returns:
+            list[GoogleBookLookup]: The result of each ISBN, in the order of `isbns`.
+        """
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be positive.")
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def lookup(isbn: str) -> GoogleBookLookup:
+            async with semaphore:
+                return await self._alookup_isbn(isbn)
+
+        unique_isbns = list(dict.fromkeys(normalize_isbn(isbn) for isbn in isbns))
+        lookups = await asyncio.gather(*(lookup(isbn) for isbn in unique_isbns))
+        lookups_by_isbn = dict(zip(unique_isbns, lookups, strict=True))
+        return [lookups_by_isbn[normalize_isbn(isbn)] for isbn in isbns]
+
+    def lookup_isbns(self, isbns: list[str], max_concurrency: int = 8) -> list[GoogleBookLookup]:
+        """Looks up several ISBNs concurrently, see `alookup_isbns`."""
+        return _get_google_books_background_loop().run(self.alookup_isbns(isbns, max_concurrency=max_concurrency))
+
+    def format_lookups(self, lookups: list[GoogleBookLookup]) -> str:
+        results = []
+        for lookup in lookups:
+            if lookup.error is not None:
+                results.append(f"ISBN {lookup.isbn}: Error: {lookup.error}")
+            elif lookup.book is None:
+                results.append(f"ISBN {lookup.isbn}: Sorry no book could be found for this ISBN")
+            else:
+                results.append(f"ISBN {lookup.isbn}: {self._format_book(lookup.book)}")
+        return "\n\n".join(results)
+
+    def _truncate(self, description: str) -> str:
+        if self.max_description_chars is None or len(description) <= self.max_description_chars:
+            return description
+        truncated = description[: self.max_description_chars]
+        # Cut at a word boundary, unless the text has no spaces to cut at, e.g. Chinese.
+        space = truncated.rfind(" ")
+        if space > self.max_description_chars // 2:
+            truncated = truncated[:space]
+        return f"{truncated.rstrip()}…"
+
+    def _parse_books(self, volumes: list[dict]) -> list[GoogleBook]:
+        books = [GoogleBook.from_volume(volume) for volume in volumes]
+        for book in books:
+            book.description = self._truncate(book.description)
+        return books
+
+    def _format(self, query: str, volumes: list[dict]) -> str:
+        books = self._parse_books(volumes)
         if not books:
             return f"Sorry no books could be found for your query: {query}"
 
@@ -111,20 +356,17 @@ class GoogleBooksAPIWrapper(BaseModel):
         i = 1
 
         for book in books:
-            volume_info = book["volumeInfo"]
-            title = volume_info.get("title", "Unknown Title")
-            authors = self._format_authors(volume_info.get("authors", []))
-            summary = volume_info.get("description", "No summary available")
-            source = volume_info.get("infoLink", "No source available")
-
-            desc = f'{i}. "{title}" by {authors}: {summary}\n'
-            desc += f"You can read more at {source}"
-            results.append(desc)
+            results.append(f"{i}. {self._format_book(book)}")
 
             i += 1
 
         return "\n\n".join(results)
 
+    def _format_book(self, book: GoogleBook) -> str:
+        desc = f'"{book.title}" by {self._format_authors(book.authors)}: {book.description}\n'
+        desc += f"You can read more at {book.info_link}"
+        return desc
+
     def _format_authors(self, authors: list) -> str:
         if not authors:
             return "Unknown Author"
@@ -132,3 +374,29 @@ class GoogleBooksAPIWrapper(BaseModel):
             return authors[0]
         else:
             return "{} and {}".format(", ".join(authors[:-1]), authors[-1])
+
+
+_background_loop: BackgroundEventLoop | None = None
+
+
+def _get_google_books_background_loop() -> BackgroundEventLoop:
+    global _background_loop
+    if _background_loop is None:
+        _background_loop = get_background_loop()
+        # The HTTP connections opened by sync callers are closed with the loop.
+        _background_loop.on_shutdown(aclose_async_clients)
+    return _background_loop
+
+
+_cache: TTLCache | None = None
+
+
+def get_google_books_cache() -> TTLCache | None:
+    """Returns the process-wide Google Books response cache, or None if responses are not cached."""
+    return _cache
+
+
+def set_google_books_cache(cache: TTLCache | None) -> None:
+    """Replaces the process-wide Google Books response cache. The previous cache is not closed."""
+    global _cache
+    _cache = cache
@@ -0,0 +1,12 @@
+from enum import StrEnum
+
+
+class NCLSearchEngine(StrEnum):
+    """The engines used to query the NCL catalog.
+
+    `HTTP` fetches the pages with plain HTTP requests and parses them with lxml, falling back to `PLAYWRIGHT`
+    (a headless Chromium) when the plain HTTP path fails.
+    """
+
+    PLAYWRIGHT = "playwright"
+    HTTP = "http"
@@ -1,21 +1,48 @@
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import itertools
+import logging
+import re
+import unicodedata
 import urllib.parse
+from collections.abc import AsyncIterator, Coroutine, Iterator
+from http.cookiejar import CookieJar, DefaultCookiePolicy
+from typing import TYPE_CHECKING, Any
+
+import httpx
+from ai_librarian_core.utils.background_loop import BackgroundEventLoop, get_background_loop, run_blocking
+from ai_librarian_core.utils.cache import TTLCache
+from ai_librarian_core.utils.http import aclose_async_clients, get_async_client
+from ai_librarian_core.wrapper.browser_pool import AsyncBrowserPool, get_browser_pool
+from ai_librarian_core.wrapper.ncl_engine import NCLSearchEngine
+from ai_librarian_core.wrapper.ncl_session import NCLSessionPool
+from lxml import html as lxml_html
+from lxml.html import HtmlElement
+from pydantic import BaseModel, ConfigDict, Field
+
+if TYPE_CHECKING:
+    from playwright.async_api import BrowserContext as AsyncBrowserContext
+    from playwright.async_api import Page as AsyncPage
 
-from playwright.async_api import (
-    BrowserContext as AsyncBrowserContext,
-)
-from playwright.async_api import (
-    Page as AsyncPage,
-)
-from playwright.async_api import (
-    TimeoutError as AsyncTimeoutError,
-)
-from playwright.async_api import (
-    async_playwright,
+NCL_ENTRY_URL = "https://aleweb.ncl.edu.tw/F"
+NCL_HTTP_USER_AGENT = (
+    "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/126.0.0.0 Safari/537.36"
 )
-from playwright.sync_api import BrowserContext, Page, TimeoutError, sync_playwright
-from pydantic import BaseModel, Field
+NCL_SESSION_ID_PATTERN = re.compile(r"/F/([A-Z0-9]+-\d+)[?\"']")
+NCL_RECORD_SELECTOR = "td.td1"
+NCL_RECORD_FIELD_LABELS = {
+    "isbn": "ISBN",
+    "edition": "Edition",
+    "publisher": "Publisher",
+    "year": "Year",
+    "pages": "Pages",
+    "call_number": "Call number",
+    "subjects": "Subjects",
+}
 
-NCL_ENTRY_URL = "https://aleweb.ncl.edu.tw/F"
+logger = logging.getLogger(__name__)
 
 
 class NCLCrawlerError(Exception):
@@ -38,6 +65,14 @@ class NCLCrawlerSearchNoResultsError(NCLCrawlerError):
     pass
 
 
+class NCLCrawlerSessionExpiredError(NCLCrawlerError):
+    pass
+
+
+class NCLCrawlerRecordNotFoundError(NCLCrawlerError):
+    pass
+
+
 class BaseNCLSearch(BaseModel):
     """Base class for NCL search tools, containing shared configurations and utilities.
 
@@ -45,152 +80,431 @@ class BaseNCLSearch(BaseModel):
         top_k_results (int): The maximum number of search results to retrieve (default: 10, min: 1, max: 20).
         cookie_timeout (int): The timeout in milliseconds for retrieving the session cookie (default: 10000).
         search_timeout (int): The timeout in milliseconds for waiting for search results (default: 15000).
+        result_cache (TTLCache | None): The cache of search results. Defaults to the process-wide cache returned by
+            `get_ncl_result_cache()`, results are not cached if neither is set.
     """
 
     top_k_results: int = Field(default=10, ge=1, le=20)
     cookie_timeout: int = Field(default=10000)
     search_timeout: int = Field(default=15000)
+    result_cache: TTLCache | None = Field(default=None, exclude=True)
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
 
     def _encode_query(self, query: str) -> str:
         return urllib.parse.quote(query)
 
+    def _get_result_cache(self) -> TTLCache | None:
+        return self.result_cache or get_ncl_result_cache()
+
+    def _cache_key(self, query: str) -> str:
+        # The catalog search is insensitive to case, full-width forms and extra whitespace.
+        normalized_query = " ".join(unicodedata.normalize("NFKC", query).casefold().split())
+        return f"{self.top_k_results}:{normalized_query}"
+
+    def _format_results(self, results: list[dict[str, str]]) -> str:
+        lines = []
+        for i, result in enumerate(results):
+            lines.append(f"{i + 1}. {result['title']} ({result['author']}) - {result['link']}")
+            if details := [
+                f"{label}: {result[key]}" for key, label in NCL_RECORD_FIELD_LABELS.items() if key in result
+            ]:
+                lines.append(f"   {'; '.join(details)}")
+        return "\n".join(lines)
+
+    def _build_search_url(self, session_id: str, encoded_query: str) -> str:
+        return (
+            f"{NCL_ENTRY_URL}/{session_id}?func=find-b&request={encoded_query}&find_code=WTI&adjacent=Y&local_base="
+            "&x=0&y=0&filter_code_1=WLN&filter_request_1=&filter_code_2=WYR&filter_request_2=&filter_code_3=WYR"
+            "&filter_request_3=&filter_code_4=WMY&filter_request_4=&filter_code_5=WSL&filter_request_5="
+        )
+
+    def _parse_ncl_rows(self, document: HtmlElement, page_url: str) -> Iterator[dict[str, str]]:
+        """Yields the title, author, link and holdings link (if any) of each row of a parsed brief results page."""
+        for row in document.xpath('//tr[@valign="baseline"]'):
+            title_links = row.xpath(
+                './*[3][self::td]//a[contains(concat(" ", normalize-space(@class), " "), " brieftit ")]'
+            )
+            if not title_links:
+                continue
+            book_title = title_links[0].text_content().strip()
+            book_link = (title_links[0].get("href") or "").strip()
+            authors = row.xpath("./*[4][self::td]")
+            author = authors[0].text_content().strip() if authors else ""
+
+            if book_title and book_link:
+                result = {"title": book_title, "author": author, "link": urllib.parse.urljoin(page_url, book_link)}
+                if holdings_links := row.xpath('.//a[contains(@href, "func=item-global")]/@href'):
+                    result["holdings_link"] = urllib.parse.urljoin(page_url, holdings_links[0].strip())
+                yield result
+
+    def _parse_ncl_results(self, html: str, page_url: str) -> list[dict[str, str]]:
+        """Parses the title, author and link of each row of a brief results page, up to `top_k_results` rows."""
+        return list(itertools.islice(self._parse_ncl_rows(lxml_html.fromstring(html), page_url), self.top_k_results))
+
+    def _parse_next_page(self, document: HtmlElement, page_url: str, first_entry: int) -> tuple[str, int] | None:
+        """Returns the URL and first entry of the page following the one starting at `first_entry`, if any.
+
+        ALEPH pages through a result set with `func=short-jump&jump=<first entry>` links, the next page is the
+        closest one after the current page.
+        """
+        next_pages = []
+        for link in document.xpath('//a[contains(@href, "func=short-jump")]'):
+            url = urllib.parse.urljoin(page_url, link.get("href").strip())
+            jump = urllib.parse.parse_qs(urllib.parse.urlsplit(url).query).get("jump", [""])[0]
+            if jump.isdigit() and int(jump) > first_entry:
+                next_pages.append((int(jump), url))
+        if not next_pages:
+            return None
+        jump, url = min(next_pages)
+        return url, jump
+
+    def _build_record_url(self, link: str) -> str:
+        """Returns the MARC view (`format=001`) of a full record link, whose field tags do not depend on the UI."""
+        parts = urllib.parse.urlsplit(link)
+        params = [(k, v) for k, v in urllib.parse.parse_qsl(parts.query, keep_blank_values=True) if k != "format"]
+        return urllib.parse.urlunsplit(parts._replace(query=urllib.parse.urlencode([*params, ("format", "001")])))
+
+    def _build_session_record_url(self, record_key: str, session_id: str) -> str:
+        """Returns the MARC view of a record, given its permanent URL (see `_record_cache_key`), in a session."""
+        query = urllib.parse.urlsplit(record_key).query
+        return self._build_record_url(f"{NCL_ENTRY_URL}/{session_id}?{query}")
+
+    def _record_cache_key(self, result: dict[str, str]) -> str | None:
+        """Returns the permanent URL of a record, or None if it is unknown.
+
+        The links of the brief results belong to the session that searched them, but the holdings link carries
+        the session-independent document number.
+        """
+        if "holdings_link" not in result:
+            return None
+        params = urllib.parse.parse_qs(urllib.parse.urlsplit(result["holdings_link"]).query)
+        if "doc_number" not in params or "doc_library" not in params:
+            return None
+        return f"{NCL_ENTRY_URL}?func=direct&doc_number={params['doc_number'][0]}&local_base={params['doc_library'][0]}"
+
+    def _parse_ncl_record(self, html: str) -> dict[str, str]:
+        """Parses the ISBN, edition, publisher, year, pages, call number and subjects of a MARC view record page."""
+        fields: dict[str, list[dict[str, list[str]]]] = {}
+        raw_fields: dict[str, str] = {}
+        for row in lxml_html.fromstring(html).xpath("//tr[count(td) >= 2]"):
+            tag = row.xpath("./td[1]")[0].text_content().strip()[:3]
+            if not tag.isdigit():
+                continue
+            value = row.xpath("./td[2]")[0].text_content().strip()
+            raw_fields.setdefault(tag, value)
+            # Subfields are displayed as "|a value |b value".
+            parts = re.split(r"\|([a-z0-9])\s*", value)
+            subfields: dict[str, list[str]] = {}
+            for code, subfield in zip(parts[1::2], parts[2::2], strict=True):
+                if subfield := subfield.strip().strip(" :;,/=").strip():
+                    subfields.setdefault(code, []).append(subfield)
+            fields.setdefault(tag, []).append(subfields)
+
+        def values(tags: tuple[str, ...], code: str) -> list[str]:
+            found = [v for tag in tags for subfields in fields.get(tag, []) for v in subfields.get(code, [])]
+            return list(dict.fromkeys(found))
+
+        record = {}
+        if isbns := [isbn.split()[0] for isbn in values(("020",), "a")]:
+            record["isbn"] = ", ".join(dict.fromkeys(isbns))
+        if editions := values(("250",), "a"):
+            record["edition"] = editions[0]
+        if publishers := values(("264", "260"), "b"):
+            record["publisher"] = publishers[0]
+        years = [m.group() for date in values(("264", "260"), "c") if (m := re.search(r"\d{4}", date))]
+        fixed_year = raw_fields.get("008", "")[7:11]
+        if years or fixed_year.isdigit():
+            record["year"] = years[0] if years else fixed_year
+        if pages := values(("300",), "a"):
+            record["pages"] = pages[0]
+        call_numbers = [
+            " ".join(subfields.get("a", []) + subfields.get("b", []))
+            for tag in ("084", "082", "050", "095", "096", "090")
+            for subfields in fields.get(tag, [])
+        ]
+        if call_numbers := [call_number for call_number in call_numbers if call_number]:
+            record["call_number"] = call_numbers[0]
+        if subjects := values(("650", "600", "610", "651"), "a"):
+            record["subjects"] = ", ".join(subjects[:5])
+        return record
+
+
+class AsyncNCLSearch(BaseNCLSearch):
+    """An asynchronous search tool for the National Central Library (NCL) catalog.
+
+    Pages are leased from a shared `AsyncBrowserPool` instead of launching a browser per query, and ALEPH sessions
+    are taken from a `NCLSessionPool` of warm sessions, so a query only has to load the results page.
+    With the `HTTP` engine, the results page is fetched with a pooled `httpx.AsyncClient` and parsed with lxml,
+    and a browser is only used when the plain HTTP path fails.
+    The top `enrich_top_k` results can be enriched with the ISBN, publisher, year, call number, etc. of their full
+    records, which are fetched concurrently with the same session.
+
+    Attributes:
+        engine (NCLSearchEngine): The engine used to query the catalog (default: NCLSearchEngine.PLAYWRIGHT).
+        enrich_top_k (int): The number of top results enriched with their full record (default: 0, max: 20).
+        enrich_max_concurrency (int): The maximum number of full records fetched at the same time (default: 4).
+        browser_pool (AsyncBrowserPool | None): The pool to lease pages from. Defaults to the process-wide pool
+            returned by `get_browser_pool()`.
+        session_pool (NCLSessionPool | None): The pool to take ALEPH sessions from. Defaults to the process-wide
+            pool returned by `get_ncl_session_pool()`.
+        record_cache (TTLCache | None): The cache of parsed full records, keyed by their permanent URL. Defaults to
+            the process-wide cache returned by `get_ncl_record_cache()`, records are not cached if neither is set.
+    """
+
+    engine: NCLSearchEngine = Field(default=NCLSearchEngine.PLAYWRIGHT)
+    enrich_top_k: int = Field(default=0, ge=0, le=20)
+    enrich_max_concurrency: int = Field(default=4, ge=1)
+    browser_pool: AsyncBrowserPool | None = Field(default=None, exclude=True)
+    session_pool: NCLSessionPool | None = Field(default=None, exclude=True)
+    record_cache: TTLCache | None = Field(default=None, exclude=True)
+
+    def _cache_key(self, query: str) -> str:
+        key = super()._cache_key(query)
+        return f"{key}:enriched={self.enrich_top_k}" if self.enrich_top_k else key
+
+    async def arun(self, query: str) -> str:
+        result_cache = self._get_result_cache()
+        if result_cache is None:
+            results = await self._aprocess_workflow(query)
+        else:
+            results = await result_cache.aget_or_fetch(
+                self._cache_key(query),
+                lambda: self._aprocess_workflow(query),
+                error_types=(NCLCrawlerSearchNoResultsError,),
+            )
+        return self._format_results(results)
+
+    async def abatch(self, queries: list[str], max_concurrency: int = 8) -> list[str | Exception]:
+        """Searches several queries concurrently, sharing the browser, session and result cache of the tool.
+
+        Identical queries (after normalization) are only searched once. A failed query does not affect the others.
+
+        Args:
+            queries (list[str]): The queries to search.
+            max_concurrency (int): The maximum number of queries searched at the same time (default: 8).
+
+        Returns:
+            list[str | Exception]: The formatted results of each query, or the exception it raised, in the order of
+                `queries`.
+        """
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be positive.")
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def search(query: str) -> str | Exception:
+            async with semaphore:
+                try:
+                    return await self.arun(query)
+                except Exception as e:
+                    return e
+
+        unique_queries: dict[str, str] = {}
+        for query in queries:
+            unique_queries.setdefault(self._cache_key(query), query)
+        outputs = await asyncio.gather(*(search(query) for query in unique_queries.values()))
+        outputs_by_key = dict(zip(unique_queries, outputs, strict=True))
+        return [outputs_by_key[self._cache_key(query)] for query in queries]
+
+    async def anew_session_id(self) -> str:
+        """Opens a new ALEPH session on the NCL catalog and returns its ID."""
+        if self.engine == NCLSearchEngine.HTTP:
+            try:
+                return await self._ahttp_get_session_id()
+            except (NCLCrawlerError, httpx.HTTPError) as e:
+                logger.warning(f"Failed to open an ALEPH session over plain HTTP, falling back to Playwright: {e}")
+
+        browser_pool = self.browser_pool or get_browser_pool()
+        async with browser_pool.lease_page() as page:
+            return await self._aget_session_id(page.context, page)
+
+    async def _aprocess_workflow(self, query: str) -> list[dict[str, str]]:
+        session_pool = self.session_pool or get_ncl_session_pool()
+        try:
+            return await self._asearch_with_pooled_session(query, session_pool)
+        except NCLCrawlerSessionExpiredError:
+            # The expired session has been dropped, retry once with another one.
+            return await self._asearch_with_pooled_session(query, session_pool)
+
+    async def _asearch_with_pooled_session(self, query: str, session_pool: NCLSessionPool) -> list[dict[str, str]]:
+        session = await session_pool.acquire()
+        try:
+            results = await self._asearch_with_session(query, session.session_id)
+            if self.enrich_top_k:
+                results = await self._aenrich_results(results, session.session_id, session_pool)
+        except NCLCrawlerSearchNoResultsError:
+            session_pool.release(session)
+            raise
+        except NCLCrawlerSessionExpiredError:
+            session_pool.discard(session)
+            raise
+        except BaseException:
+            session_pool.release(session, failed=True)
+            raise
+        session_pool.release(session)
+        return results
 
-class NCLSearch(BaseNCLSearch):
-    """A synchronous search tool for the National Central Library (NCL) catalog."""
-
-    def _process_workflow(self, query: str) -> list[dict[str, str]]:
-        with sync_playwright() as p:
-            # TODO(youkwan): Find a better way to fetch cookies other than Playwright.
-            # Playwright relies on too many dependencies which is too heavy for this use case.
-            browser = p.chromium.launch(headless=True)
-            context = browser.new_context()
-            page = context.new_page()
-
-            page.route(
-                "**/*",
-                lambda route: (
-                    route.abort()
-                    if route.request.resource_type in ["image", "stylesheet", "font", "media"]
-                    or "google-analytics.com" in route.request.url
-                    else route.continue_()
-                ),
+    async def _asearch_with_session(self, query: str, session_id: str) -> list[dict[str, str]]:
+        if self.engine == NCLSearchEngine.HTTP:
+            try:
+                return await self._ahttp_search_ncl_results(query, session_id)
+            except (NCLCrawlerSearchNoResultsError, NCLCrawlerSessionExpiredError):
+                raise
+            except (NCLCrawlerError, httpx.HTTPError) as e:
+                logger.warning(f"Plain HTTP NCL search failed, falling back to Playwright: {e}")
+
+        browser_pool = self.browser_pool or get_browser_pool()
+        async with browser_pool.lease_page() as page:
+            await page.context.add_cookies([{"name": "ALEPH_SESSION_ID", "value": session_id, "url": NCL_ENTRY_URL}])
+            return await self._asearch_ncl_results(query, session_id, page)
+
+    async def _aenrich_results(
+        self, results: list[dict[str, str]], session_id: str, session_pool: NCLSessionPool
+    ) -> list[dict[str, str]]:
+        """Adds the fields of their full record to the top `enrich_top_k` results.
+
+        A result whose record cannot be fetched is returned as is, enrichment never fails the search. A stale cached
+        record is refreshed in the background with a session of its own, the session of the search is released once
+        the search ends.
+        """
+        record_cache = self.record_cache or get_ncl_record_cache()
+        semaphore = asyncio.Semaphore(self.enrich_max_concurrency)
+
+        async def enrich(result: dict[str, str]) -> dict[str, str]:
+            record_url = self._build_record_url(result["link"])
+
+            async def fetch_record() -> dict[str, str]:
+                async with semaphore:
+                    return await self._afetch_record(record_url, session_id)
+
+            cache_key = self._record_cache_key(result)
+            try:
+                if record_cache is None or cache_key is None:
+                    record = await fetch_record()
+                else:
+                    record = await record_cache.aget_or_fetch(
+                        cache_key,
+                        fetch_record,
+                        background_fetch=lambda: self._afetch_record_with_pooled_session(cache_key, session_pool),
+                    )
+            except Exception as e:
+                logger.warning(f"Failed to fetch the full record {record_url}: {e}")
+                return result
+            return {**result, **record}
+
+        enriched = await asyncio.gather(*(enrich(result) for result in results[: self.enrich_top_k]))
+        return [*enriched, *results[self.enrich_top_k :]]
+
+    async def _afetch_record(self, url: str, session_id: str) -> dict[str, str]:
+        """Fetches and parses the MARC view of a full record.
+
+        The page of an expired session, or an error page, has no MARC fields. It raises instead of being parsed into
+        an empty record, so it is never cached.
+        """
+        html = await self._afetch_record_page(url, session_id)
+        if session_id not in html:
+            raise NCLCrawlerSessionExpiredError(f"The ALEPH session {session_id} has expired.")
+        if not (record := self._parse_ncl_record(html)):
+            raise NCLCrawlerRecordNotFoundError(f"Could not find the fields of the full record {url}.")
+        return record
+
+    async def _afetch_record_with_pooled_session(self, record_key: str, session_pool: NCLSessionPool) -> dict[str, str]:
+        """Fetches a full record by its permanent URL with a session taken from `session_pool`."""
+        session = await session_pool.acquire()
+        try:
+            record = await self._afetch_record(
+                self._build_session_record_url(record_key, session.session_id), session.session_id
             )
-            session_id = self._get_session_id(context, page)
-            results = self._search_ncl_results(query, session_id, page)
-            return results
+        except NCLCrawlerRecordNotFoundError:
+            session_pool.release(session)
+            raise
+        except NCLCrawlerSessionExpiredError:
+            session_pool.discard(session)
+            raise
+        except BaseException:
+            session_pool.release(session, failed=True)
+            raise
+        session_pool.release(session)
+        return record
+
+    async def _afetch_record_page(self, url: str, session_id: str) -> str:
+        if self.engine == NCLSearchEngine.HTTP:
+            try:
+                html, _ = await self._ahttp_fetch_page(url, session_id)
+                return html
+            except (NCLCrawlerError, httpx.HTTPError) as e:
+                logger.warning(f"Plain HTTP NCL record fetch failed, falling back to Playwright: {e}")
+
+        browser_pool = self.browser_pool or get_browser_pool()
+        async with browser_pool.lease_page() as page:
+            await page.context.add_cookies([{"name": "ALEPH_SESSION_ID", "value": session_id, "url": NCL_ENTRY_URL}])
+            html, _ = await self._afetch_page(page, url, NCL_RECORD_SELECTOR)
+            return html
+
+    def _http_client(self) -> httpx.AsyncClient:
+        return get_async_client(
+            "ncl_search",
+            headers={"User-Agent": NCL_HTTP_USER_AGENT},
+            # Sessions are tracked by the session pool, a shared cookie jar would mix them up.
+            cookies=CookieJar(policy=DefaultCookiePolicy(allowed_domains=[])),
+            follow_redirects=True,
+            limits=httpx.Limits(max_connections=20, max_keepalive_connections=10),
+        )
 
-    def _get_session_id(self, context: BrowserContext, page: Page) -> str:
-        page.goto(NCL_ENTRY_URL)
+    async def _ahttp_get_session_id(self) -> str:
         try:
-            page.wait_for_function("() => document.cookie.includes('ALEPH_SESSION_ID')", timeout=self.cookie_timeout)
-        except TimeoutError as e:
+            response = await self._http_client().get(NCL_ENTRY_URL, timeout=self.cookie_timeout / 1000)
+            response.raise_for_status()
+        except httpx.TimeoutException as e:
             raise NCLCrawlerCookieTimeoutError(
                 f"Timeout while getting cookie, exceeded cookie_timeout parameter({self.cookie_timeout}ms). "
                 f"Please try increasing the cookie_timeout parameter."
             ) from e
 
-        all_cookies = context.cookies()
-
-        for cookie in all_cookies:
-            if cookie["name"] == "ALEPH_SESSION_ID":
-                return cookie["value"]
+        for hop in [*response.history, response]:
+            if session_id := hop.cookies.get("ALEPH_SESSION_ID"):
+                return session_id
+        # ALEPH also embeds the session ID in the links of the page when the cookie is set by a script.
+        if match := NCL_SESSION_ID_PATTERN.search(response.text):
+            return match.group(1)
         raise NCLCrawlerSessionIdNotFoundError(
             f"Could not find session ID in {NCL_ENTRY_URL} cookies. Please try again."
         )
 
-    def _search_ncl_results(self, query: str, session_id: str, page: Page) -> list[dict[str, str]]:
-        encoded_query = self._encode_query(query)
-
+    async def _ahttp_fetch_page(self, url: str, session_id: str) -> tuple[str, str]:
+        """Fetches a page of the session `session_id` and returns its HTML and final URL."""
         try:
-            page.goto(
-                f"{NCL_ENTRY_URL}/{session_id}?func=find-b&request={encoded_query}&find_code=WTI&adjacent=Y&local_base=&x=0&y=0&filter_code_1=WLN&filter_request_1=&filter_code_2=WYR&filter_request_2=&filter_code_3=WYR&filter_request_3=&filter_code_4=WMY&filter_request_4=&filter_code_5=WSL&filter_request_5="
+            response = await self._http_client().get(
+                url, headers={"Cookie": f"ALEPH_SESSION_ID={session_id}"}, timeout=self.search_timeout / 1000
             )
-            page.wait_for_selector('tr[valign="baseline"] td:nth-child(3) a.brieftit', timeout=self.search_timeout)
-        except TimeoutError as e:
+            response.raise_for_status()
+        except httpx.TimeoutException as e:
             raise NCLCrawlerSearchTimeoutError(
                 f"Timeout while searching for results, exceeded search_timeout parameter({self.search_timeout}ms). "
                 f"Please try increasing the search_timeout parameter."
             ) from e
-
-        result_rows_locator = page.locator('tr[valign="baseline"]')
-        num_rows = result_rows_locator.count()
-        if num_rows <= 0:
-            raise NCLCrawlerSearchNoResultsError(
-                f"No results found for query: {query}. Please try again with a different query."
-            )
-
-        results = []
-        count = 0
-
-        for i in range(num_rows):
-            row_locator = result_rows_locator.nth(i)
-            title_link_locator = row_locator.locator("td:nth-child(3) a.brieftit")
-
-            book_title = None
-            book_link = None
-
-            if title_link_locator.count() > 0:
-                book_title = title_link_locator.text_content()
-                book_link = title_link_locator.get_attribute("href")
-
-            author_locator = row_locator.locator("td:nth-child(4)")
-            author = author_locator.text_content()
-
-            if book_title:
-                book_title = book_title.strip()
-            if book_link:
-                if not book_link.startswith("http"):
-                    book_link = page.url.split("/F/")[0] + book_link
-                book_link = book_link.strip()
-            if author:
-                author = author.strip()
-
-            if book_title and book_link:
-                results.append({"title": book_title, "author": author, "link": book_link})
-                count += 1
-                if count >= self.top_k_results:
-                    break
-        return results
-
-    def run(self, query: str) -> str:
-        results = self._process_workflow(query)
-        return "\n".join(
-            [f"{i + 1}. {result['title']} ({result['author']}) - {result['link']}" for i, result in enumerate(results)]
+        return response.text, str(response.url)
+
+    def _raise_for_empty_page(self, query: str, session_id: str, html: str) -> None:
+        # Pages of a live session link back to it, an expired session is silently replaced by ALEPH.
+        if session_id not in html:
+            raise NCLCrawlerSessionExpiredError(f"The ALEPH session {session_id} has expired.")
+        raise NCLCrawlerSearchNoResultsError(
+            f"No results found for query: {query}. Please try again with a different query."
         )
 
+    async def _ahttp_search_ncl_results(self, query: str, session_id: str) -> list[dict[str, str]]:
+        encoded_query = self._encode_query(query)
+        html, page_url = await self._ahttp_fetch_page(self._build_search_url(session_id, encoded_query), session_id)
 
-class AsyncNCLSearch(BaseNCLSearch):
-    """An asynchronous search tool for the National Central Library (NCL) catalog."""
-
-    async def arun(self, query: str) -> str:
-        results = await self._aprocess_workflow(query)
-        return "\n".join(
-            [f"{i + 1}. {result['title']} ({result['author']}) - {result['link']}" for i, result in enumerate(results)]
-        )
-
-    async def _aprocess_workflow(self, query: str) -> list[dict[str, str]]:
-        async with async_playwright() as p:
-            browser = await p.chromium.launch(headless=True)
-            context = await browser.new_context()
-            page = await context.new_page()
-
-            await page.route(
-                "**/*",
-                lambda route: (
-                    route.abort()
-                    if route.request.resource_type in ["image", "stylesheet", "font", "media"]
-                    or "google-analytics.com" in route.request.url
-                    else route.continue_()
-                ),
-            )
-            try:
-                session_id = await self._aget_session_id(context, page)
-                results = await self._asearch_ncl_results(query, session_id, page)
-                return results
-            finally:
-                await browser.close()
+        results = self._parse_ncl_results(html, page_url)
+        if not results:
+            self._raise_for_empty_page(query, session_id, html)
+        return results
 
     async def _aget_session_id(self, context: AsyncBrowserContext, page: AsyncPage) -> str:
+        from playwright.async_api import TimeoutError as AsyncTimeoutError
+
         await page.goto(NCL_ENTRY_URL)
         try:
             await page.wait_for_function(
@@ -211,58 +525,202 @@ class AsyncNCLSearch(BaseNCLSearch):
             f"Could not find session ID in {NCL_ENTRY_URL} cookies. Please try again."
         )
 
-    async def _asearch_ncl_results(self, query: str, session_id: str, page: AsyncPage) -> list[dict[str, str]]:
-        encoded_query = self._encode_query(query)
+    async def _afetch_page(self, page: AsyncPage, url: str, selector: str) -> tuple[str, str]:
+        """Loads a page in `page`, waits for `selector` and returns its HTML and final URL."""
+        from playwright.async_api import TimeoutError as AsyncTimeoutError
 
         try:
-            await page.goto(
-                f"{NCL_ENTRY_URL}/{session_id}?func=find-b&request={encoded_query}&find_code=WTI&adjacent=Y&local_base=&x=0&y=0&filter_code_1=WLN&filter_request_1=&filter_code_2=WYR&filter_request_2=&filter_code_3=WYR&filter_request_3=&filter_code_4=WMY&filter_request_4=&filter_code_5=WSL&filter_request_5="
-            )
-            await page.wait_for_selector(
-                'tr[valign="baseline"] td:nth-child(3) a.brieftit', timeout=self.search_timeout
-            )
+            await page.goto(url)
+            await page.wait_for_selector(selector, timeout=self.search_timeout)
         except AsyncTimeoutError as e:
             raise NCLCrawlerSearchTimeoutError(
                 f"Timeout while searching for results, exceeded search_timeout parameter({self.search_timeout}ms). "
                 f"Please try increasing the search_timeout parameter."
             ) from e
+        # A single round trip to the browser, the rows are parsed locally.
+        return await page.content(), page.url
 
-        result_rows_locator = page.locator('tr[valign="baseline"]')
-        num_rows = await result_rows_locator.count()
-        if num_rows <= 0:
-            raise NCLCrawlerSearchNoResultsError(
-                f"No results found for query: {query}. Please try again with a different query."
-            )
+    async def _afetch_results_page(self, page: AsyncPage, url: str) -> tuple[str, str]:
+        """Loads a brief results page in `page` and returns its HTML and final URL.
+
+        A loaded page without result rows is returned at once, like on the plain HTTP path, so the caller can tell a
+        query without results from an expired session instead of waiting `search_timeout` for rows that never come.
+        """
+        from playwright.async_api import TimeoutError as AsyncTimeoutError
+
+        try:
+            await page.goto(url, timeout=self.search_timeout)
+        except AsyncTimeoutError as e:
+            raise NCLCrawlerSearchTimeoutError(
+                f"Timeout while searching for results, exceeded search_timeout parameter({self.search_timeout}ms). "
+                f"Please try increasing the search_timeout parameter."
+            ) from e
+        # ALEPH renders the rows on the server, so the loaded page has all of them or none.
+        return await page.content(), page.url
+
+    async def _asearch_ncl_results(self, query: str, session_id: str, page: AsyncPage) -> list[dict[str, str]]:
+        encoded_query = self._encode_query(query)
+        html, page_url = await self._afetch_results_page(page, self._build_search_url(session_id, encoded_query))
+
+        results = self._parse_ncl_results(html, page_url)
+        if not results:
+            self._raise_for_empty_page(query, session_id, html)
+        return results
 
-        results = []
-        count = 0
+    async def aiter_results(self, query: str, max_results: int | None = None) -> AsyncIterator[dict[str, str]]:
+        """Yields the results of a query one by one, following the result pages of the catalog.
+
+        Unlike `arun`, the results are neither capped by `top_k_results` nor cached. Every page is parsed as soon
+        as it is fetched, and the next one is only fetched once the previous results have been consumed.
+        The ALEPH session, and the browser page if one is needed, are held until the iteration ends.
+
+        Args:
+            query (str): The query to search.
+            max_results (int | None): The maximum number of results to yield, or None for all of them.
+
+        Example:
+            >>> async for result in AsyncNCLSearch().aiter_results("Artificial Intelligence", max_results=100):
+            ...     print(result["title"])
+        """
+        if max_results is not None and max_results < 1:
+            raise ValueError("max_results must be positive.")
+        session_pool = self.session_pool or get_ncl_session_pool()
+        session = await session_pool.acquire()
+        failed = False
+        expired = False
+        try:
+            async with contextlib.AsyncExitStack() as stack:
+                page: AsyncPage | None = None
+
+                async def fetch(url: str) -> tuple[str, str]:
+                    nonlocal page
+                    if page is None and self.engine == NCLSearchEngine.HTTP:
+                        try:
+                            return await self._ahttp_fetch_page(url, session.session_id)
+                        except (NCLCrawlerError, httpx.HTTPError) as e:
+                            logger.warning(f"Plain HTTP NCL search failed, falling back to Playwright: {e}")
+                    if page is None:
+                        browser_pool = self.browser_pool or get_browser_pool()
+                        page = await stack.enter_async_context(browser_pool.lease_page())
+                        await page.context.add_cookies(
+                            [{"name": "ALEPH_SESSION_ID", "value": session.session_id, "url": NCL_ENTRY_URL}]
+                        )
+                    return await self._afetch_results_page(page, url)
+
+                url = self._build_search_url(session.session_id, self._encode_query(query))
+                first_entry = 1
+                num_results = 0
+                while True:
+                    html, page_url = await fetch(url)
+                    document = lxml_html.fromstring(html)
+                    for result in self._parse_ncl_rows(document, page_url):
+                        yield result
+                        num_results += 1
+                        if max_results is not None and num_results >= max_results:
+                            return
+                    if num_results == 0:
+                        self._raise_for_empty_page(query, session.session_id, html)
+
+                    next_page = self._parse_next_page(document, page_url, first_entry)
+                    if next_page is None:
+                        return
+                    url, first_entry = next_page
+        except NCLCrawlerSearchNoResultsError:
+            raise
+        except NCLCrawlerSessionExpiredError:
+            expired = True
+            raise
+        except Exception:
+            failed = True
+            raise
+        finally:
+            if expired:
+                session_pool.discard(session)
+            else:
+                session_pool.release(session, failed=failed)
+
+
+class NCLSearch(AsyncNCLSearch):
+    """A synchronous search tool for the National Central Library (NCL) catalog.
+
+    A blocking facade over `AsyncNCLSearch`. Queries run on the event loop that owns the browser pool if it is
+    running in another thread (e.g. the API server), and on the process-wide background event loop otherwise, so
+    sync and async callers share the same warm browsers, sessions and caches.
+    """
 
-        for i in range(num_rows):
-            row_locator = result_rows_locator.nth(i)
-            title_link_locator = row_locator.locator("td:nth-child(3) a.brieftit")
+    def _run_coroutine[T](self, coroutine: Coroutine[Any, Any, T]) -> T:
+        loop = (self.browser_pool or get_browser_pool()).loop
+        if loop is not None and loop.is_running():
+            return run_blocking(coroutine, loop)
+        return _get_ncl_background_loop().run(coroutine)
 
-            book_title = None
-            book_link = None
+    def run(self, query: str) -> str:
+        return self._run_coroutine(self.arun(query))
 
-            if await title_link_locator.count() > 0:
-                book_title = await title_link_locator.text_content()
-                book_link = await title_link_locator.get_attribute("href")
+    def batch(self, queries: list[str], max_concurrency: int = 8) -> list[str | Exception]:
+        """Searches several queries concurrently, see `AsyncNCLSearch.abatch`."""
+        return self._run_coroutine(self.abatch(queries, max_concurrency=max_concurrency))
 
-            author_locator = row_locator.locator("td:nth-child(4)")
-            author = await author_locator.text_content()
 
-            if book_title:
-                book_title = book_title.strip()
-            if book_link:
-                if not book_link.startswith("http"):
-                    book_link = page.url.split("/F/")[0] + book_link
-                book_link = book_link.strip()
-            if author:
-                author = author.strip()
+_background_loop: BackgroundEventLoop | None = None
 
-            if book_title and book_link:
-                results.append({"title": book_title, "author": author, "link": book_link})
-                count += 1
-                if count >= self.top_k_results:
-                    break
-        return results
+
+async def _aclose_background_resources() -> None:
+    browser_pool = get_browser_pool()
+    if browser_pool.loop is asyncio.get_running_loop():
+        await browser_pool.close()
+    await aclose_async_clients()
+
+
+def _get_ncl_background_loop() -> BackgroundEventLoop:
+    global _background_loop
+    if _background_loop is None:
+        _background_loop = get_background_loop()
+        # The browsers and HTTP connections opened by sync callers are closed with the loop.
+        _background_loop.on_shutdown(_aclose_background_resources)
+    return _background_loop
+
+
+_session_pool: NCLSessionPool | None = None
+
+
+def get_ncl_session_pool() -> NCLSessionPool:
+    """Returns the process-wide ALEPH session pool, creating one with the default settings if none is set."""
+    global _session_pool
+    if _session_pool is None:
+        _session_pool = NCLSessionPool(factory=AsyncNCLSearch().anew_session_id)
+    return _session_pool
+
+
+def set_ncl_session_pool(pool: NCLSessionPool) -> None:
+    """Replaces the process-wide ALEPH session pool. The previous pool is not closed."""
+    global _session_pool
+    _session_pool = pool
+
+
+_result_cache: TTLCache | None = None
+
+
+def get_ncl_result_cache() -> TTLCache | None:
+    """Returns the process-wide NCL search result cache, or None if results are not cached."""
+    return _result_cache
+
+
+def set_ncl_result_cache(cache: TTLCache | None) -> None:
+    """Replaces the process-wide NCL search result cache. The previous cache is not closed."""
+    global _result_cache
+    _result_cache = cache
+
+
+_record_cache: TTLCache | None = None
+
+
+def get_ncl_record_cache() -> TTLCache | None:
+    """Returns the process-wide cache of parsed NCL full records, or None if records are not cached."""
+    return _record_cache
+
+
+def set_ncl_record_cache(cache: TTLCache | None) -> None:
+    """Replaces the process-wide cache of parsed NCL full records. The previous cache is not closed."""
+    global _record_cache
+    _record_cache = cache
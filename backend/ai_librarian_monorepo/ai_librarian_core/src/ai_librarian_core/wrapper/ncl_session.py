@@ -0,0 +1,185 @@
+import asyncio
+import logging
+import threading
+import time
+from collections import deque
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class NCLSession:
+    """A warm ALEPH session on the NCL catalog."""
+
+    session_id: str
+    created_at: float = field(default_factory=time.monotonic)
+    failures: int = 0
+
+    @property
+    def age(self) -> float:
+        return time.monotonic() - self.created_at
+
+
+@dataclass
+class NCLSessionPool:
+    """A pool of warm ALEPH sessions, so a query does not have to open a new session first.
+
+    Sessions are handed out exclusively and returned with `release()`. A session is only handed out while it is
+    younger than `ttl - refresh_margin` seconds, and it is dropped after `max_failures` consecutive failed queries.
+    Once `start()` is called, a background task replaces sessions before they expire and keeps `size` sessions warm.
+    While the catalog cannot be reached, the task only tries to open one session per refresh, and waits twice as long
+    after each failed refresh, up to `max_refresh_backoff` seconds.
+
+    The pool may be shared by the event loops of several threads, e.g. the API server and the background loop of
+    `NCLSearch`, its state is guarded by a lock.
+
+    Attributes:
+        factory (Callable[[], Awaitable[str]]): Opens a new ALEPH session and returns its ID.
+        size (int): The number of idle sessions kept warm (default: 4).
+        ttl (float): The lifetime of a session in seconds (default: 600).
+        refresh_margin (float): Sessions closer than this many seconds to `ttl` are not handed out (default: 60).
+        refresh_interval (float): The interval in seconds between background refreshes (default: 15).
+        max_refresh_backoff (float): The longest interval in seconds between background refreshes that failed
+            (default: 300).
+        max_failures (int): The number of consecutive failures after which a session is dropped (default: 2).
+
+    Example:
+        >>> pool = NCLSessionPool(factory=AsyncNCLSearch().anew_session_id)
+        >>> session = await pool.acquire()
+        >>> pool.release(session)
+    """
+
+    factory: Callable[[], Awaitable[str]]
+    size: int = 4
+    ttl: float = 600
+    refresh_margin: float = 60
+    refresh_interval: float = 15
+    max_refresh_backoff: float = 300
+    max_failures: int = 2
+
+    def __post_init__(self):
+        self._lock = threading.Lock()
+        self._idle: deque[NCLSession] = deque()
+        self._refresher: asyncio.Task | None = None
+        self.hits = 0
+        self.misses = 0
+        self.refreshes = 0
+        self.discards = 0
+        self._creates = 0
+        self._create_seconds = 0.0
+        # Refreshes in a row that failed to open any of the sessions they tried to.
+        self._refresh_failures = 0
+
+    def _is_usable(self, session: NCLSession) -> bool:
+        return session.failures < self.max_failures and session.age < self.ttl - self.refresh_margin
+
+    def _is_expiring(self, session: NCLSession) -> bool:
+        return session.age >= self.ttl - self.refresh_margin - self.refresh_interval
+
+    async def _create(self) -> NCLSession:
+        start = time.perf_counter()
+        session_id = await self.factory()
+        with self._lock:
+            self._creates += 1
+            self._create_seconds += time.perf_counter() - start
+        return NCLSession(session_id=session_id)
+
+    def _pop_usable(self) -> NCLSession | None:
+        with self._lock:
+            while self._idle:
+                session = self._idle.popleft()
+                if self._is_usable(session):
+                    self.hits += 1
+                    return session
+                self.discards += 1
+            self.misses += 1
+            return None
+
+    async def acquire(self) -> NCLSession:
+        """Returns a warm session, or opens a new one if no usable session is idle."""
+        session = self._pop_usable()
+        return session if session is not None else await self._create()
+
+    def release(self, session: NCLSession, failed: bool = False) -> None:
+        """Returns a session to the pool, recording whether the query that used it failed."""
+        session.failures = session.failures + 1 if failed else 0
+        with self._lock:
+            if not self._is_usable(session) or len(self._idle) >= self.size:
+                self.discards += 1
+                return
+            self._idle.append(session)
+
+    def discard(self, session: NCLSession) -> None:
+        """Drops a session that turned out to be expired or broken."""
+        with self._lock:
+            self.discards += 1
+
+    async def refresh(self) -> None:
+        """Replaces idle sessions that are about to expire and tops the pool up to `size`."""
+        with self._lock:
+            expiring = [session for session in self._idle if self._is_expiring(session)]
+            missing = self.size - len(self._idle) + len(expiring)
+            if self._refresh_failures:
+                # The catalog, or the browser fallback, failed last time, a single session tells whether it is back.
+                missing = min(missing, 1)
+        results = await asyncio.gather(*(self._create() for _ in range(missing)), return_exceptions=True)
+
+        errors = [result for result in results if isinstance(result, BaseException)]
+        if errors:
+            logger.warning(f"Failed to open {len(errors)} ALEPH session(s): {errors[0]}")
+        with self._lock:
+            for session in expiring:
+                if session in self._idle:
+                    self._idle.remove(session)
+                    self.discards += 1
+            for result in results:
+                if isinstance(result, NCLSession) and len(self._idle) < self.size:
+                    self._idle.append(result)
+                    self.refreshes += 1
+            if errors and len(errors) == len(results):
+                self._refresh_failures += 1
+            else:
+                self._refresh_failures = 0
+
+    def _refresh_delay(self) -> float:
+        with self._lock:
+            failures = self._refresh_failures
+        if not failures:
+            return self.refresh_interval
+        return min(self.refresh_interval * 2 ** min(failures, 16), self.max_refresh_backoff)
+
+    async def _refresh_forever(self) -> None:
+        while True:
+            await self.refresh()
+            await asyncio.sleep(self._refresh_delay())
+
+    def start(self) -> None:
+        """Starts the background refresh task on the running event loop."""
+        if self._refresher is None or self._refresher.done():
+            self._refresher = asyncio.create_task(self._refresh_forever())
+
+    async def close(self) -> None:
+        """Stops the background refresh task and forgets every idle session."""
+        if self._refresher is not None:
+            self._refresher.cancel()
+            try:
+                await self._refresher
+            except asyncio.CancelledError:
+                pass
+            self._refresher = None
+        with self._lock:
+            self._idle.clear()
+
+    def stats(self) -> dict[str, int | float]:
+        with self._lock:
+            return {
+                "idle": len(self._idle),
+                "hits": self.hits,
+                "misses": self.misses,
+                "refreshes": self.refreshes,
+                "discards": self.discards,
+                "refresh_failures": self._refresh_failures,
+                "avg_create_seconds": self._create_seconds / self._creates if self._creates else 0.0,
+            }
@@ -0,0 +1,47 @@
+import asyncio
+
+from ai_librarian_core.tools.cached import CachedTool, ToolCachePolicy
+from ai_librarian_core.tools.coalesced import CoalescedTool
+from langchain_core.tools import BaseTool, tool
+
+
+def make_lookup_tool(calls: list[str], released: asyncio.Event) -> BaseTool:
+    @tool
+    async def lookup(query: str) -> str:
+        """Looks up a query."""
+        calls.append(query)
+        await released.wait()
+        return query
+
+    return lookup
+
+
+async def call_concurrently(coalesced_tool: BaseTool, released: asyncio.Event, queries: list[str]) -> list[str]:
+    calls = asyncio.gather(*(coalesced_tool.ainvoke({"query": query}) for query in queries))
+    await asyncio.sleep(0.01)
+    released.set()
+    return await calls
+
+
+def test_identical_concurrent_calls_share_one_call():
+    async def main():
+        calls, released = [], asyncio.Event()
+        coalesced_tool = CoalescedTool.wrap(make_lookup_tool(calls, released))
+
+        assert await call_concurrently(coalesced_tool, released, ["Python"] * 5) == ["Python"] * 5
+        assert calls == ["Python"]
+
+    asyncio.run(main())
+
+
+def test_arguments_are_only_normalized_like_the_cache_of_the_tool():
+    async def main(policy: ToolCachePolicy | None) -> list[str]:
+        calls, released = [], asyncio.Event()
+        lookup = make_lookup_tool(calls, released)
+        coalesced_tool = CoalescedTool.wrap(lookup if policy is None else CachedTool.wrap(lookup, policy))
+        await call_concurrently(coalesced_tool, released, ["Python", " python ", "ＰＹＴＨＯＮ"])
+        return calls
+
+    assert asyncio.run(main(ToolCachePolicy())) == ["Python"]
+    assert asyncio.run(main(ToolCachePolicy(normalize_args=False))) == ["Python", " python ", "ＰＹＴＨＯＮ"]
+    assert asyncio.run(main(None)) == ["Python", " python ", "ＰＹＴＨＯＮ"]
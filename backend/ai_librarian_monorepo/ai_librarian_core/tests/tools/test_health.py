@@ -0,0 +1,172 @@
+import asyncio
+import time
+
+import pytest
+from ai_librarian_core.tools.health import (
+    CircuitBreaker,
+    CircuitBreakerTool,
+    CircuitState,
+    ToolHealth,
+    ToolUnavailableError,
+)
+from langchain_core.tools import tool
+
+
+class NoResultsError(Exception):
+    pass
+
+
+@tool
+def flaky(query: str) -> str:
+    """Answers the queries starting with "ok", fails on the other ones."""
+    if query.startswith("ok"):
+        return query
+    if query == "empty":
+        raise NoResultsError("no results")
+    raise RuntimeError("down")
+
+
+@tool
+async def sleepy(seconds: float) -> str:
+    """Answers after `seconds`."""
+    await asyncio.sleep(seconds)
+    return "done"
+
+
+def test_circuit_opens_once_the_failure_rate_is_reached():
+    breaker = CircuitBreaker(failure_rate_threshold=0.5, min_calls=4, open_seconds=60)
+    breaker.record(0.1)
+    breaker.record(0.1, error=RuntimeError("down"))
+    breaker.record(0.1)
+    assert breaker.state is CircuitState.CLOSED
+
+    breaker.record(0.1, error=RuntimeError("down"))
+    assert breaker.state is CircuitState.OPEN
+    assert breaker.allow() is None
+    assert 0 < breaker.retry_in() <= 60
+    assert breaker.stats()["short_circuited"] == 1
+    assert breaker.stats()["last_error"] == "RuntimeError: down"
+
+
+def test_circuit_stays_closed_below_min_calls():
+    breaker = CircuitBreaker(min_calls=3)
+    for _ in range(2):
+        breaker.record(0.1, error=RuntimeError("down"))
+
+    assert breaker.state is CircuitState.CLOSED
+
+
+def test_half_open_circuit_lets_a_single_trial_call_through():
+    breaker = CircuitBreaker(min_calls=1, open_seconds=0)
+    breaker.record(0.1, error=RuntimeError("down"))
+
+    assert breaker.state is CircuitState.HALF_OPEN
+    assert breaker.allow() is CircuitState.HALF_OPEN
+    assert breaker.allow() is None
+
+
+def test_successful_trial_call_closes_the_circuit():
+    breaker = CircuitBreaker(min_calls=1, open_seconds=0)
+    breaker.record(0.1, error=RuntimeError("down"))
+    breaker.allow()
+    breaker.record(0.1, is_trial=True)
+
+    assert breaker.state is CircuitState.CLOSED
+    assert breaker.stats()["window_calls"] == 0
+
+
+def test_failed_trial_call_opens_the_circuit_again():
+    breaker = CircuitBreaker(min_calls=1, open_seconds=0.05)
+    breaker.record(0.1, error=RuntimeError("down"))
+    time.sleep(0.05)
+    assert breaker.allow() is CircuitState.HALF_OPEN
+
+    breaker.record(0.1, error=RuntimeError("still down"), is_trial=True)
+    assert breaker.state is CircuitState.OPEN
+    assert breaker.stats()["last_error"] == "RuntimeError: still down"
+
+
+def test_slow_calls_count_as_failures():
+    breaker = CircuitBreaker(min_calls=3, slow_call_seconds=1)
+    breaker.record(0.5)
+    breaker.record(1.5)
+    assert breaker.state is CircuitState.CLOSED
+
+    breaker.record(2)
+    assert breaker.state is CircuitState.OPEN
+    assert breaker.stats()["total_failures"] == 2
+
+
+def test_cancelled_calls_only_count_if_slow():
+    breaker = CircuitBreaker(min_calls=1, slow_call_seconds=1)
+    breaker.record(0.5, is_cancelled=True)
+    assert breaker.stats()["total_calls"] == 0
+
+    breaker.record(1, is_cancelled=True)
+    assert breaker.state is CircuitState.OPEN
+
+
+def test_guard_refuses_the_calls_of_an_open_circuit():
+    health = ToolHealth(min_calls=1, open_seconds=60)
+    with pytest.raises(RuntimeError), health.guard("search"):
+        raise RuntimeError("down")
+
+    assert health.unavailable_tools() == {"search"}
+    with pytest.raises(ToolUnavailableError, match="search tool is temporarily unavailable"), health.guard("search"):
+        pytest.fail("The block of an open circuit must not run.")
+
+    health.reset("search")
+    assert health.unavailable_tools() == frozenset()
+
+
+def test_disabled_health_never_refuses_calls():
+    health = ToolHealth(enabled=False, min_calls=1)
+    for _ in range(3):
+        with pytest.raises(RuntimeError), health.guard("search"):
+            raise RuntimeError("down")
+
+    assert health.unavailable_tools() == frozenset()
+    assert health.stats() == {}
+
+
+def test_slow_call_limits_are_set_per_tool():
+    health = ToolHealth(slow_call_seconds=5, slow_call_limits={"google_search": 20, "ncl_search": None})
+
+    assert health.breaker("google_search").slow_call_seconds == 20
+    assert health.breaker("ncl_search").slow_call_seconds is None
+    assert health.breaker("arxiv").slow_call_seconds == 5
+
+
+def test_tool_opens_its_circuit_after_repeated_failures():
+    health = ToolHealth(min_calls=2, open_seconds=60)
+    guarded = CircuitBreakerTool.wrap(flaky, health=health)
+
+    assert guarded.invoke({"query": "ok"}) == "ok"
+    with pytest.raises(RuntimeError):
+        guarded.invoke({"query": "fail"})
+    with pytest.raises(ToolUnavailableError):
+        guarded.invoke({"query": "ok again"})
+    assert health.stats()["flaky"]["short_circuited"] == 1
+
+
+def test_ignored_errors_are_not_counted_as_failures():
+    health = ToolHealth(min_calls=2)
+    guarded = CircuitBreakerTool.wrap(flaky, health=health, ignored_errors=(NoResultsError,))
+
+    for _ in range(3):
+        with pytest.raises(NoResultsError):
+            guarded.invoke({"query": "empty"})
+
+    stats = health.stats()["flaky"]
+    assert stats["state"] is CircuitState.CLOSED
+    assert stats["total_calls"] == 3
+    assert stats["total_failures"] == 0
+
+
+def test_slow_tool_calls_open_the_circuit():
+    health = ToolHealth(min_calls=1, slow_call_limits={"sleepy": 0.01})
+    guarded = CircuitBreakerTool.wrap(sleepy, health=health)
+
+    assert asyncio.run(guarded.ainvoke({"seconds": 0.05})) == "done"
+    assert health.unavailable_tools() == {"sleepy"}
+    assert health.stats()["sleepy"]["window_max_seconds"] >= 0.05
@@ -0,0 +1,138 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from ai_librarian_core.tools.scheduler import ScheduledTool, ToolScheduler
+from langchain_core.tools import BaseTool
+
+
+class BlockingLookupTool(BaseTool):
+    """A sync-only tool, like most of the langchain_community tools, which reports the thread it ran on."""
+
+    name: str = "blocking_lookup"
+    description: str = "Looks up a query."
+
+    def _run(self, query: str) -> str:
+        return threading.current_thread().name
+
+
+def test_async_calls_beyond_the_limit_of_the_tool_wait_for_a_slot():
+    async def main():
+        scheduler = ToolScheduler(default_max_concurrency=5, max_concurrency={"ncl_search": 2})
+        released = asyncio.Event()
+        running = peak = 0
+
+        async def call():
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await released.wait()
+            running -= 1
+
+        calls = [asyncio.ensure_future(scheduler.arun("ncl_search", call)) for _ in range(5)]
+        await asyncio.sleep(0.01)
+        stats = scheduler.stats()["ncl_search"]
+        assert (stats["running"], stats["waiting"]) == (2, 3)
+
+        released.set()
+        await asyncio.gather(*calls)
+        assert peak == 2
+        stats = scheduler.stats()["ncl_search"]
+        assert (stats["running"], stats["waiting"], stats["calls"]) == (0, 0, 5)
+
+    asyncio.run(main())
+
+
+def test_each_tool_has_its_own_limit():
+    async def main():
+        scheduler = ToolScheduler(default_max_concurrency=3, max_concurrency={"ncl_search": 1})
+        released = asyncio.Event()
+
+        async def call():
+            await released.wait()
+
+        calls = [asyncio.ensure_future(scheduler.arun(name, call)) for name in ("ncl_search", "arxiv") * 3]
+        await asyncio.sleep(0.01)
+        stats = scheduler.stats()
+        assert stats["ncl_search"]["running"] == 1
+        assert stats["arxiv"]["running"] == 3
+
+        released.set()
+        await asyncio.gather(*calls)
+
+    asyncio.run(main())
+    assert ToolScheduler(max_concurrency={"ncl_search": 4}).limit("arxiv") == 8
+
+
+def test_wait_metrics_are_recorded():
+    async def main():
+        scheduler = ToolScheduler(max_concurrency={"ncl_search": 1})
+
+        async def call():
+            await asyncio.sleep(0.05)
+
+        await asyncio.gather(scheduler.arun("ncl_search", call), scheduler.arun("ncl_search", call))
+        stats = scheduler.stats()["ncl_search"]
+        assert stats["calls"] == 2
+        assert stats["max_wait_seconds"] >= 0.04
+        assert 0 < stats["avg_wait_seconds"] < stats["max_wait_seconds"]
+
+    asyncio.run(main())
+
+
+def test_cancelled_waiting_call_leaves_the_queue():
+    async def main():
+        scheduler = ToolScheduler(max_concurrency={"ncl_search": 1})
+        released = asyncio.Event()
+
+        async def call():
+            await released.wait()
+
+        running = asyncio.ensure_future(scheduler.arun("ncl_search", call))
+        waiting = asyncio.ensure_future(scheduler.arun("ncl_search", call))
+        await asyncio.sleep(0.01)
+        waiting.cancel()
+        await asyncio.gather(waiting, return_exceptions=True)
+        assert scheduler.stats()["ncl_search"]["waiting"] == 0
+
+        released.set()
+        await running
+        assert scheduler.stats()["ncl_search"]["calls"] == 1
+
+    asyncio.run(main())
+
+
+def test_sync_calls_are_bounded_across_threads():
+    scheduler = ToolScheduler(max_concurrency={"ncl_search": 2})
+    lock = threading.Lock()
+    running = peak = 0
+
+    def call():
+        nonlocal running, peak
+        with lock:
+            running += 1
+            peak = max(peak, running)
+        time.sleep(0.02)
+        with lock:
+            running -= 1
+
+    with ThreadPoolExecutor(max_workers=6) as executor:
+        for future in [executor.submit(scheduler.run, "ncl_search", call) for _ in range(6)]:
+            future.result(timeout=5)
+
+    assert peak == 2
+    assert scheduler.stats()["ncl_search"]["calls"] == 6
+    assert scheduler.stats()["ncl_search"]["max_wait_seconds"] > 0
+
+
+def test_sync_only_tools_run_on_a_thread_pool_of_their_own():
+    scheduler = ToolScheduler()
+    scheduled = ScheduledTool.wrap(BlockingLookupTool(), scheduler=scheduler)
+    try:
+        thread_name = asyncio.run(scheduled.ainvoke("python"))
+    finally:
+        scheduler.shutdown()
+
+    assert thread_name.startswith("tool-blocking_lookup")
+    assert scheduler.stats()["blocking_lookup"]["calls"] == 1
@@ -0,0 +1,263 @@
+import asyncio
+import time
+from dataclasses import dataclass
+from typing import Any
+
+import pytest
+from ai_librarian_core.utils.cache import CachedError, CacheEntry, TTLCache
+
+
+class NotFoundError(Exception):
+    pass
+
+
+@dataclass
+class Fetch:
+    """A fetch function answering with `values` in turn, the last one repeatedly. Exceptions are raised."""
+
+    values: list[Any]
+    calls: int = 0
+
+    def __call__(self):
+        value = self.values[min(self.calls, len(self.values) - 1)]
+        self.calls += 1
+        if isinstance(value, Exception):
+            raise value
+        return value
+
+
+def aged(entry: CacheEntry, seconds: float) -> CacheEntry:
+    entry.stored_at = time.time() - seconds
+    return entry
+
+
+def test_fresh_entry_is_served_without_fetching():
+    cache = TTLCache(ttl=60)
+    fetch = Fetch(["first", "second"])
+
+    assert cache.get_or_fetch("key", fetch) == "first"
+    assert cache.get_or_fetch("key", fetch) == "first"
+    assert fetch.calls == 1
+    assert cache.stats() == {
+        "entries": 1,
+        "hits": 1,
+        "stale_hits": 0,
+        "revalidations": 0,
+        "misses": 1,
+        "evictions": 0,
+        "hit_rate": 0.5,
+    }
+
+
+def test_stale_entry_is_refreshed_inline_without_an_event_loop():
+    cache = TTLCache(ttl=60, stale_ttl=60)
+    cache.set("key", aged(CacheEntry(value="old"), 61))
+    fetch = Fetch(["new"])
+
+    assert cache.get_or_fetch("key", fetch) == "new"
+    assert cache.get_or_fetch("key", fetch) == "new"
+    assert fetch.calls == 1
+
+
+def test_stale_entry_is_served_when_the_inline_refresh_fails():
+    cache = TTLCache(ttl=60, stale_ttl=60)
+    cache.set("key", aged(CacheEntry(value="old"), 61))
+
+    assert cache.get_or_fetch("key", Fetch([RuntimeError("down")])) == "old"
+    assert cache.stats()["stale_hits"] == 1
+
+
+def test_entry_past_the_stale_ttl_is_dropped():
+    cache = TTLCache(ttl=60, stale_ttl=60)
+    cache.set("key", aged(CacheEntry(value="old"), 121))
+
+    assert cache.get("key") is None
+    assert cache.stats()["entries"] == 0
+    with pytest.raises(RuntimeError):
+        cache.get_or_fetch("key", Fetch([RuntimeError("down")]))
+
+
+def test_failures_of_the_error_types_are_cached_for_the_negative_ttl():
+    cache = TTLCache(ttl=60, negative_ttl=10)
+    fetch = Fetch([NotFoundError("no such book"), "found"])
+
+    for _ in range(2):
+        with pytest.raises(NotFoundError, match="no such book"):
+            cache.get_or_fetch("key", fetch, error_types=(NotFoundError,))
+    assert fetch.calls == 1
+
+    entry = cache.get("key")
+    assert entry is not None
+    aged(entry, 11)
+    assert cache.get_or_fetch("key", fetch, error_types=(NotFoundError,)) == "found"
+    assert fetch.calls == 2
+
+
+def test_other_failures_are_not_cached():
+    cache = TTLCache()
+
+    with pytest.raises(RuntimeError):
+        cache.get_or_fetch("key", Fetch([RuntimeError("down")]), error_types=(NotFoundError,))
+    assert cache.get("key") is None
+
+
+def test_cached_failure_of_an_unknown_type_raises_cached_error():
+    with pytest.raises(CachedError, match="gone"):
+        CacheEntry(error="gone", error_type="GoneError").unwrap((NotFoundError,))
+
+
+def test_stale_entry_is_served_while_a_single_task_revalidates_it():
+    async def main():
+        cache = TTLCache(ttl=60)
+        cache.set("key", aged(CacheEntry(value="old"), 61))
+        released = asyncio.Event()
+        calls = 0
+
+        async def fetch():
+            nonlocal calls
+            calls += 1
+            await released.wait()
+            return "new"
+
+        results = await asyncio.gather(*(cache.aget_or_fetch("key", fetch) for _ in range(5)))
+        assert results == ["old"] * 5
+        (revalidation,) = cache._revalidations.values()
+        released.set()
+        await revalidation
+
+        assert calls == 1
+        assert await cache.aget_or_fetch("key", fetch) == "new"
+        assert cache.stats()["stale_hits"] == 5
+        assert cache.stats()["revalidations"] == 1
+
+    asyncio.run(main())
+
+
+def test_failed_revalidation_keeps_the_stale_entry():
+    async def main():
+        cache = TTLCache(ttl=60)
+        cache.set("key", aged(CacheEntry(value="old"), 61))
+
+        async def fetch():
+            raise RuntimeError("down")
+
+        assert await cache.aget_or_fetch("key", fetch) == "old"
+        await asyncio.gather(*cache._revalidations.values())
+        entry = cache.get("key")
+        assert entry is not None
+        assert entry.value == "old"
+        assert not cache.is_fresh(entry)
+
+    asyncio.run(main())
+
+
+def test_entries_persist_across_instances_sharing_a_sqlite_file(tmp_path):
+    path = tmp_path / "cache" / "tools.sqlite3"
+    first = TTLCache(path=path, namespace="books")
+    first.get_or_fetch("python", Fetch([{"titles": ["Fluent Python"]}]))
+    with pytest.raises(NotFoundError):
+        first.get_or_fetch("cobol", Fetch([NotFoundError("no such book")]), error_types=(NotFoundError,))
+    first.close()
+
+    second = TTLCache(path=path, namespace="books")
+    other = TTLCache(path=path, namespace="videos")
+    try:
+        assert second.get_or_fetch("python", Fetch([RuntimeError("not cached")])) == {"titles": ["Fluent Python"]}
+        with pytest.raises(NotFoundError):
+            second.get_or_fetch("cobol", Fetch(["found"]), error_types=(NotFoundError,))
+        assert other.get("python") is None
+    finally:
+        second.close()
+        other.close()
+
+
+def test_async_lookups_read_and_write_the_sqlite_file(tmp_path):
+    path = tmp_path / "tools.sqlite3"
+
+    async def main():
+        cache = TTLCache(path=path)
+        fetch = Fetch(["value"])
+
+        async def afetch():
+            return fetch()
+
+        try:
+            assert await cache.aget_or_fetch("key", afetch) == "value"
+            assert await cache.aget_or_fetch("key", afetch) == "value"
+        finally:
+            cache.close()
+        assert fetch.calls == 1
+
+    asyncio.run(main())
+    cache = TTLCache(path=path)
+    try:
+        assert cache.get_or_fetch("key", Fetch([RuntimeError("not cached")])) == "value"
+    finally:
+        cache.close()
+
+
+def test_expired_entries_are_pruned_from_the_sqlite_file(tmp_path):
+    path = tmp_path / "tools.sqlite3"
+    first = TTLCache(ttl=60, stale_ttl=60, path=path)
+    first.set("key", aged(CacheEntry(value="old"), 121))
+    first.close()
+
+    second = TTLCache(ttl=60, stale_ttl=60, path=path)
+    try:
+        assert second.get("key") is None
+    finally:
+        second.close()
+
+
+def test_clear_empties_both_tiers(tmp_path):
+    cache = TTLCache(path=tmp_path / "tools.sqlite3")
+    try:
+        cache.set("key", CacheEntry(value="value"))
+        cache.clear()
+        assert cache.get("key") is None
+    finally:
+        cache.close()
+
+
+def test_least_recently_used_entry_is_evicted():
+    cache = TTLCache(max_entries=2)
+    cache.set("a", CacheEntry(value=1))
+    cache.set("b", CacheEntry(value=2))
+    cache.get("a")
+    cache.set("c", CacheEntry(value=3))
+
+    assert cache.get("b") is None
+    assert [entry.value for entry in map(cache.get, ("a", "c")) if entry is not None] == [1, 3]
+    assert cache.stats()["entries"] == 2
+    assert cache.stats()["evictions"] == 1
+
+
+def test_evicted_entry_is_read_back_from_the_sqlite_file(tmp_path):
+    cache = TTLCache(max_entries=1, path=tmp_path / "tools.sqlite3")
+    try:
+        cache.set("a", CacheEntry(value=1))
+        cache.set("b", CacheEntry(value=2))
+        assert cache.stats()["evictions"] == 1
+        entry = cache.get("a")
+        assert entry is not None
+        assert entry.value == 1
+    finally:
+        cache.close()
+
+
+def test_stale_entry_is_revalidated_with_the_background_fetch():
+    async def main():
+        cache = TTLCache(ttl=60)
+        cache.set("key", aged(CacheEntry(value="old"), 61))
+
+        async def fetch():
+            raise AssertionError("The caller's fetch must not outlive the call.")
+
+        async def background_fetch():
+            return "new"
+
+        assert await cache.aget_or_fetch("key", fetch, background_fetch=background_fetch) == "old"
+        await asyncio.gather(*cache._revalidations.values())
+        assert await cache.aget_or_fetch("key", fetch) == "new"
+
+    asyncio.run(main())
@@ -0,0 +1,155 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from ai_librarian_core.utils.single_flight import SingleFlight
+
+
+def test_concurrent_async_calls_share_a_single_call():
+    async def main():
+        flights = SingleFlight()
+        released = asyncio.Event()
+        calls = 0
+
+        async def fetch():
+            nonlocal calls
+            calls += 1
+            await released.wait()
+            return calls
+
+        callers = [asyncio.ensure_future(flights.ado("key", fetch)) for _ in range(5)]
+        await asyncio.sleep(0)
+        assert flights.stats() == {"in_flight": 1, "calls": 1, "coalesced": 4}
+        released.set()
+
+        assert await asyncio.gather(*callers) == [1] * 5
+        assert flights.stats()["in_flight"] == 0
+        assert await flights.ado("key", fetch) == 2
+
+    asyncio.run(main())
+
+
+def test_async_calls_with_different_keys_are_not_coalesced():
+    async def main():
+        flights = SingleFlight()
+
+        async def fetch(value):
+            await asyncio.sleep(0)
+            return value
+
+        results = await asyncio.gather(flights.ado("a", lambda: fetch("a")), flights.ado("b", lambda: fetch("b")))
+        assert results == ["a", "b"]
+        assert flights.stats()["coalesced"] == 0
+
+    asyncio.run(main())
+
+
+def test_callers_share_the_exception_of_the_call():
+    async def main():
+        flights = SingleFlight()
+
+        async def fetch():
+            await asyncio.sleep(0)
+            raise RuntimeError("down")
+
+        results = await asyncio.gather(*(flights.ado("key", fetch) for _ in range(3)), return_exceptions=True)
+        assert [type(result) for result in results] == [RuntimeError] * 3
+        assert flights.stats()["calls"] == 1
+
+    asyncio.run(main())
+
+
+def test_cancelled_caller_does_not_cancel_the_shared_call():
+    async def main():
+        flights = SingleFlight()
+        released = asyncio.Event()
+
+        async def fetch():
+            await released.wait()
+            return "value"
+
+        first = asyncio.ensure_future(flights.ado("key", fetch))
+        second = asyncio.ensure_future(flights.ado("key", fetch))
+        await asyncio.sleep(0)
+        first.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await first
+
+        released.set()
+        assert await second == "value"
+
+    asyncio.run(main())
+
+
+def test_call_keeps_running_when_every_caller_is_cancelled():
+    async def main():
+        flights = SingleFlight()
+        released = asyncio.Event()
+        finished = asyncio.Event()
+
+        async def fetch():
+            await released.wait()
+            finished.set()
+
+        caller = asyncio.ensure_future(flights.ado("key", fetch))
+        await asyncio.sleep(0)
+        caller.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await caller
+
+        released.set()
+        await asyncio.wait_for(finished.wait(), timeout=1)
+
+    asyncio.run(main())
+
+
+def test_concurrent_sync_calls_share_a_single_call():
+    flights = SingleFlight()
+    started = threading.Event()
+    released = threading.Event()
+    calls = 0
+
+    def fetch():
+        nonlocal calls
+        calls += 1
+        started.set()
+        released.wait(timeout=5)
+        return "value"
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        leader = executor.submit(flights.do, "key", fetch)
+        started.wait(timeout=5)
+        followers = [executor.submit(flights.do, "key", fetch) for _ in range(3)]
+        while flights.stats()["coalesced"] < 3:
+            time.sleep(0.001)
+        released.set()
+
+        assert [future.result(timeout=5) for future in [leader, *followers]] == ["value"] * 4
+    assert calls == 1
+    assert flights.stats() == {"in_flight": 0, "calls": 1, "coalesced": 3}
+
+
+def test_sync_callers_share_the_exception_of_the_call():
+    flights = SingleFlight()
+    started = threading.Event()
+    released = threading.Event()
+
+    def fetch():
+        started.set()
+        released.wait(timeout=5)
+        raise RuntimeError("down")
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        leader = executor.submit(flights.do, "key", fetch)
+        started.wait(timeout=5)
+        follower = executor.submit(flights.do, "key", fetch)
+        while flights.stats()["coalesced"] < 1:
+            time.sleep(0.001)
+        released.set()
+
+        for future in (leader, follower):
+            with pytest.raises(RuntimeError, match="down"):
+                future.result(timeout=5)
+    assert flights.do("key", lambda: "value") == "value"
@@ -0,0 +1,270 @@
+import asyncio
+import time
+import urllib.parse
+from pathlib import Path
+
+import pytest
+from ai_librarian_core.utils.cache import CacheEntry, TTLCache
+from ai_librarian_core.wrapper.ncl_search import AsyncNCLSearch, NCLSearchEngine
+from ai_librarian_core.wrapper.ncl_session import NCLSessionPool
+from lxml import html as lxml_html
+
+FIXTURES_PATH = Path(__file__).resolve().parents[2] / "benchmarks" / "fixtures"
+FIXTURE_SESSION_ID = "KJ8V6X5N1R5U8QXGE3PNE1RS7TNNXBAR9DSTV3G6HRM8D4AI3A-00981"
+RESULTS_URL = f"https://aleweb.ncl.edu.tw/F/{FIXTURE_SESSION_ID}?func=find-b&request=AI"
+
+
+def read_fixture(name: str) -> str:
+    return (FIXTURES_PATH / name).read_text(encoding="utf-8")
+
+
+def record_page(session_id: str) -> str:
+    return read_fixture("ncl_full_record.html").replace(FIXTURE_SESSION_ID, session_id)
+
+
+EXPIRED_SESSION_PAGE = read_fixture("ncl_entry.html").replace(FIXTURE_SESSION_ID, "NEWSESSION-00001")
+RECORD = {
+    "isbn": "9789865029326, 9789865029333",
+    "edition": "四版",
+    "publisher": "碁峰資訊股份有限公司",
+    "year": "2023",
+    "pages": "1136面",
+    "call_number": "312.831 8745 2023",
+    "subjects": "人工智慧, 機器學習",
+}
+ERROR_PAGE = f'<html><body><a href="/F/{FIXTURE_SESSION_ID}?func=find-b-0">Search</a> Error</body></html>'
+
+
+def test_brief_result_rows_are_parsed():
+    results = AsyncNCLSearch(top_k_results=20)._parse_ncl_results(read_fixture("ncl_brief_results.html"), RESULTS_URL)
+
+    assert len(results) == 20
+    assert results[0] == {
+        "title": "人工智慧：現代方法",
+        "author": "Russell, Stuart J.",
+        "link": f"https://aleweb.ncl.edu.tw/F/{FIXTURE_SESSION_ID}"
+        "?func=full-set-set&set_number=012345&set_entry=000001&format=999",
+        "holdings_link": f"https://aleweb.ncl.edu.tw/F/{FIXTURE_SESSION_ID}"
+        "?func=item-global&doc_library=TOP01&doc_number=001000001&year=&volume=&sub_library=",
+    }
+    set_entries = [urllib.parse.parse_qs(urllib.parse.urlsplit(r["link"]).query)["set_entry"][0] for r in results]
+    assert set_entries == [f"{entry:06}" for entry in range(1, 21)]
+
+
+def test_brief_results_are_capped_at_top_k_results():
+    html = read_fixture("ncl_brief_results.html")
+
+    results = AsyncNCLSearch(top_k_results=5)._parse_ncl_results(html, RESULTS_URL)
+
+    assert results == AsyncNCLSearch(top_k_results=20)._parse_ncl_results(html, RESULTS_URL)[:5]
+
+
+def test_brief_result_rows_without_a_title_link_are_skipped():
+    html = """
+        <table>
+        <tr valign="baseline"><td>1</td><td></td><td>Untitled</td><td>Nobody</td></tr>
+        <tr valign="baseline">
+          <td>2</td><td></td>
+          <td><a class="text brieftit" href="?func=full-set-set&amp;set_entry=000002"> Title </a></td>
+          <td> Author </td>
+        </tr>
+        </table>
+    """
+
+    results = AsyncNCLSearch()._parse_ncl_results(html, "https://aleweb.ncl.edu.tw/F/SESSION-00001?func=find-b")
+
+    assert results == [
+        {
+            "title": "Title",
+            "author": "Author",
+            "link": "https://aleweb.ncl.edu.tw/F/SESSION-00001?func=full-set-set&set_entry=000002",
+        }
+    ]
+
+
+def test_page_without_result_rows_has_no_results():
+    assert AsyncNCLSearch()._parse_ncl_results(read_fixture("ncl_entry.html"), RESULTS_URL) == []
+
+
+def test_next_page_follows_the_current_one():
+    document = lxml_html.fromstring(read_fixture("ncl_brief_results.html"))
+
+    assert AsyncNCLSearch()._parse_next_page(document, RESULTS_URL, 1) == (
+        f"https://aleweb.ncl.edu.tw/F/{FIXTURE_SESSION_ID}?func=short-jump&jump=000021",
+        21,
+    )
+    assert AsyncNCLSearch()._parse_next_page(document, RESULTS_URL, 21) is None
+
+
+def test_next_page_is_the_closest_jump_after_the_current_page():
+    document = lxml_html.fromstring(
+        """
+        <a href="?func=short-jump&amp;jump=000001">Previous</a>
+        <a href="?func=short-jump&amp;jump=000061">Last</a>
+        <a href="?func=short-jump&amp;jump=000041">Next</a>
+        <a href="?func=short-jump&amp;jump=">Broken</a>
+        """
+    )
+
+    assert AsyncNCLSearch()._parse_next_page(document, "https://aleweb.ncl.edu.tw/F/SESSION-00001", 21) == (
+        "https://aleweb.ncl.edu.tw/F/SESSION-00001?func=short-jump&jump=000041",
+        41,
+    )
+
+
+def make_paging_search(pages: list[str], fetched: list[str]) -> AsyncNCLSearch:
+    """Returns a search whose result pages are answered by `pages` in turn, recording the fetched URLs."""
+
+    class StubNCLSearch(AsyncNCLSearch):
+        async def _ahttp_fetch_page(self, url: str, session_id: str) -> tuple[str, str]:
+            fetched.append(url)
+            return pages[len(fetched) - 1], url
+
+    async def fixture_session_id() -> str:
+        return FIXTURE_SESSION_ID
+
+    return StubNCLSearch(engine=NCLSearchEngine.HTTP, session_pool=NCLSessionPool(factory=fixture_session_id))
+
+
+def test_results_are_iterated_across_the_result_pages():
+    first_page = read_fixture("ncl_brief_results.html")
+    last_page = first_page.replace("func=short-jump", "func=history")
+    fetched = []
+    search = make_paging_search([first_page, last_page], fetched)
+
+    async def main():
+        return [result async for result in search.aiter_results("人工智慧")]
+
+    results = asyncio.run(main())
+    assert len(results) == 40
+    assert fetched[1] == f"https://aleweb.ncl.edu.tw/F/{FIXTURE_SESSION_ID}?func=short-jump&jump=000021"
+    assert search.session_pool is not None
+    assert search.session_pool.stats()["idle"] == 1
+
+
+def test_results_iteration_stops_at_max_results():
+    first_page = read_fixture("ncl_brief_results.html")
+    fetched = []
+    search = make_paging_search([first_page, first_page, first_page], fetched)
+
+    async def main():
+        return [result async for result in search.aiter_results("人工智慧", max_results=25)]
+
+    assert len(asyncio.run(main())) == 25
+    assert len(fetched) == 2
+
+
+def test_full_record_fields_are_parsed():
+    assert AsyncNCLSearch()._parse_ncl_record(read_fixture("ncl_full_record.html")) == RECORD
+
+
+def test_record_falls_back_to_the_older_marc_fields():
+    html = """
+        <table>
+        <tr><td>008</td><td>990101s1998----ch</td></tr>
+        <tr><td>260</td><td>|a 臺北市 : |b 天下文化, |c 民88[1999]</td></tr>
+        <tr><td>050</td><td>|a QA76.9 |b .A43</td></tr>
+        </table>
+    """
+
+    assert AsyncNCLSearch()._parse_ncl_record(html) == {
+        "publisher": "天下文化",
+        "year": "1999",
+        "call_number": "QA76.9 .A43",
+    }
+    assert AsyncNCLSearch()._parse_ncl_record(html.replace("|c 民88[1999]", "")) == {
+        "publisher": "天下文化",
+        "year": "1998",
+        "call_number": "QA76.9 .A43",
+    }
+
+
+def test_page_without_marc_fields_has_an_empty_record():
+    assert AsyncNCLSearch()._parse_ncl_record(read_fixture("ncl_entry.html")) == {}
+
+
+def test_record_url_asks_for_the_marc_view():
+    search = AsyncNCLSearch()
+
+    record_link = "https://aleweb.ncl.edu.tw/F/S-1?func=full-set-set&set_entry=000001&format=999"
+    assert search._build_record_url(record_link) == record_link.replace("format=999", "format=001")
+    record_key = "https://aleweb.ncl.edu.tw/F?func=direct&doc_number=001000001&local_base=TOP01"
+    assert search._build_session_record_url(record_key, "S-2") == (
+        "https://aleweb.ncl.edu.tw/F/S-2?func=direct&doc_number=001000001&local_base=TOP01&format=001"
+    )
+
+
+@pytest.fixture
+def results() -> list[dict[str, str]]:
+    return AsyncNCLSearch()._parse_ncl_results(read_fixture("ncl_brief_results.html"), RESULTS_URL)
+
+
+def make_search(pages: dict[str, str], fetched: list[tuple[str, str]], **kwargs) -> AsyncNCLSearch:
+    """Returns a search whose record pages are answered by `pages`, keyed by session ID, recording the fetches."""
+
+    class StubNCLSearch(AsyncNCLSearch):
+        async def _afetch_record_page(self, url: str, session_id: str) -> str:
+            fetched.append((url, session_id))
+            return pages[session_id]
+
+    return StubNCLSearch(engine=NCLSearchEngine.HTTP, enrich_top_k=1, **kwargs)
+
+
+async def new_session_id() -> str:
+    return "NEWSESSION-00001"
+
+
+@pytest.mark.parametrize("page", [EXPIRED_SESSION_PAGE, ERROR_PAGE], ids=["expired_session", "error_page"])
+def test_page_without_a_record_is_not_cached(results, page):
+    record_cache = TTLCache()
+    search = make_search({FIXTURE_SESSION_ID: page}, [], record_cache=record_cache)
+    session_pool = NCLSessionPool(factory=new_session_id)
+
+    enriched = asyncio.run(search._aenrich_results(results, FIXTURE_SESSION_ID, session_pool))
+
+    assert enriched == results
+    cache_key = search._record_cache_key(results[0])
+    assert cache_key is not None
+    assert record_cache.get(cache_key) is None
+
+
+def test_record_is_enriched_and_cached(results):
+    record_cache = TTLCache()
+    fetched = []
+    search = make_search({FIXTURE_SESSION_ID: record_page(FIXTURE_SESSION_ID)}, fetched, record_cache=record_cache)
+    session_pool = NCLSessionPool(factory=new_session_id)
+
+    for _ in range(2):
+        enriched = asyncio.run(search._aenrich_results(results, FIXTURE_SESSION_ID, session_pool))
+        assert enriched == [{**results[0], **RECORD}, *results[1:]]
+    assert len(fetched) == 1
+    assert fetched[0][0].endswith("format=001")
+
+
+def test_stale_record_is_refreshed_with_a_session_of_its_own(results):
+    record_cache = TTLCache(ttl=60)
+    fetched = []
+    pages = {FIXTURE_SESSION_ID: EXPIRED_SESSION_PAGE, "NEWSESSION-00001": record_page("NEWSESSION-00001")}
+    search = make_search(pages, fetched, record_cache=record_cache)
+    session_pool = NCLSessionPool(factory=new_session_id)
+    cache_key = search._record_cache_key(results[0])
+    assert cache_key is not None
+    record_cache.set(cache_key, CacheEntry(value={"isbn": "9789865029326"}, stored_at=time.time() - 61))
+
+    async def main():
+        enriched = await search._aenrich_results(results, FIXTURE_SESSION_ID, session_pool)
+        assert enriched[0] == {**results[0], "isbn": "9789865029326"}
+        await asyncio.gather(*record_cache._revalidations.values())
+
+    asyncio.run(main())
+    assert fetched == [
+        (
+            "https://aleweb.ncl.edu.tw/F/NEWSESSION-00001?func=direct&doc_number=001000001&local_base=TOP01&format=001",
+            "NEWSESSION-00001",
+        )
+    ]
+    entry = record_cache.get(cache_key)
+    assert entry is not None
+    assert record_cache.is_fresh(entry)
+    assert entry.value == RECORD
+    assert session_pool.stats()["idle"] == 1